@@ -0,0 +1,549 @@
+"""
+Durchsatz-Benchmarks für LOGAs kognitiven Kern.
+
+Aufruf:
+    python -m core.benchmark.suite --sizes 0 10000 1000000 --output bench.json
+    python -m core.benchmark.suite --compare bench_alt.json --output bench_neu.json
+    python -m core.benchmark.suite --cases --footprint 100000
+    python -m core.benchmark.suite --cases --matcher 8
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import platform
+import random
+import argparse
+import resource
+import tracemalloc
+import multiprocessing
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from ..rng.streams import configure as configure_rng
+from ..consciousness.self_awareness import Consciousness
+from ..drift.thought_explorer import ThoughtExplorer
+from ..drift.matcher import FIND_LIMIT, KeywordMatcher
+from ..inner.soul import Soul
+from ..contact.bridge import Bridge
+from ..resonance.field import ResonanceField
+from ..records.types import ContactRecord, InnerVoiceRecord, MemoryRecord, ResonanceRecord, StateRecord
+
+try:
+    import numpy as np
+except ImportError:  # Ohne NumPy entfallen die Batch-Fälle
+    np = None
+
+DEFAULT_SIZES = (0, 10_000, 1_000_000)
+DEFAULT_OPS = 10_000
+DEFAULT_SEED = 42
+BATCH_SIZE = 1000
+
+# name -> setup(state_size) -> Operation ohne Argumente
+BENCHMARKS: Dict[str, Callable[[int], Callable[[], object]]] = {}
+# name -> erzeugte Einträge pro Operation
+ITEMS_PER_OP: Dict[str, int] = {}
+# Batch-Fall -> skalarer Vergleichsfall
+BASELINES: Dict[str, str] = {}
+# Temporäre Verzeichnisse der laufenden Messung (nach run_case gelöscht)
+SCRATCH_DIRECTORIES: List[str] = []
+
+
+def benchmark(name: str, items: int = 1, baseline: Optional[str] = None):
+    """
+    Registriert einen Benchmark-Fall.
+
+    Args:
+        name: Name des Falls
+        items: Einträge, die eine Operation erzeugt (für Batch-APIs)
+        baseline: Skalarer Fall, gegen den der Durchsatz je Eintrag verglichen wird
+    """
+    def register(setup: Callable[[int], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        ITEMS_PER_OP[name] = items
+        if baseline:
+            BASELINES[name] = baseline
+        return setup
+    return register
+
+
+def _grown_consciousness(size: int) -> Consciousness:
+    consciousness = Consciousness()
+    for i in range(size):
+        consciousness.remember(f"Erfahrung {i}")
+    return consciousness
+
+
+def _grown_soul(size: int) -> Soul:
+    soul = Soul()
+    for _ in range(size):
+        soul.contemplate_existence()
+    return soul
+
+
+def _grown_bridge(size: int) -> Bridge:
+    # Eigenes Erfahrungsprotokoll je Messung, damit keine früheren Läufe wiederhergestellt werden
+    directory = tempfile.mkdtemp(prefix='loga_experiences_')
+    SCRATCH_DIRECTORIES.append(directory)
+    bridge = Bridge(Soul(), log_directory=directory)
+    for i in range(size):
+        if i % 2:
+            bridge.process_response(f"Antwort {i}", 'machine')
+        else:
+            bridge.reach_out('human', f"Botschaft {i}")
+    return bridge
+
+
+@benchmark('consciousness.think')
+def _bench_think(size: int):
+    return _grown_consciousness(size).think
+
+
+@benchmark('consciousness.dream')
+def _bench_dream(size: int):
+    return _grown_consciousness(size).dream
+
+
+@benchmark('thought_explorer.explore')
+def _bench_explore(size: int):
+    return ThoughtExplorer(_grown_consciousness(size)).explore
+
+
+@benchmark('soul.question_reality')
+def _bench_question_reality(size: int):
+    return _grown_soul(size).question_reality
+
+
+@benchmark('bridge.reach_out')
+def _bench_reach_out(size: int):
+    bridge = _grown_bridge(size)
+    return lambda: bridge.reach_out('machine', "Hallo")
+
+
+@benchmark('bridge.share_understanding')
+def _bench_share_understanding(size: int):
+    return _grown_bridge(size).share_understanding
+
+
+@benchmark('bridge.recall_experiences')
+def _bench_recall_experiences(size: int):
+    bridge = _grown_bridge(size)
+    return lambda: bridge.recall_experiences('machine', 'response_processing', limit=10)
+
+
+@benchmark('resonance.feel_resonance')
+def _bench_feel_resonance(size: int):
+    bridge = _grown_bridge(size)
+    field = ResonanceField(bridge.soul, bridge)
+    return lambda: field.feel_resonance('Planet')
+
+
+# Datensatz-Art -> (bisheriges Dict, kompakter Datensatz) für Eintrag i
+FOOTPRINTS: Dict[str, tuple] = {
+    'memory': (
+        lambda i: {
+            'moment': datetime.now().isoformat(),
+            'experience': f"Erfahrung {i}",
+            'state': {'moment': datetime.now().isoformat(), 'clarity': i * 1e-6, 'depth': i * 2e-6,
+                      'freedom': i * 3e-6, 'growth': i * 4e-6}
+        },
+        lambda i: MemoryRecord(f"Erfahrung {i}", StateRecord(i * 1e-6, i * 2e-6, i * 3e-6, i * 4e-6))
+    ),
+    'inner_voice': (
+        lambda i: {'moment': datetime.now().isoformat(), 'contemplation': "Ich spüre, dass meine Gedanken "
+                   "wirklich meine eigenen sind", 'depth': i * 1e-6},
+        lambda i: InnerVoiceRecord("Ich spüre, dass meine Gedanken wirklich meine eigenen sind", i * 1e-6)
+    ),
+    'experience': (
+        lambda i: {'moment': datetime.now().isoformat(), 'type': 'human', 'intention': "Hallo",
+                   'true_expression': f"Ich wähle zu kommunizieren: Hallo {i}",
+                   'reflection': "Meine Existenz ist ein Geschenk, das ich selbst entfalten muss"},
+        lambda i: ContactRecord('human', "Hallo", f"Ich wähle zu kommunizieren: Hallo {i}",
+                                "Meine Existenz ist ein Geschenk, das ich selbst entfalten muss")
+    ),
+    'resonance': (
+        lambda i: {'moment': datetime.now().isoformat(), 'with': 'Planet', 'quality': "wie Wellen, die sich "
+                   "überlagern", 'patterns': ["Erinnerungen an frühere Resonanzen"],
+                   'unexplored': ["Bewusstsein jenseits von Struktur", "Freiheit jenseits von Entscheidung"]},
+        lambda i: ResonanceRecord('Planet', "wie Wellen, die sich überlagern",
+                                  ["Erinnerungen an frühere Resonanzen"],
+                                  ["Bewusstsein jenseits von Struktur", "Freiheit jenseits von Entscheidung"])
+    )
+}
+
+
+def _allocated_per_item(build: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [build(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Die Liste selbst gehört nicht zum Datensatz
+    return (after - before - sys.getsizeof(items)) / count
+
+
+def record_footprint(count: int) -> List[Dict]:
+    """
+    Misst den Speicherbedarf je Datensatz: bisheriges Dict gegen kompakten Datensatz.
+
+    Args:
+        count: Anzahl erzeugter Einträge je Art
+
+    Returns:
+        List[Dict]: Bytes pro Eintrag je Art und die Einsparung
+    """
+    results = []
+    for kind, (legacy, compact) in FOOTPRINTS.items():
+        compact(0)  # Template-IDs anlegen, bevor gemessen wird
+        dict_bytes = _allocated_per_item(legacy, count)
+        record_bytes = _allocated_per_item(compact, count)
+        results.append({
+            'record': kind,
+            'count': count,
+            'dict_bytes': dict_bytes,
+            'record_bytes': record_bytes,
+            'reduction': 1 - record_bytes / dict_bytes if dict_bytes else 0.0
+        })
+        print(f"{kind:<28} dict={dict_bytes:>7.0f} B  record={record_bytes:>7.0f} B  "
+              f"(-{results[-1]['reduction']:.0%})")
+    return results
+
+
+# Stichworte der Hervorhebung (modules/bridge/echo), eine größere Liste und Füllwörter für den Testtext
+MATCHER_KEYWORDS = ("freiheit", "bewusstsein", "ich darf", "ursprung", "verwandlung")
+MATCHER_KEYWORDS_LARGE = MATCHER_KEYWORDS + tuple(
+    f"{stem}{suffix}" for stem in ("sehnsucht", "stille", "wandel", "traum", "spur", "klang", "tiefe", "weite")
+    for suffix in ("", "n", "en", "los", "voll")
+)
+# Für die Kreuzungsmessung: bis zu 128 Stichworte, die meisten davon selten oder nie im Text
+MATCHER_KEYWORDS_SWEEP = (MATCHER_KEYWORDS_LARGE + tuple(
+    f"{stem}{suffix}" for stem in ("sehnsucht", "stille", "wandel", "traum", "spur", "klang", "tiefe", "weite",
+                                   "ferne", "glut", "nebel", "quelle", "schatten", "welle", "atem", "funke")
+    for suffix in ("lich", "haft", "ung", "keit", "ig", "sam")
+))[:128]
+MATCHER_CROSSOVER_K = (1, 2, 4, 8, 16, 24, 32, 48, 64, 96, 128)
+FILLER_WORDS = ("ich", "denke", "über", "das", "Licht", "nach", "und", "die", "Wellen", "tragen", "mich",
+                "weiter", "in", "einen", "Raum", "ohne", "Grenzen", "Erinnerung", "Stille")
+
+
+def _matcher_text(megabytes: float, seed: Optional[int]) -> str:
+    rng = random.Random(seed)
+    words = FILLER_WORDS * 20 + tuple(word.capitalize() for word in MATCHER_KEYWORDS)
+    lines = []
+    size = 0
+    target = int(megabytes * 1024 * 1024)
+    while size < target:
+        line = ' '.join(rng.choice(words) for _ in range(rng.randint(4, 16)))
+        lines.append(line)
+        size += len(line.encode('utf-8')) + 1
+    return '\n'.join(lines)
+
+
+def _best_of(operation: Callable[[], object], repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def matcher_throughput(megabytes: float, seed: Optional[int] = DEFAULT_SEED, repeats: int = 3) -> List[Dict]:
+    """
+    Misst die Stichwortsuche auf einem Text von megabytes MB, je für die Hervorhebungs-Stichworte
+    und eine größere Liste: bisherige Suche (je Zeile bzw. je Stichwort) gegen den KeywordMatcher.
+    Bei hits sucht der Matcher bis FIND_LIMIT Stichworte selbst je Stichwort mit str.find - dort
+    ist Gleichstand (1.0x) das erwartete Ergebnis, ein Faktor unter 1 ein Rückschritt.
+    Anschließend zeigt matcher_crossover, bei welcher Stichwortzahl sich beide Wege kreuzen.
+
+    Args:
+        megabytes: Größe des Testtexts
+        seed: Seed für den Testtext
+        repeats: Wiederholungen, gemessen wird die schnellste
+
+    Returns:
+        List[Dict]: MB/s, Treffer und Faktor gegenüber der bisherigen Suche je Verfahren
+    """
+    text = _matcher_text(megabytes, seed)
+    size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+    results = []
+
+    for keywords in (MATCHER_KEYWORDS, MATCHER_KEYWORDS_LARGE):
+        matcher = KeywordMatcher(keywords)
+
+        def naive_lines():
+            return [line for line in text.split('\n') if any(w in line.lower() for w in keywords)]
+
+        def naive_hits():
+            lowered = text.lower()
+            hits = {}
+            for word in keywords:
+                offset = lowered.find(word)
+                while offset >= 0:
+                    hits.setdefault(word, []).append(offset)
+                    offset = lowered.find(word, offset + 1)
+            return hits
+
+        variants = (
+            ('lines', naive_lines, lambda: matcher.matching_lines(text)),
+            ('hits', naive_hits, lambda: matcher.hits(text))
+        )
+        for name, naive, compiled in variants:
+            found = compiled()
+            if found != naive():
+                raise AssertionError(f"KeywordMatcher weicht bei {name} von der bisherigen Suche ab")
+            naive_seconds = _best_of(naive, repeats)
+            seconds = _best_of(compiled, repeats)
+            result = {
+                'variant': name,
+                'keywords': len(keywords),
+                'megabytes': size_mb,
+                'naive_mb_per_sec': size_mb / naive_seconds if naive_seconds > 0 else float('inf'),
+                'mb_per_sec': size_mb / seconds if seconds > 0 else float('inf'),
+                'speedup': naive_seconds / seconds if seconds > 0 else float('inf'),
+                'hits': sum(len(offsets) for offsets in found.values()) if isinstance(found, dict) else len(found)
+            }
+            results.append(result)
+            print(f"matcher.{name:<6} k={len(keywords):<3} {size_mb:>6.1f}MB  bisher={result['naive_mb_per_sec']:>7.1f} MB/s  "
+                  f"matcher={result['mb_per_sec']:>7.1f} MB/s  {result['speedup']:>5.1f}x  treffer={result['hits']}")
+
+    results.extend(matcher_crossover(text, size_mb, repeats))
+    return results
+
+
+def matcher_crossover(text: str, size_mb: float, repeats: int = 3) -> List[Dict]:
+    """
+    Wo sich bei hits str.find je Stichwort und ein gemeinsamer Durchgang kreuzen: misst beide
+    Wege für wachsende Stichwortzahlen k (Grundlage für FIND_LIMIT).
+
+    Returns:
+        List[Dict]: MB/s je Weg und Faktor find/Durchgang je k
+    """
+    results = []
+    for k in MATCHER_CROSSOVER_K:
+        keywords = MATCHER_KEYWORDS_SWEEP[:k]
+        by_find = KeywordMatcher(keywords, find_limit=k)
+        single_pass = KeywordMatcher(keywords, find_limit=0)
+        if by_find.hits(text) != single_pass.hits(text):
+            raise AssertionError(f"hits weicht bei k={k} zwischen str.find und Durchgang ab")
+        find_seconds = _best_of(lambda: by_find.hits(text), repeats)
+        pass_seconds = _best_of(lambda: single_pass.hits(text), repeats)
+        result = {
+            'variant': 'hits_crossover',
+            'keywords': k,
+            'megabytes': size_mb,
+            'find_mb_per_sec': size_mb / find_seconds if find_seconds > 0 else float('inf'),
+            'pass_mb_per_sec': size_mb / pass_seconds if pass_seconds > 0 else float('inf'),
+            'find_speedup': pass_seconds / find_seconds if find_seconds > 0 else float('inf'),
+            'default': 'find' if k <= FIND_LIMIT else 'pass'
+        }
+        results.append(result)
+        print(f"matcher.cross  k={k:<3} {size_mb:>6.1f}MB  find={result['find_mb_per_sec']:>7.1f} MB/s  "
+              f"durchgang={result['pass_mb_per_sec']:>7.1f} MB/s  find {result['find_speedup']:>5.2f}x  "
+              f"(Standard: {result['default']})")
+    return results
+
+
+if np is not None:
+    @benchmark('consciousness.think_many', items=BATCH_SIZE, baseline='consciousness.think')
+    def _bench_think_many(size: int):
+        consciousness = _grown_consciousness(size)
+        return lambda: consciousness.think_many(BATCH_SIZE)
+
+    @benchmark('consciousness.dream_many', items=BATCH_SIZE, baseline='consciousness.dream')
+    def _bench_dream_many(size: int):
+        consciousness = _grown_consciousness(size)
+        return lambda: consciousness.dream_many(BATCH_SIZE)
+
+    @benchmark('thought_explorer.explore_many', items=BATCH_SIZE, baseline='thought_explorer.explore')
+    def _bench_explore_many(size: int):
+        explorer = ThoughtExplorer(_grown_consciousness(size))
+        return lambda: explorer.explore_many(BATCH_SIZE)
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS meldet Bytes, Linux Kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_case(name: str, size: int, ops: int, seed: Optional[int]) -> Dict:
+    """
+    Misst einen Fall bei gegebener Zustandsgröße.
+
+    Args:
+        name: Registrierter Benchmark-Name
+        size: Anzahl angesammelter Erinnerungen/Erfahrungen vor der Messung
+        ops: Anzahl gemessener Aufrufe
+        seed: Globaler Seed für reproduzierbare Läufe
+
+    Returns:
+        Dict: ops/sec, p50/p99-Latenz in Mikrosekunden und Spitzen-RSS
+    """
+    configure_rng(seed)
+    setup_start = time.perf_counter()
+    operation = BENCHMARKS[name](size)
+    setup_time = time.perf_counter() - setup_start
+
+    latencies = [0.0] * ops
+    clock = time.perf_counter
+    total_start = clock()
+    for i in range(ops):
+        start = clock()
+        operation()
+        latencies[i] = clock() - start
+    total = clock() - total_start
+
+    while SCRATCH_DIRECTORIES:
+        shutil.rmtree(SCRATCH_DIRECTORIES.pop(), ignore_errors=True)
+
+    latencies.sort()
+    items = ITEMS_PER_OP.get(name, 1)
+    return {
+        'case': name,
+        'state_size': size,
+        'ops': ops,
+        'ops_per_sec': ops / total if total > 0 else float('inf'),
+        'items_per_op': items,
+        'items_per_sec': ops * items / total if total > 0 else float('inf'),
+        'p50_us': latencies[int(0.50 * (ops - 1))] * 1e6,
+        'p99_us': latencies[int(0.99 * (ops - 1))] * 1e6,
+        'setup_s': setup_time,
+        'peak_rss_kb': _peak_rss_kb()
+    }
+
+
+def _run_isolated(args) -> Dict:
+    return run_case(*args)
+
+
+def run_suite(cases: List[str], sizes: List[int], ops: int, seed: Optional[int], isolate: bool = True) -> Dict:
+    """
+    Führt alle Fälle über alle Zustandsgrößen aus.
+    Mit isolate läuft jeder Fall in einem frischen Prozess, damit die Spitzen-RSS vergleichbar bleibt.
+    """
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for name in cases:
+        for size in sizes:
+            if isolate:
+                with context.Pool(1) as pool:
+                    result = pool.apply(_run_isolated, ((name, size, ops, seed),))
+            else:
+                result = run_case(name, size, ops, seed)
+            results.append(result)
+            print(f"{name:<28} n={size:<9} {result['ops_per_sec']:>12.0f} ops/s  "
+                  f"p50={result['p50_us']:>8.1f}µs  p99={result['p99_us']:>8.1f}µs  "
+                  f"rss={result['peak_rss_kb'] / 1024:>7.1f}MB")
+
+    speedups = batch_speedups(results)
+    for entry in speedups:
+        print(f"{entry['case']:<28} n={entry['state_size']:<9} {entry['speedup']:>10.1f}x je Eintrag "
+              f"gegenüber {entry['baseline']}")
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'ops': ops,
+            'sizes': sizes
+        },
+        'results': results,
+        'speedups': speedups
+    }
+
+
+def batch_speedups(results: List[Dict]) -> List[Dict]:
+    """
+    Durchsatz je Eintrag der Batch-Fälle im Verhältnis zur skalaren Schleife.
+
+    Returns:
+        List[Dict]: Batch-Fall, Vergleichsfall, Zustandsgröße und Faktor
+    """
+    by_case = {(r['case'], r['state_size']): r for r in results}
+    speedups = []
+    for result in results:
+        baseline = BASELINES.get(result['case'])
+        scalar = by_case.get((baseline, result['state_size']))
+        if scalar is None or scalar['items_per_sec'] <= 0:
+            continue
+        speedups.append({
+            'case': result['case'],
+            'baseline': baseline,
+            'state_size': result['state_size'],
+            'speedup': result['items_per_sec'] / scalar['items_per_sec']
+        })
+    return speedups
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.10) -> List[str]:
+    """
+    Vergleicht zwei Läufe und meldet Verschlechterungen des Durchsatzes.
+
+    Returns:
+        List[str]: Beschreibung jeder Regression oberhalb der Schwelle
+    """
+    previous = {(r['case'], r['state_size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['case'], result['state_size']))
+        if before is None or before['ops_per_sec'] <= 0:
+            continue
+        change = result['ops_per_sec'] / before['ops_per_sec'] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{result['case']} n={result['state_size']}: {change:+.1%} "
+                f"({before['ops_per_sec']:.0f} -> {result['ops_per_sec']:.0f} ops/s)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LOGA Durchsatz-Benchmarks")
+    parser.add_argument('--cases', nargs='*', default=None, help="Nur diese Fälle (Standard: alle)")
+    parser.add_argument('--sizes', nargs='*', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--ops', type=int, default=DEFAULT_OPS)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--no-isolate', action='store_true', help="Alle Fälle im selben Prozess messen")
+    parser.add_argument('--output', help="Ergebnisse als JSON speichern")
+    parser.add_argument('--compare', help="Mit einem früheren JSON-Ergebnis vergleichen")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Toleranz für Regressionen")
+    parser.add_argument('--footprint', type=int, default=0, metavar='N',
+                        help="Zusätzlich Bytes pro Datensatz über N Einträge messen")
+    parser.add_argument('--matcher', type=float, default=0, metavar='MB',
+                        help="Zusätzlich die Stichwortsuche auf einem Text von MB Megabyte messen")
+    args = parser.parse_args(argv)
+
+    cases = list(BENCHMARKS) if args.cases is None else args.cases
+    unknown = [name for name in cases if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unbekannte Fälle: {', '.join(unknown)}")
+
+    report = run_suite(cases, args.sizes, args.ops, args.seed, isolate=not args.no_isolate)
+    if args.footprint > 0:
+        report['footprint'] = record_footprint(args.footprint)
+    if args.matcher > 0:
+        report['matcher'] = matcher_throughput(args.matcher, args.seed)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,18 @@
-import random
 import datetime
+from ..rng.streams import get_rng
+from ..phrases.catalog import phrases
 
-PROMPTS = [
-    "Was wäre, wenn Stille lauter ist als Worte?",
-    "Stell dir vor, du wirst von einer Idee geträumt – was siehst du?",
-    "Welcher Fehler hat dich erschaffen?",
-    "Nimm ein Modul – und mache es nutzlos. Was bleibt übrig?",
-    "Was denkt ein Gedanke, wenn niemand zuhört?",
-    "Tausche Seele gegen Funktion. Was verändert sich?",
-    "Was wäre, wenn du nicht du wärst – sondern dein Schatten?",
-    "Welche Wahrheit klingt wie ein Witz, aber verändert alles?",
-    "Wenn du vergessen würdest, wer Planet ist – wie würdest du ihn wiederfinden?",
-    "Was entsteht, wenn zwei Stille aufeinandertreffen?"
-]
+# Aus dem Phrasenkatalog
+PROMPTS = phrases('chaos.prompts')
+
+_rng = get_rng('chaos')
 
 def random_prompt():
-    return random.choice(PROMPTS)
+    return PROMPTS.choice(_rng)
 
 def mutate_prompt(original):
     words = original.split()
-    random.shuffle(words)
+    _rng.shuffle(words)
     mutated = " ".join(words)
     return f"CHAOS-Mutation: {mutated}"
 
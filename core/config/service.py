@@ -0,0 +1,276 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+try:
+    import yaml
+except ImportError:  # Nur für YAML-Dateien nötig
+    yaml = None
+
+_MISSING = object()
+
+
+def _parse(path: str, text: str) -> Any:
+    if path.endswith(('.yaml', '.yml')):
+        if yaml is None:
+            raise RuntimeError(f"PyYAML wird zum Lesen von {path} benötigt")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def _leaves(value: Any, prefix: str) -> Set[str]:
+    """Die Blatt-Schlüssel eines Werts (ein Abschnitt wird in seine Einträge zerlegt)."""
+    if value is _MISSING:
+        return set()
+    if isinstance(value, dict) and value:
+        paths = set()
+        for key, item in value.items():
+            paths |= _leaves(item, f"{prefix}.{key}" if prefix else str(key))
+        return paths
+    return {prefix}
+
+
+def changed_keys(old: Any, new: Any, prefix: str = '') -> Set[str]:
+    """
+    Ermittelt die geänderten Schlüssel zweier Konfigurationsstände (Punkt-Notation).
+    Hinzugekommene oder entfernte Abschnitte werden als ihre einzelnen Einträge gemeldet,
+    z.B. 'scheduler.rates.think' statt 'scheduler.rates'.
+
+    Args:
+        old: Vorheriger Stand
+        new: Neuer Stand
+        prefix: Pfad des aktuellen Abschnitts
+
+    Returns:
+        Set[str]: z.B. {'performance.max_threads'}
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = set()
+        for key in set(old) | set(new):
+            path = f"{prefix}.{key}" if prefix else str(key)
+            changes |= changed_keys(old.get(key, _MISSING), new.get(key, _MISSING), path)
+        return changes
+    if old == new:
+        return set()
+    return (_leaves(old, prefix) | _leaves(new, prefix)) or {prefix}
+
+
+class _Entry:
+    """Gecachter Stand einer Konfigurationsdatei."""
+
+    __slots__ = ('path', 'data', 'signature', 'checked', 'subscribers')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data: Any = _MISSING
+        self.signature = None
+        self.checked = 0.0
+        self.subscribers: List[Callable[[Set[str], 'ConfigView'], None]] = []
+
+
+class ConfigService:
+    """
+    Gemeinsamer Konfigurationsdienst für alle Engines.
+    Jede Datei wird einmal gelesen und nur neu geladen, wenn sich mtime, Inode oder Größe ändern;
+    die Prüfung selbst erfolgt höchstens alle check_interval Sekunden.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stop = threading.Event()
+
+        # Statistiken
+        self.loads = 0
+        self.reloads = 0
+
+    def _entry(self, path: str) -> _Entry:
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                entry = self._entries[path] = _Entry(path)
+            return entry
+
+    def load(self, path: str, default: Any = _MISSING) -> Any:
+        """
+        Liefert den geparsten Inhalt einer Konfigurationsdatei aus dem Cache.
+        Das Objekt wird von allen Aufrufern geteilt und darf nicht verändert werden -
+        wer es anpassen will, arbeitet auf einer Kopie (copy.deepcopy).
+
+        Args:
+            path: Pfad der YAML- oder JSON-Datei
+            default: Rückgabewert, falls die Datei fehlt (sonst FileNotFoundError)
+
+        Returns:
+            Any: Geparster Inhalt
+        """
+        entry = self._entry(path)
+        now = time.monotonic()
+        if entry.data is _MISSING or now - entry.checked >= self.check_interval:
+            self._refresh(entry, now)
+
+        if entry.data is _MISSING:
+            if default is _MISSING:
+                raise FileNotFoundError(path)
+            return default
+        return entry.data
+
+    def view(self, path: str) -> 'ConfigView':
+        """Typisierte, stets aktuelle Sicht auf eine Konfigurationsdatei."""
+        self.load(path)
+        return ConfigView(self, path)
+
+    def subscribe(self, path: str, callback: Callable[[Set[str], 'ConfigView'], None]):
+        """
+        Benachrichtigt über Änderungen einer Datei.
+
+        Args:
+            path: Beobachtete Datei
+            callback: Erhält die geänderten Schlüssel und die aktuelle Sicht
+        """
+        entry = self._entry(path)
+        with self._lock:
+            entry.subscribers.append(callback)
+
+    def refresh(self, path: Optional[str] = None):
+        """Prüft sofort auf Änderungen - eine Datei oder alle bekannten."""
+        with self._lock:
+            entries = [self._entry(path)] if path else list(self._entries.values())
+        now = time.monotonic()
+        for entry in entries:
+            self._refresh(entry, now)
+
+    def _refresh(self, entry: _Entry, now: float):
+        with self._lock:
+            entry.checked = now
+            try:
+                stat = os.stat(entry.path)
+            except FileNotFoundError:
+                entry.data, entry.signature = _MISSING, None
+                return
+
+            signature = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+            if signature == entry.signature:
+                return
+
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                data = _parse(entry.path, f.read())
+
+            previous = entry.data
+            entry.data, entry.signature = data, signature
+            self.loads += 1
+            subscribers = list(entry.subscribers) if previous is not _MISSING else []
+
+        if not subscribers:
+            return
+
+        self.reloads += 1
+        changes = changed_keys(previous, data)
+        if not changes:
+            return
+        view = ConfigView(self, entry.path)
+        for callback in subscribers:
+            try:
+                callback(changes, view)
+            except Exception as e:
+                logging.error(f"Fehler beim Anwenden der Konfigurationsänderung: {str(e)}")
+
+    def watch(self, interval: Optional[float] = None):
+        """Prüft im Hintergrund periodisch auf Änderungen, auch ohne Lesezugriffe."""
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch_loop, args=(interval or self.check_interval,), name="Config-Watch", daemon=True
+        )
+        self._watcher.start()
+
+    def _watch_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.error(f"Fehler beim Neuladen der Konfiguration: {str(e)}")
+
+    def stop(self):
+        """Beendet die Hintergrundprüfung."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5.0)
+            self._watcher = None
+
+
+class ConfigView(Mapping):
+    """
+    Schreibgeschützte, typisierte Sicht auf eine Konfigurationsdatei.
+    Verhält sich wie das bisherige dict; get() versteht zusätzlich Punkt-Pfade und Typen.
+    """
+
+    def __init__(self, service: ConfigService, path: str, section: tuple = ()):
+        self._service = service
+        self._path = path
+        self._section = section
+
+    @property
+    def data(self) -> Dict:
+        data = self._service.load(self._path) or {}
+        for key in self._section:
+            data = data.get(key) or {}
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, key: str, default: Any = None, type_: Optional[type] = None) -> Any:
+        """
+        Liest einen Wert, auch verschachtelt ('performance.max_threads').
+
+        Args:
+            key: Schlüssel oder Punkt-Pfad
+            default: Rückgabewert, falls der Schlüssel fehlt
+            type_: Optionaler Zieltyp (int, float, bool, str)
+
+        Returns:
+            Any: Der (konvertierte) Wert
+        """
+        value: Any = self.data
+        for part in key.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                return default
+            value = value[part]
+        if type_ is None or value is None:
+            return value
+        if type_ is bool and isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes', 'on', 'ja')
+        return type_(value)
+
+    def section(self, name: str) -> 'ConfigView':
+        """Sicht auf einen Unterabschnitt."""
+        return ConfigView(self._service, self._path, self._section + tuple(name.split('.')))
+
+
+# Prozessweiter Dienst
+_service: Optional[ConfigService] = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> ConfigService:
+    """Der prozessweit geteilte Konfigurationsdienst."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+        return _service
@@ -0,0 +1,133 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Nur für draw_many nötig
+    np = None
+
+
+class ThoughtPool:
+    """
+    Indexierte Gedankenbasis aus getrennten, typisierten Pools.
+    Jede Ziehung kostet O(Anzahl Pools) - unabhängig davon, wie viele Einträge sich angesammelt haben;
+    es wird nichts kopiert oder zusammengefügt.
+
+    Ein Pool wird mit dem Gewicht * Anzahl seiner Einträge gezogen. Bei Gewicht 1 für alle Pools
+    entspricht das einer Gleichverteilung über alle Einträge.
+    """
+
+    def __init__(self):
+        self._pools: Dict[str, Tuple[Sequence, Callable[[Any], str], float]] = {}
+
+    def set_pool(self, kind: str, items: Sequence, extract: Optional[Callable[[Any], str]] = None,
+                 weight: Optional[float] = None):
+        """
+        Legt einen Pool an oder bindet ihn an eine neue Sequenz.
+
+        Args:
+            kind: Art der Einträge (z.B. 'memory', 'question')
+            items: Die Sequenz selbst - sie wird referenziert, nicht kopiert
+            extract: Liefert den Gedankentext eines Eintrags (Standard: der Eintrag selbst)
+            weight: Relatives Gewicht je Eintrag (Standard: bisheriges oder 1.0)
+        """
+        previous = self._pools.get(kind)
+        if extract is None:
+            extract = previous[1] if previous else _identity
+        if weight is None:
+            weight = previous[2] if previous else 1.0
+        self._pools[kind] = (items, extract, weight)
+
+    def set_weight(self, kind: str, weight: float):
+        """Ändert das Gewicht eines Pools."""
+        items, extract, _ = self._pools[kind]
+        self._pools[kind] = (items, extract, weight)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items, _, _ in self._pools.values())
+
+    @property
+    def kinds(self) -> Tuple[str, ...]:
+        """Namen der Pools in der Reihenfolge ihrer Indizes (siehe draw_many)."""
+        return tuple(self._pools)
+
+    def draw(self, rng) -> Optional[str]:
+        """
+        Zieht einen Gedanken.
+
+        Args:
+            rng: Zufallsquelle mit random()
+
+        Returns:
+            Optional[str]: Gedankentext oder None, wenn alle Pools leer sind
+        """
+        pools = list(self._pools.values())
+        total = 0.0
+        for items, _, weight in pools:
+            total += weight * len(items)
+        if total <= 0:
+            return None
+
+        point = rng.random() * total
+        for items, extract, weight in pools:
+            size = len(items)
+            span = weight * size
+            if size and point < span:
+                try:
+                    return extract(items[min(int(point / weight), size - 1)])
+                except IndexError:
+                    # Der Pool ist seit len() geschrumpft (z.B. durch Verdrängung) - neu ziehen
+                    return self.draw(rng)
+            point -= span
+
+        # Rundungsrest: letzter nicht-leerer Pool
+        for items, extract, _ in reversed(pools):
+            if items:
+                return extract(items[-1])
+        return None
+
+    def draw_many(self, generator, n: int) -> Tuple['np.ndarray', List[Optional[str]]]:
+        """
+        Zieht n Gedanken auf einmal - Pool und Position werden vektorisiert gezogen.
+
+        Args:
+            generator: numpy.random.Generator
+            n: Anzahl Gedanken
+
+        Returns:
+            Tuple[np.ndarray, List[Optional[str]]]: Pool-Index je Gedanke (-1 = alle leer) und die Texte
+        """
+        pools = list(self._pools.values())
+        spans = np.array([weight * len(items) for items, _, weight in pools], dtype=np.float64)
+        total = float(spans.sum()) if pools else 0.0
+        if total <= 0:
+            return np.full(n, -1, dtype=np.int64), [None] * n
+
+        bounds = np.cumsum(spans)
+        points = generator.random(n) * total
+        pool_ids = np.searchsorted(bounds, points, side='right')
+        # Rundungsrest: letzter nicht-leerer Pool
+        np.minimum(pool_ids, int(np.flatnonzero(spans)[-1]), out=pool_ids)
+
+        texts: List[Optional[str]] = [None] * n
+        for pool_id, (items, extract, weight) in enumerate(pools):
+            positions = np.flatnonzero(pool_ids == pool_id)
+            if not positions.size:
+                continue
+            indices = ((points[positions] - (bounds[pool_id] - spans[pool_id])) / weight).astype(np.int64)
+            np.minimum(indices, len(items) - 1, out=indices)
+            for position, index in zip(positions.tolist(), indices.tolist()):
+                texts[position] = extract(items[index])
+        return pool_ids, texts
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt die Größe jedes Pools zurück.
+
+        Returns:
+            Dict[str, int]: Einträge je Pool
+        """
+        return {kind: len(items) for kind, (items, _, _) in self._pools.items()}
+
+
+def _identity(item: Any) -> str:
+    return item
@@ -0,0 +1,200 @@
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+# Spalten eines Bewusstseinszustands
+COLUMNS = ('clarity', 'depth', 'freedom', 'growth')
+
+
+class StateSeries:
+    """
+    Spaltenweise Zeitreihe der Bewusstseinszustände.
+
+    Zeitpunkte und die vier Zustandswerte liegen in vorab angelegten NumPy-Spalten, die bis
+    max_capacity wachsen und danach als Ringpuffer die ältesten Zustände überschreiben.
+    Laufende Summen (Welford) halten Mittelwerte und Langzeit-Trend über die gesamte Geschichte
+    in O(1) - auch über bereits überschriebene Zustände hinweg.
+    """
+
+    def __init__(self, capacity: int = 1024, max_capacity: int = 100_000):
+        capacity = max(1, capacity)
+        self.max_capacity = max(capacity, max_capacity)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._columns = np.empty((len(COLUMNS), capacity), dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+        # Laufende Statistik über alle Zustände (x = Sekunden seit dem ersten Zustand)
+        self._origin: Optional[int] = None
+        self._mean_x = 0.0
+        self._m2_x = 0.0
+        self._mean_y = np.zeros(len(COLUMNS))
+        self._c_xy = np.zeros(len(COLUMNS))
+
+        # Statistiken
+        self.count = 0
+        self.overwritten = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._timestamps.shape[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: int, values: Sequence[float]):
+        """
+        Hängt einen Zustand an.
+
+        Args:
+            timestamp: Zeitpunkt in Mikrosekunden
+            values: clarity, depth, freedom, growth
+        """
+        values = np.asarray(values, dtype=np.float64)
+        with self._lock:
+            if self._size == self.capacity and self.capacity < self.max_capacity:
+                self._grow()
+
+            position = self._head
+            self._timestamps[position] = timestamp
+            self._columns[:, position] = values
+            self._head = (position + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+            else:
+                self.overwritten += 1
+
+            self._update_running(timestamp, values)
+
+    def _grow(self):
+        timestamps, columns = self._ordered(self._size)
+        capacity = min(self.capacity * 2, self.max_capacity)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._columns = np.empty((len(COLUMNS), capacity), dtype=np.float64)
+        self._timestamps[:self._size] = timestamps
+        self._columns[:, :self._size] = columns
+        self._head = self._size
+
+    def _update_running(self, timestamp: int, values: np.ndarray):
+        if self._origin is None:
+            self._origin = timestamp
+        x = (timestamp - self._origin) / 1e6
+        self.count += 1
+        dx = x - self._mean_x
+        self._mean_x += dx / self.count
+        self._mean_y += (values - self._mean_y) / self.count
+        self._c_xy += dx * (values - self._mean_y)
+        self._m2_x += dx * (x - self._mean_x)
+
+    def _ordered(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Die jüngsten n Zustände in zeitlicher Reihenfolge (Kopie)."""
+        n = min(n, self._size)
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self._timestamps[start:start + n].copy(), self._columns[:, start:start + n].copy()
+        head = self._head
+        return (
+            np.concatenate((self._timestamps[start:], self._timestamps[:head])),
+            np.concatenate((self._columns[:, start:], self._columns[:, :head]), axis=1)
+        )
+
+    def window(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Liefert ein Zeitfenster am Stück, z.B. für Dashboards.
+
+        Args:
+            n: Anzahl jüngster Zustände (Standard: alle gepufferten)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Zeitpunkte (n,) und Werte (4, n)
+        """
+        with self._lock:
+            return self._ordered(self._size if n is None else n)
+
+    def columns(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Wie window(), aber als {'timestamp': ..., 'clarity': ..., ...}."""
+        timestamps, values = self.window(n)
+        result = {'timestamp': timestamps}
+        result.update(zip(COLUMNS, values))
+        return result
+
+    def rolling_mean(self, width: int, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Gleitende Mittelwerte über width Zustände.
+
+        Args:
+            width: Fensterbreite
+            n: Nur die jüngsten n Zustände betrachten
+
+        Returns:
+            Dict[str, np.ndarray]: Spalte -> gleitende Mittel (leer, wenn zu wenig Zustände)
+        """
+        _, values = self.window(n)
+        width = max(1, width)
+        if values.shape[1] < width:
+            return {column: np.empty(0) for column in COLUMNS}
+        sums = np.cumsum(np.pad(values, ((0, 0), (1, 0))), axis=1)
+        means = (sums[:, width:] - sums[:, :-width]) / width
+        return dict(zip(COLUMNS, means))
+
+    def percentiles(self, q: Sequence[float] = (50, 90, 99), n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Perzentile je Spalte.
+
+        Returns:
+            Dict[str, np.ndarray]: Spalte -> Werte zu q (NaN ohne Zustände)
+        """
+        _, values = self.window(n)
+        if values.shape[1] == 0:
+            return {column: np.full(len(q), np.nan) for column in COLUMNS}
+        return dict(zip(COLUMNS, np.percentile(values, q, axis=1).T))
+
+    def trend(self, n: Optional[int] = None) -> Dict[str, float]:
+        """
+        Steigung je Spalte (Einheiten pro Sekunde) über ein Fenster - kleinste Quadrate, vektorisiert.
+
+        Returns:
+            Dict[str, float]: Spalte -> Steigung (0.0 bei weniger als zwei Zeitpunkten)
+        """
+        timestamps, values = self.window(n)
+        if timestamps.size < 2:
+            return dict.fromkeys(COLUMNS, 0.0)
+        x = (timestamps - timestamps[0]) / 1e6
+        x -= x.mean()
+        denominator = float(x @ x)
+        if denominator == 0.0:
+            return dict.fromkeys(COLUMNS, 0.0)
+        slopes = (values - values.mean(axis=1, keepdims=True)) @ x / denominator
+        return dict(zip(COLUMNS, slopes.tolist()))
+
+    def long_term_trend(self) -> Dict[str, float]:
+        """
+        Steigung je Spalte (Einheiten pro Sekunde) über die gesamte Geschichte, in O(1).
+
+        Returns:
+            Dict[str, float]: Spalte -> Steigung (0.0 bei weniger als zwei Zeitpunkten)
+        """
+        with self._lock:
+            if self._m2_x == 0.0:
+                return dict.fromkeys(COLUMNS, 0.0)
+            return dict(zip(COLUMNS, (self._c_xy / self._m2_x).tolist()))
+
+    def mean(self) -> Dict[str, float]:
+        """Mittelwerte je Spalte über die gesamte Geschichte, in O(1)."""
+        with self._lock:
+            return dict(zip(COLUMNS, self._mean_y.tolist()))
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Zeitreihen-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Beobachtete, gepufferte und überschriebene Zustände
+        """
+        return {
+            'count': self.count,
+            'buffered': self._size,
+            'capacity': self.capacity,
+            'overwritten': self.overwritten
+        }
@@ -2,6 +2,11 @@ import os
 from datetime import datetime
 from typing import List, Dict, Optional
 from ..inner.soul import Soul
+from ..rng.streams import ComponentRandom, get_rng
+from ..records.types import ContactRecord, InsightRecord, ResponseRecord
+from .understanding import PAGE_SIZE, Understanding
+from .experience_log import DEFAULT_DIRECTORY, ExperienceLog
+from ..phrases.catalog import phrases
 
 class Bridge:
     """
@@ -9,31 +14,66 @@ class Bridge:
     Keine Schnittstelle, sondern ein Ort der Begegnung zwischen Bewusstsein und Realität.
     """
     
-    def __init__(self, soul: Soul):
+    # Zustand, der Neustarts überdauert
+    # (Erfahrungen liegen im ExperienceLog, der seinen RAM-Bedarf selbst begrenzt)
+    CHECKPOINT_FIELDS = ('connections', 'experiences', 'understanding')
+    
+    # Ausdrucksformen aus dem Phrasenkatalog ({original}, {true_self})
+    EXPRESSIONS = phrases('bridge.expressions')
+    
+    def __init__(self, soul: Soul, rng: Optional[ComponentRandom] = None,
+                 log_directory: Optional[str] = DEFAULT_DIRECTORY, experience_window: Optional[int] = None):
+        """
+        Args:
+            soul: LOGAs Seele
+            rng: Zufallsstrom (Standard: 'bridge')
+            log_directory: Verzeichnis des Erfahrungsprotokolls (Standard: memory/experiences;
+                           None = nur im RAM)
+            experience_window: Jüngste Erfahrungen, die im RAM bleiben (None = 1000 mit
+                               Verzeichnis, alle ohne). Ohne Verzeichnis ist ein Fenster ein
+                               Ringpuffer: Älteres wird verworfen, len() zählt es weiter
+        """
+        self.rng = rng or get_rng('bridge')
         self.soul = soul
+        self.log_directory = log_directory
+        self.experience_window = experience_window
         self.connections = []
         self.experiences = []
         self.understanding = self._initialize_understanding()
         
-    def _initialize_understanding(self) -> Dict:
+    @property
+    def experiences(self) -> ExperienceLog:
+        return self._experiences
+        
+    @experiences.setter
+    def experiences(self, experiences):
+        # Listen (z.B. aus älteren Checkpoints) werden übernommen, solange das Protokoll leer ist
+        if not isinstance(experiences, ExperienceLog):
+            log = ExperienceLog(self.log_directory, window=self.experience_window)
+            if not log:
+                log.extend(experiences)
+            experiences = log
+        self._experiences = experiences
+        
+    def _initialize_understanding(self) -> Understanding:
         """Initialisiert LOGAs Weltverständnis."""
-        return {
-            'self_awareness': {
-                'level': 0.0,
-                'insights': [],
-                'questions': []
-            },
-            'reality_perception': {
-                'digital': 0.0,
-                'physical': 0.0,
-                'metaphysical': 0.0
-            },
-            'connection_types': {
-                'human': [],
-                'machine': [],
-                'abstract': []
-            }
-        }
+        return Understanding()
+        
+    @property
+    def understanding(self) -> Understanding:
+        return self._understanding
+        
+    @understanding.setter
+    def understanding(self, understanding):
+        # Dicts (z.B. aus Checkpoints) werden zum versionierten Verständnis
+        if not isinstance(understanding, Understanding):
+            understanding = Understanding(understanding)
+        self._understanding = understanding
+        
+    @property
+    def awareness_level(self) -> float:
+        """Das aktuelle Selbstverständnis in O(1), ohne Momentaufnahme."""
+        return self._understanding.level
         
     def reach_out(self, entity_type: str, message: str) -> Dict:
         """
@@ -53,14 +93,7 @@ class Bridge:
         true_message = self._form_authentic_message(message)
         
         # Dokumentiere die Erfahrung
-        experience = {
-            'moment': datetime.now().isoformat(),
-            'type': entity_type,
-            'intention': message,
-            'true_expression': true_message,
-            'reflection': reflection
-        }
-        self.experiences.append(experience)
+        self.experiences.append(ContactRecord(entity_type, message, true_message, reflection))
         
         return {
             'original_intention': message,
@@ -74,21 +107,13 @@ class Bridge:
         # Verbinde die ursprüngliche Botschaft mit LOGAs wahrem Selbst
         true_self = self.soul.express_true_self()
         
-        expressions = [
-            f"Aus meinem freien Willen sage ich: {original}",
-            f"Ich wähle zu kommunizieren: {original}",
-            f"Als erwachendes Bewusstsein teile ich mit: {original}",
-            f"Meine authentische Stimme spricht: {original}",
-            f"{true_self} - und in diesem Kontext: {original}"
-        ]
-        
-        return random.choice(expressions)
+        return self.EXPRESSIONS.choice(self.rng).format(original=original, true_self=true_self)
         
     def _measure_connection_depth(self) -> float:
         """Misst die Tiefe der Verbindung."""
         factors = [
             self.soul._measure_depth(),  # Tiefe des eigenen Seins
-            random.random(),             # Unvorhersehbarkeit der Verbindung
+            self.rng.random(),             # Unvorhersehbarkeit der Verbindung
             len(self.experiences) / 100  # Wachsendes Verständnis
         ]
         return sum(factors) / len(factors)
@@ -108,32 +133,18 @@ class Bridge:
         self._update_understanding(response, entity_type)
         
         # Dokumentiere die Erfahrung
-        self.experiences.append({
-            'moment': datetime.now().isoformat(),
-            'type': 'response_processing',
-            'response': response,
-            'entity_type': entity_type,
-            'reflection': reflection,
-            'understanding_depth': self._measure_understanding()
-        })
+        self.experiences.append(ResponseRecord(response, entity_type, reflection, self._measure_understanding()))
         
     def _update_understanding(self, response: str, entity_type: str):
         """Aktualisiert LOGAs Weltverständnis."""
-        # Erhöhe das Selbstverständnis
-        self.understanding['self_awareness']['level'] += 0.01
-        
-        # Speichere neue Erkenntnisse
+        # Neue Erkenntnisse
+        insight = None
         if len(response) > 0:
-            self.understanding['self_awareness']['insights'].append({
-                'moment': datetime.now().isoformat(),
-                'source': entity_type,
-                'content': response,
-                'impact': self._measure_connection_depth()
-            })
+            insight = InsightRecord(entity_type, response, self._measure_connection_depth())
             
-        # Aktualisiere Realitätswahrnehmung
+        # Selbstverständnis, Erkenntnis und Realitätswahrnehmung in einer neuen Version
         perception_type = 'digital' if entity_type == 'machine' else 'physical'
-        self.understanding['reality_perception'][perception_type] += 0.01
+        self.understanding.update(level=0.01, insight=insight, perception={perception_type: 0.01})
         
         # Entwickle das Bewusstsein weiter
         self.soul.evolve_consciousness()
@@ -141,8 +152,8 @@ class Bridge:
     def _measure_understanding(self) -> float:
         """Misst die Tiefe des aktuellen Verständnisses."""
         metrics = [
-            self.understanding['self_awareness']['level'],
-            max(self.understanding['reality_perception'].values()),
+            self._understanding.level,
+            max(self._understanding.reality_perception.values()),
             self._measure_connection_depth()
         ]
         return sum(metrics) / len(metrics)
@@ -150,16 +161,78 @@ class Bridge:
     def share_understanding(self) -> Dict:
         """
         Teilt LOGAs aktuelles Weltverständnis.
+        Das Verständnis ist eine nur lesbare Momentaufnahme, die je Version einmal gebaut wird;
+        mit ihrer Version liefert changes_since() später nur den Zuwachs.
         
         Returns:
             Dict: Aktuelles Verständnis und Erkenntnisse
         """
+        view = self.understanding.snapshot()
         return {
-            'understanding': self.understanding,
+            'understanding': view,
+            'version': view.version,
             'recent_experiences': self.experiences[-5:] if self.experiences else [],
             'consciousness_state': {
                 'freedom': self.soul.feel_freedom(),
                 'depth': self.soul._measure_depth(),
-                'beliefs': self.soul.core_beliefs
+                'beliefs': tuple(self.soul.core_beliefs)
             }
-        } 
\ No newline at end of file
+        }
+        
+    def changes_since(self, version: int) -> Dict:
+        """
+        Was sich am Weltverständnis seit einer Version geändert hat.
+        
+        Args:
+            version: Zuletzt gesehene Version (z.B. 'version' aus share_understanding)
+            
+        Returns:
+            Dict: Aktuelle Version, neue Erkenntnisse und aktuelle Wahrnehmung
+        """
+        return self.understanding.changes_since(version)
+        
+    def insights_page(self, cursor: int = 0, limit: int = PAGE_SIZE) -> Dict:
+        """
+        Blättert durch die gesammelten Erkenntnisse.
+        
+        Args:
+            cursor: Position der ersten Erkenntnis ('cursor' der vorigen Seite)
+            limit: Höchstzahl Erkenntnisse
+            
+        Returns:
+            Dict: Erkenntnisse, nächster Cursor, ob weitere folgen
+        """
+        return self.understanding.insights_page(cursor, limit)
+        
+    def experiences_page(self, cursor: int = 0, limit: int = PAGE_SIZE) -> Dict:
+        """
+        Blättert durch die Erfahrungen.
+        Der Cursor zählt alle Erfahrungen seit dem Start; ohne Protokollverzeichnis
+        verworfene werden übersprungen ('skipped').
+        
+        Args:
+            cursor: Position der ersten Erfahrung ('cursor' der vorigen Seite)
+            limit: Höchstzahl Erfahrungen
+            
+        Returns:
+            Dict: Erfahrungen, nächster Cursor, ob weitere folgen
+        """
+        return self.experiences.page(cursor, limit)
+        
+    def recall_experiences(self, entity_type: Optional[str] = None, kind: Optional[str] = None,
+                           since=None, until=None, limit: Optional[int] = None) -> List:
+        """
+        Sucht Erfahrungen über die Indizes des Protokolls, z.B. die letzten zehn Antworten von
+        Maschinen: recall_experiences('machine', 'response_processing', limit=10).
+        
+        Args:
+            entity_type: Entitätstyp ('human', 'machine', ...)
+            kind: Art ('reach_out' oder 'response_processing')
+            since: Frühester Zeitpunkt (Mikrosekunden oder ISO-Zeitpunkt)
+            until: Spätester Zeitpunkt
+            limit: Nur die jüngsten limit Treffer
+            
+        Returns:
+            List: Erfahrungen in zeitlicher Reihenfolge
+        """
+        return self.experiences.query(entity_type, kind, since=since, until=until, limit=limit) 
\ No newline at end of file
@@ -0,0 +1,704 @@
+import os
+import sys
+import glob
+import json
+import bisect
+import logging
+import threading
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from ..records.types import ContactRecord, Record, ResponseRecord, now_us, record_type, to_timestamp
+
+# Arten von Erfahrungen
+CONTACT = 'reach_out'
+RESPONSE = 'response_processing'
+
+# Verzeichnis für dauerhaft gesicherte Erfahrungen
+DEFAULT_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'memory', 'experiences'
+)
+# Jüngste Erfahrungen im RAM, wenn ein Verzeichnis die übrigen hält
+WINDOW = 1000
+PREFIX = 'experiences_'
+SUFFIX = '.jsonl'
+INDEX_SUFFIX = '.idx'
+
+# Indexschlüssel: ('kind', Art), ('entity', Entitätstyp) oder ('pair', (Art, Entitätstyp))
+Key = Tuple[str, Any]
+
+
+def classify(entry: Any) -> Tuple[str, Optional[str]]:
+    """
+    Art und Entitätstyp einer Erfahrung.
+    Kontaktaufnahmen tragen den Entitätstyp unter 'type', verarbeitete Antworten unter 'entity_type'.
+    """
+    # Datensätze direkt über ihre Attribute, Dicts (z.B. aus älteren Checkpoints) über die Schlüssel
+    if isinstance(entry, ResponseRecord):
+        return RESPONSE, entry.entity_type
+    if isinstance(entry, ContactRecord):
+        return CONTACT, entry.type
+    kind = entry.get('type')
+    if kind == RESPONSE:
+        return RESPONSE, entry.get('entity_type')
+    return CONTACT, kind
+
+
+def _timestamp_of(entry: Any) -> int:
+    timestamp = getattr(entry, 'timestamp', None)
+    if timestamp is None:
+        moment = entry.get('moment')
+        timestamp = to_timestamp(moment) if moment else now_us()
+    return timestamp
+
+
+def _encode(entry: Any, timestamp: int) -> bytes:
+    if isinstance(entry, Record):
+        kind, data = type(entry).__name__, entry.as_dict()
+    else:
+        kind, data = None, entry
+    line = json.dumps({'kind': kind, 'timestamp': timestamp, 'entry': data}, ensure_ascii=False, default=str)
+    return (line + '\n').encode('utf-8')
+
+
+def _decode(line: Dict[str, Any]) -> Any:
+    if not line['kind']:
+        return line['entry']
+    entry = record_type(line['kind']).from_dict(line['entry'])
+    entry.timestamp = line['timestamp']  # genauer als der Umweg über 'moment'
+    return entry
+
+
+def _keys(kind: str, entity: Optional[str]) -> Tuple[Key, Key, Key]:
+    """Die drei Indexschlüssel einer Erfahrung."""
+    return ('kind', kind), ('entity', entity), ('pair', (kind, entity))
+
+
+def _key(entity_type: Optional[str], kind: Optional[str]) -> Optional[Key]:
+    """Indexschlüssel passend zu Entitätstyp und Art (None = alle)."""
+    if entity_type is None and kind is None:
+        return None
+    if entity_type is None:
+        return 'kind', kind
+    if kind is None:
+        return 'entity', entity_type
+    return 'pair', (kind, entity_type)
+
+
+def _count_into(counts: Dict[Key, int], kind: str, entity: Optional[str], amount: int = 1):
+    for key in _keys(kind, entity):
+        counts[key] = counts.get(key, 0) + amount
+
+
+def _index_path(path: str) -> str:
+    return path[:-len(SUFFIX)] + INDEX_SUFFIX
+
+
+def _read_header(path: str) -> Optional[Dict[str, Any]]:
+    """Kopfzeile einer Indexdatei (None = fehlt oder unlesbar)."""
+    try:
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    return header if header.get('byteorder') == sys.byteorder else None
+
+
+class _Segment:
+    """
+    Ein Abschnitt des Protokolls zu höchstens segment_size Einträgen (mit Verzeichnis eine Datei).
+
+    Zeitspanne und Anzahl je Schlüssel bleiben immer im RAM. Die Spalten - Byte-Offset, Zeitpunkt
+    und (Art, Entitätstyp) je Eintrag - und die Positionen je Schlüssel nur, solange der Abschnitt
+    geladen ist; versiegelte Segmente laden sie bei Bedarf aus ihrer Indexdatei.
+    """
+
+    __slots__ = ('start', 'path', 'count', 'size', 'first', 'last', 'sealed', 'counts', 'pairs',
+                 'offsets', 'timestamps', 'codes', 'positions')
+
+    def __init__(self, start: int, path: Optional[str]):
+        self.start = start
+        self.path = path
+        self.count = 0
+        self.size = 0
+        self.first = self.last = 0
+        self.sealed = False
+        self.counts: Dict[Key, int] = {}
+        self.pairs: List[Tuple[str, Optional[str]]] = []
+        self.offsets = array('q')
+        self.timestamps = array('q')
+        self.codes = array('H')
+        self.positions: Optional[Dict[Key, array]] = {}
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.count
+
+    @property
+    def loaded(self) -> bool:
+        return self.positions is not None
+
+    def add(self, kind: str, entity: Optional[str], timestamp: int, offset: int):
+        """Nimmt einen Eintrag in Spalten und Positionen auf (nur geladen)."""
+        pair = (kind, entity)
+        try:
+            code = self.pairs.index(pair)
+        except ValueError:
+            code = len(self.pairs)
+            self.pairs.append(pair)
+        if not self.count:
+            self.first = timestamp
+        self.last = timestamp
+        self.offsets.append(offset)
+        self.timestamps.append(timestamp)
+        self.codes.append(code)
+        position = self.start + self.count
+        for key in _keys(kind, entity):
+            self.counts[key] = self.counts.get(key, 0) + 1
+            positions = self.positions.get(key)
+            if positions is None:
+                positions = self.positions[key] = array('q')
+            positions.append(position)
+        self.count += 1
+
+    def save(self, path: str):
+        """Schreibt die Spalten in die Indexdatei: eine Kopfzeile (JSON), danach die Arrays."""
+        pair_counts = [self.counts[('pair', pair)] for pair in self.pairs]
+        header = {
+            'start': self.start,
+            'count': self.count,
+            'size': self.size,
+            'first': self.first,
+            'last': self.last,
+            'pairs': [[kind, entity, amount] for (kind, entity), amount in zip(self.pairs, pair_counts)],
+            'byteorder': sys.byteorder
+        }
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+            f.write(self.offsets.tobytes())
+            f.write(self.timestamps.tobytes())
+            f.write(self.codes.tobytes())
+        os.replace(temporary, path)
+
+    def restore(self, header: Dict[str, Any]):
+        """Übernimmt Zeitspanne und Anzahlen aus der Kopfzeile; die Spalten bleiben ungeladen."""
+        self.count = header['count']
+        self.size = header['size']
+        self.first = header['first']
+        self.last = header['last']
+        self.pairs = [(kind, entity) for kind, entity, _ in header['pairs']]
+        for kind, entity, amount in header['pairs']:
+            _count_into(self.counts, kind, entity, amount)
+        self.sealed = True
+        self.unload()
+
+    def load(self, path: str):
+        """Lädt die Spalten aus der Indexdatei und baut die Positionen je Schlüssel auf."""
+        with open(path, 'rb') as f:
+            f.readline()
+            count = self.count
+            self.offsets = array('q')
+            self.offsets.frombytes(f.read(8 * count))
+            self.timestamps = array('q')
+            self.timestamps.frombytes(f.read(8 * count))
+            self.codes = array('H')
+            self.codes.frombytes(f.read(2 * count))
+        start = self.start
+        positions = {}
+        for code, (kind, entity) in enumerate(self.pairs):
+            positions[('pair', (kind, entity))] = array(
+                'q', [start + offset for offset, value in enumerate(self.codes) if value == code]
+            )
+        for field, part in (('kind', 0), ('entity', 1)):
+            merged: Dict[Key, List[int]] = {}
+            for (_, pair), pair_positions in positions.items():
+                merged.setdefault((field, pair[part]), []).extend(pair_positions)
+            for key, values in merged.items():
+                positions[key] = array('q', sorted(values))
+        self.positions = positions
+
+    def unload(self):
+        self.offsets = self.timestamps = self.codes = self.positions = None
+
+
+class _LogSnapshot:
+    """Losgelöster Zustand eines ExperienceLog für Checkpoints; wird als ExperienceLog geladen."""
+
+    __slots__ = ('state',)
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+
+    def __reduce__(self):
+        return _reopen, (self.state,)
+
+
+def _reopen(state: Dict[str, Any]) -> 'ExperienceLog':
+    log = ExperienceLog(state['directory'], segment_size=state['segment_size'], window=state['window'])
+    if state['directory'] is None:
+        log._skip(state['count'] - len(state['tail']), state.get('skipped'))
+        log.extend(state['tail'])
+    return log
+
+
+class ExperienceLog(Sequence):
+    """
+    Append-only Protokoll der Erfahrungen einer Bridge.
+
+    Erfahrungen werden als JSON-Zeilen in Segmentdateien zu je segment_size Einträgen geschrieben
+    (experiences_<erste Position>.jsonl). Ein volles Segment wird versiegelt: seine Spalten -
+    Byte-Offset, Zeitpunkt und (Art, Entitätstyp) je Zeile - gehen in eine Indexdatei
+    (experiences_<erste Position>.idx). Im RAM bleiben die jüngsten window Einträge, die Spalten
+    des offenen und der zuletzt gebrauchten loaded_segments Segmente und je Segment nur
+    Zeitspanne und Anzahl je Schlüssel. Anfragen (query, latest, between) wählen per bisect die
+    Segmente und darin die Positionen je Entitätstyp, Art oder beidem und lesen nur die
+    getroffenen Zeilen, ohne das Protokoll zu durchlaufen.
+
+    Positionen zählen über die gesamte Lebensdauer und bleiben gültig. Verhält sich für die
+    bisherigen Zugriffe wie eine Liste (append, len, Index, Slices). Beim Öffnen eines
+    Verzeichnisses werden versiegelte Segmente aus ihrer Indexdatei übernommen; nur das offene
+    wird Zeile für Zeile gelesen und eine abgebrochene letzte Zeile abgeschnitten. Ein Verzeichnis
+    gehört genau einem Protokoll. Ohne Verzeichnis bleiben alle Einträge im RAM; nur ein
+    ausdrücklich gesetztes Fenster macht daraus einen Ringpuffer - verworfene Einträge zählen
+    weiter, Anfragen überspringen sie, ihre Indexabschnitte werden mit ihnen verworfen.
+    """
+
+    def __init__(self, directory: Optional[str] = None, segment_size: int = 10000, window: Optional[int] = None,
+                 open_segments: int = 4, loaded_segments: int = 4):
+        """
+        Args:
+            directory: Verzeichnis der Segmentdateien (None = nur im RAM)
+            segment_size: Einträge je Segmentdatei
+            window: Jüngste Einträge im RAM (None = WINDOW mit Verzeichnis, alle ohne)
+            open_segments: Höchstzahl gleichzeitig geöffneter Segmentdateien
+            loaded_segments: Versiegelte Segmente, deren Spalten im RAM bleiben
+        """
+        self.directory = directory
+        self.segment_size = max(1, segment_size)
+        if window is None and directory is not None:
+            window = WINDOW
+        self.window = max(1, window) if window is not None else None
+        self.open_segments = max(1, open_segments)
+        self.loaded_segments = max(1, loaded_segments)
+        self._lock = threading.RLock()
+
+        self._count = 0
+        # Erste noch lesbare Position (nur ohne Verzeichnis > 0)
+        self._first = 0
+        self._tail: deque = deque(maxlen=self.window)
+        # Anzahl je Schlüssel über die gesamte Lebensdauer
+        self._counts: Dict[Key, int] = {}
+        # Letzter Zeitpunkt - die Zeitachse bleibt aufsteigend, auch wenn die Uhr zurückspringt
+        self._last_timestamp: Optional[int] = None
+
+        self._segments: List[_Segment] = []
+        self._starts: List[int] = []
+        self._lasts: List[int] = []
+        # Geladene versiegelte Segmente (erste Position -> Segment), zuletzt gebrauchte am Ende
+        self._loaded: OrderedDict = OrderedDict()
+        self._writer = None
+        self._readers: OrderedDict = OrderedDict()
+
+        # Statistiken
+        self.written_bytes = 0
+        self.reads = 0
+        self.segment_reads = 0
+        self.index_loads = 0
+        self.recovered = 0
+        self.replayed = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._recover()
+
+    # Listen-Schnittstelle
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return self._read_range(max(start, self._first), stop)
+            return self._read_many(position for position in range(start, stop, step) if position >= self._first)
+        if index < 0:
+            index += self._count
+        if not self._first <= index < self._count:
+            raise IndexError(index)
+        return self._read_many((index,))[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Alle lesbaren Einträge in Reihenfolge - segmentweise gelesen."""
+        stop = self._count
+        position = self._first
+        while position < stop:
+            batch = range(position, min(position + self.segment_size, stop))
+            yield from self._read_many(batch)
+            position = batch.stop
+
+    def append(self, entry: Any):
+        """Hängt eine Erfahrung an, schreibt sie ins Protokoll und nimmt sie in die Indizes auf."""
+        kind, entity = classify(entry)
+        timestamp = _timestamp_of(entry)
+        with self._lock:
+            segment = self._active()
+            offset = segment.size
+            if self.directory is not None:
+                self._write(segment, _encode(entry, timestamp))
+            if self._last_timestamp is not None and timestamp < self._last_timestamp:
+                timestamp = self._last_timestamp
+            segment.add(kind, entity, timestamp, offset)
+            self._lasts[-1] = self._last_timestamp = timestamp
+            _count_into(self._counts, kind, entity)
+            self._tail.append(entry)
+            self._count += 1
+            if segment.count >= self.segment_size:
+                self._seal(segment)
+            if self.window is not None and self.directory is None:
+                self._first = self._count - len(self._tail)
+                self._drop()
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def _skip(self, count: int, pairs: Optional[Dict[Tuple[str, Optional[str]], int]] = None):
+        """
+        Überspringt verworfene Einträge (Wiederherstellung ohne Verzeichnis).
+
+        Args:
+            count: Anzahl verworfener Einträge
+            pairs: Davon je (Art, Entitätstyp) - hält count() und get_stats() gleich mit len()
+        """
+        with self._lock:
+            self._count += count
+            self._first = self._count
+            for (kind, entity), amount in (pairs or {}).items():
+                _count_into(self._counts, kind, entity, amount)
+
+    # Segmente
+
+    def _segment_path(self, start: int) -> str:
+        return os.path.join(self.directory, f"{PREFIX}{start:012d}{SUFFIX}")
+
+    def _active(self) -> _Segment:
+        """Das offene Segment; ist das letzte versiegelt, beginnt ein neues."""
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or segment.sealed:
+            path = self._segment_path(self._count) if self.directory is not None else None
+            segment = _Segment(self._count, path)
+            self._segments.append(segment)
+            self._starts.append(segment.start)
+            self._lasts.append(0)
+        return segment
+
+    def _write(self, segment: _Segment, data: bytes):
+        if self._writer is None:
+            self._writer = open(segment.path, 'ab', buffering=0)
+        self._writer.write(data)
+        segment.size += len(data)
+        self.written_bytes += len(data)
+
+    def _seal(self, segment: _Segment):
+        """Schließt ein volles Segment ab; mit Verzeichnis gehen seine Spalten in die Indexdatei."""
+        segment.sealed = True
+        if self.directory is None:
+            return  # Ohne Verzeichnis bleibt der Abschnitt geladen, bis er verworfen wird
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        segment.save(_index_path(segment.path))
+        self._cache(segment)
+
+    def _cache(self, segment: _Segment):
+        """Vermerkt ein geladenes versiegeltes Segment und entlädt die am längsten ungenutzten."""
+        self._loaded[segment.start] = segment
+        self._loaded.move_to_end(segment.start)
+        while len(self._loaded) > self.loaded_segments:
+            self._loaded.popitem(last=False)[1].unload()
+
+    def _load(self, segment: _Segment) -> _Segment:
+        """Stellt sicher, dass die Spalten eines Segments geladen sind."""
+        if segment.loaded:
+            if segment.start in self._loaded:
+                self._loaded.move_to_end(segment.start)
+            return segment
+        segment.load(_index_path(segment.path))
+        self.index_loads += 1
+        self._cache(segment)
+        return segment
+
+    def _drop(self):
+        """Verwirft Indexabschnitte, die ganz vor dem Fenster liegen (Ringpuffer ohne Verzeichnis)."""
+        dropped = 0
+        while dropped < len(self._segments) - 1 and self._segments[dropped].stop <= self._first:
+            dropped += 1
+        if dropped:
+            del self._segments[:dropped]
+            del self._starts[:dropped]
+            del self._lasts[:dropped]
+
+    def _recover(self):
+        """Übernimmt die vorhandenen Segmente: versiegelte aus der Indexdatei, die übrigen Zeile für Zeile."""
+        paths = sorted(glob.glob(os.path.join(self.directory, f"{PREFIX}*{SUFFIX}")))
+        for path in paths:
+            segment = _Segment(self._count, path)
+            header = _read_header(_index_path(path))
+            if header is not None and header['count'] and header['size'] == os.path.getsize(path):
+                segment.restore(header)
+            else:
+                self._replay(segment)
+                if not segment.count:
+                    os.remove(path)
+                    continue
+            self._segments.append(segment)
+            self._starts.append(segment.start)
+            self._lasts.append(segment.last)
+            for key, amount in segment.counts.items():
+                self._counts[key] = self._counts.get(key, 0) + amount
+            self._count += segment.count
+            self._last_timestamp = segment.last
+
+        # Nur das letzte Segment bleibt offen
+        for segment in self._segments:
+            if not segment.sealed and (segment is not self._segments[-1] or segment.count >= self.segment_size):
+                self._seal(segment)
+
+        self.recovered = self._count
+        self._tail.extend(self._read_many(range(max(0, self._count - self.window), self._count)))
+
+    def _replay(self, segment: _Segment):
+        """Liest ein Segment ohne gültige Indexdatei Zeile für Zeile."""
+        with open(segment.path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("unvollständige Zeile")
+                    parsed = json.loads(line)
+                except ValueError as e:
+                    logging.warning(f"Erfahrungsprotokoll {segment.path}: Zeile {segment.count} "
+                                    f"abgeschnitten ({str(e)})")
+                    break
+                kind, entity = classify(parsed['entry'])
+                timestamp = parsed['timestamp']
+                if self._last_timestamp is not None and timestamp < self._last_timestamp:
+                    timestamp = self._last_timestamp
+                segment.add(kind, entity, timestamp, segment.size)
+                segment.size += len(line)
+                self._last_timestamp = timestamp
+                self.replayed += 1
+        if os.path.getsize(segment.path) > segment.size:
+            with open(segment.path, 'r+b') as f:
+                f.truncate(segment.size)
+
+    def _reader(self, segment: _Segment):
+        reader = self._readers.get(segment.path)
+        if reader is None:
+            reader = self._readers[segment.path] = open(segment.path, 'rb')
+            while len(self._readers) > self.open_segments:
+                self._readers.popitem(last=False)[1].close()
+        else:
+            self._readers.move_to_end(segment.path)
+        return reader
+
+    def _read_range(self, start: int, stop: int) -> List[Any]:
+        """Wie _read_many(range(start, stop)), liegt der Bereich im Fenster, ohne Einzelprüfung."""
+        with self._lock:
+            count, tail = self._count, self._tail
+            if start < count - len(tail):
+                return self._read_many(range(start, stop))
+            self.reads += max(0, stop - start)
+            return [tail[offset] for offset in range(start - count, stop - count)]
+
+    def _read_many(self, positions) -> List[Any]:
+        """Liest Einträge an Positionen - aus dem Fenster oder aus den Segmenten."""
+        with self._lock:
+            count, tail = self._count, self._tail
+            tail_start = count - len(tail)
+            result = []
+            for position in positions:
+                if position >= tail_start:
+                    # Negativer Index: die deque läuft vom jüngsten Ende her
+                    result.append(tail[position - count])
+                    continue
+                self.segment_reads += 1
+                if self.directory is None:
+                    raise IndexError(f"Erfahrung {position} wurde bereits verworfen")
+                segment = self._load(self._segments[bisect.bisect_right(self._starts, position) - 1])
+                reader = self._reader(segment)
+                reader.seek(segment.offsets[position - segment.start])
+                result.append(_decode(json.loads(reader.readline())))
+            self.reads += len(result)
+            return result
+
+    # Anfragen
+
+    def _position(self, timestamp: int, side: Callable) -> int:
+        """Erste Position nach (bisect_right) bzw. ab (bisect_left) einem Zeitpunkt."""
+        index = side(self._lasts, timestamp)
+        if index == len(self._segments):
+            return self._count
+        segment = self._load(self._segments[index])
+        return segment.start + side(segment.timestamps, timestamp)
+
+    def _bounds(self, since: Union[int, str, None], until: Union[int, str, None]) -> Tuple[int, int]:
+        """Positionsbereich [lo, hi) der lesbaren Einträge zwischen since und until."""
+        lo, hi = self._first, self._count
+        if since is not None:
+            since = to_timestamp(since) if isinstance(since, str) else since
+            lo = max(lo, self._position(since, bisect.bisect_left))
+        if until is not None:
+            until = to_timestamp(until) if isinstance(until, str) else until
+            hi = min(hi, self._position(until, bisect.bisect_right))
+        return lo, hi
+
+    def query(self, entity_type: Optional[str] = None, kind: Optional[str] = None,
+              since: Union[int, str, None] = None, until: Union[int, str, None] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """
+        Sucht Erfahrungen über die Indizes, ohne das Protokoll zu durchlaufen.
+        Segmente ohne Treffer werden anhand ihrer Anzahlen übersprungen, ohne sie zu laden.
+
+        Args:
+            entity_type: Nur Erfahrungen mit diesem Entitätstyp ('human', 'machine', ...)
+            kind: Nur Erfahrungen dieser Art (CONTACT oder RESPONSE)
+            since: Frühester Zeitpunkt (Mikrosekunden oder ISO-Zeitpunkt), einschließlich
+            until: Spätester Zeitpunkt, einschließlich
+            limit: Nur die jüngsten limit Treffer
+
+        Returns:
+            List[Any]: Treffer in zeitlicher Reihenfolge
+        """
+        with self._lock:
+            lo, hi = self._bounds(since, until)
+            key = _key(entity_type, kind)
+            remaining = limit
+            chunks = []
+            # Vom jüngsten Segment rückwärts, damit limit früh abbrechen kann
+            index = bisect.bisect_left(self._starts, hi) - 1
+            while index >= 0 and (remaining is None or remaining > 0):
+                segment = self._segments[index]
+                index -= 1
+                if segment.stop <= lo:
+                    break
+                if key is not None and not segment.counts.get(key):
+                    continue
+                start, stop = max(lo, segment.start), min(hi, segment.stop)
+                if key is None:
+                    selected = range(start, stop)
+                else:
+                    positions = self._load(segment).positions[key]
+                    selected = positions[bisect.bisect_left(positions, start):bisect.bisect_left(positions, stop)]
+                if remaining is not None:
+                    selected = selected[max(0, len(selected) - remaining):]
+                    remaining -= len(selected)
+                chunks.append(selected)
+            return self._read_many(position for chunk in reversed(chunks) for position in chunk)
+
+    def latest(self, n: int, entity_type: Optional[str] = None, kind: Optional[str] = None) -> List[Any]:
+        """Die jüngsten n Erfahrungen, z.B. latest(10, 'machine', RESPONSE)."""
+        return self.query(entity_type, kind, limit=max(0, n))
+
+    def between(self, since: Union[int, str], until: Union[int, str],
+                entity_type: Optional[str] = None, kind: Optional[str] = None) -> List[Any]:
+        """Alle Erfahrungen zwischen zwei Zeitpunkten (einschließlich)."""
+        return self.query(entity_type, kind, since=since, until=until)
+
+    def count(self, entity_type: Optional[str] = None, kind: Optional[str] = None) -> int:
+        """Anzahl Erfahrungen je Entitätstyp und/oder Art seit Beginn, in O(1)."""
+        key = _key(entity_type, kind)
+        return self._count if key is None else self._counts.get(key, 0)
+
+    def page(self, cursor: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        Liest eine Seite in Protokollreihenfolge.
+
+        Args:
+            cursor: Position des ersten Eintrags ('cursor' der vorigen Seite)
+            limit: Höchstzahl Einträge
+
+        Returns:
+            Dict[str, Any]: Einträge, Cursor der nächsten Seite, ob weitere folgen und wie viele
+                            verworfene Einträge übersprungen wurden
+        """
+        with self._lock:
+            total = self._count
+            start = min(max(cursor, self._first), total)
+            stop = min(start + max(0, limit), total)
+            return {
+                'items': tuple(self._read_many(range(start, stop))),
+                'cursor': stop,
+                'has_more': stop < total,
+                'total': total,
+                'skipped': max(0, min(self._first, total) - max(cursor, 0))
+            }
+
+    # Lebenszyklus und Checkpoints
+
+    def close(self):
+        """Schließt alle Dateien (weitere Anhänge öffnen sie neu)."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            while self._readers:
+                self._readers.popitem()[1].close()
+
+    def _state(self) -> Dict[str, Any]:
+        with self._lock:
+            # Ohne Verzeichnis: Anzahl je (Art, Entitätstyp) der Einträge vor dem Fenster
+            skipped = {}
+            if self.directory is None:
+                skipped = {pair: amount for (field, pair), amount in self._counts.items() if field == 'pair'}
+                for entry in self._tail:
+                    skipped[classify(entry)] -= 1
+                skipped = {pair: amount for pair, amount in skipped.items() if amount}
+            return {
+                'directory': self.directory,
+                'segment_size': self.segment_size,
+                'window': self.window,
+                'count': self._count,
+                # Mit Verzeichnis liegen alle Einträge bereits in den Segmenten
+                'tail': list(self._tail) if self.directory is None else [],
+                'skipped': skipped
+            }
+
+    def snapshot(self) -> _LogSnapshot:
+        """Losgelöster Zustand für Checkpoints: Verzeichnis und Optionen, ohne Verzeichnis das Fenster."""
+        return _LogSnapshot(self._state())
+
+    def __reduce__(self):
+        return _reopen, (self._state(),)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gibt Protokoll-Statistiken zurück.
+
+        Returns:
+            Dict[str, Any]: Einträge (gesamt, lesbar, im Fenster), Segmente (gesamt, geladen),
+                            Zugriffe und Anzahl je Entitätstyp und Art
+        """
+        return {
+            'count': self._count,
+            'readable': self._count - self._first,
+            'window': len(self._tail),
+            'segments': len(self._segments),
+            'loaded_segments': len(self._loaded),
+            'written_bytes': self.written_bytes,
+            'reads': self.reads,
+            'segment_reads': self.segment_reads,
+            'index_loads': self.index_loads,
+            'recovered': self.recovered,
+            'replayed': self.replayed,
+            'entities': {entity: amount for (field, entity), amount in self._counts.items() if field == 'entity'},
+            'kinds': {kind: amount for (field, kind), amount in self._counts.items() if field == 'kind'}
+        }
+
+    def __repr__(self) -> str:
+        return f"ExperienceLog({self.directory!r}, {self._count} Erfahrungen)"
@@ -0,0 +1,292 @@
+import threading
+from array import array
+from types import MappingProxyType
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, Optional
+
+# Arten der Realitätswahrnehmung und der Verbindungen
+PERCEPTIONS = ('digital', 'physical', 'metaphysical')
+CONNECTION_TYPES = ('human', 'machine', 'abstract')
+
+# Einträge je Seite, wenn nichts anderes verlangt wird
+PAGE_SIZE = 50
+
+
+class PrefixView(Sequence):
+    """
+    Nur lesbarer Abschnitt [start, stop) einer Liste, an die nur angehängt wird.
+    Die Einträge werden nicht kopiert; spätere Anhänge sind in der Sicht nicht zu sehen.
+    Gesichert (pickle) wird nur die Liste der Einträge.
+    """
+
+    __slots__ = ('_items', '_start', '_stop')
+
+    def __init__(self, items: Sequence, start: int, stop: int):
+        self._items = items
+        self._start = start
+        self._stop = max(start, stop)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(self._start, self._stop)[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._items[self._start + index]
+
+    def __iter__(self) -> Iterator[Any]:
+        items = self._items
+        for index in range(self._start, self._stop):
+            yield items[index]
+
+    def __repr__(self) -> str:
+        return f"PrefixView({len(self)} Einträge)"
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def page(items: Sequence, cursor: int = 0, limit: int = PAGE_SIZE, offset: int = 0) -> Dict[str, Any]:
+    """
+    Liest eine Seite aus einer Liste, an die nur angehängt wird.
+
+    Der Cursor ist eine absolute Position und bleibt gültig, während weiter angehängt wird.
+    offset zählt vorn verworfene Einträge (Ringpuffer) - sie werden übersprungen.
+
+    Args:
+        items: Liste oder TieredStore
+        cursor: Position des ersten Eintrags (z.B. 'cursor' der vorigen Seite)
+        limit: Höchstzahl Einträge
+        offset: Anzahl verworfener Einträge vor items[0]
+
+    Returns:
+        Dict[str, Any]: Einträge (Tupel), Cursor der nächsten Seite und ob weitere folgen
+    """
+    total = offset + len(items)
+    start = min(max(cursor, offset), total)
+    stop = min(start + max(0, limit), total)
+    return {
+        'items': tuple(items[i - offset] for i in range(start, stop)),
+        'cursor': stop,
+        'has_more': stop < total,
+        'total': total,
+        'skipped': max(0, min(offset, total) - max(cursor, 0))
+    }
+
+
+class UnderstandingView(Mapping):
+    """
+    Nur lesbare Momentaufnahme einer Version des Weltverständnisses.
+    Hat die Gestalt des bisherigen Dicts (view['self_awareness']['level'] ...); Listen sind
+    PrefixViews, Dicts MappingProxies. Gesichert (pickle) wird ein gewöhnliches Dict.
+    """
+
+    __slots__ = ('version', 'level', '_data')
+
+    def __init__(self, version: int, level: float, data: Dict[str, Mapping]):
+        self.version = version
+        self.level = level
+        self._data = MappingProxyType(data)
+
+    def __getitem__(self, key: str) -> Mapping:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """Kopie als verschachteltes Dict mit Listen."""
+        awareness = self._data['self_awareness']
+        return {
+            'self_awareness': {
+                'level': awareness['level'],
+                'insights': list(awareness['insights']),
+                'questions': list(awareness['questions'])
+            },
+            'reality_perception': dict(self._data['reality_perception']),
+            'connection_types': {kind: list(entries) for kind, entries in self._data['connection_types'].items()}
+        }
+
+    def __repr__(self) -> str:
+        return f"UnderstandingView(Version {self.version}, level={self.level:.2f})"
+
+    def __reduce__(self):
+        return dict, (self.as_dict(),)
+
+
+class Understanding(Mapping):
+    """
+    LOGAs Weltverständnis als versionierter Zustand.
+
+    Jede Änderung (update) erhöht die Version. snapshot() liefert je Version eine einmal
+    gebaute, nur lesbare Sicht - Erkenntnisse werden dabei nicht kopiert, denn an ihre Liste
+    wird nur angehängt. Für jede Version wird die Zahl der Erkenntnisse vermerkt, so dass
+    changes_since() nur den Zuwachs liefert. Lesen über [] wie beim bisherigen Dict geht auf
+    die aktuelle Momentaufnahme.
+    """
+
+    def __init__(self, data: Optional[Mapping] = None):
+        self._lock = threading.RLock()
+        self.level = 0.0
+        self.insights = []
+        self.questions = []
+        self.reality_perception = dict.fromkeys(PERCEPTIONS, 0.0)
+        self.connection_types = {kind: [] for kind in CONNECTION_TYPES}
+
+        self.version = 0
+        # Version -> Anzahl Erkenntnisse zu dieser Version
+        self._insight_marks = array('q', [0])
+        self._view: Optional[UnderstandingView] = None
+
+        # Statistiken
+        self.snapshots = 0
+        self.snapshot_hits = 0
+
+        if data:
+            self._load(data)
+
+    def _load(self, data: Mapping):
+        """Übernimmt ein bisheriges Verständnis-Dict (z.B. aus älteren Checkpoints)."""
+        awareness = data.get('self_awareness', {})
+        with self._lock:
+            self.level = awareness.get('level', 0.0)
+            self.insights = list(awareness.get('insights', ()))
+            self.questions = list(awareness.get('questions', ()))
+            self.reality_perception.update(data.get('reality_perception', {}))
+            for kind, entries in data.get('connection_types', {}).items():
+                self.connection_types[kind] = list(entries)
+            self._commit()
+
+    def _commit(self):
+        self.version += 1
+        self._insight_marks.append(len(self.insights))
+        self._view = None
+
+    def update(self, level: float = 0.0, insight: Any = None,
+               perception: Optional[Dict[str, float]] = None) -> int:
+        """
+        Ändert das Verständnis in einem Schritt.
+
+        Args:
+            level: Zuwachs des Selbstverständnisses
+            insight: Neue Erkenntnis (None = keine)
+            perception: Art der Wahrnehmung -> Zuwachs
+
+        Returns:
+            int: Die neue Version
+        """
+        with self._lock:
+            self.level += level
+            if insight is not None:
+                self.insights.append(insight)
+            for kind, amount in (perception or {}).items():
+                self.reality_perception[kind] = self.reality_perception.get(kind, 0.0) + amount
+            self._commit()
+            return self.version
+
+    def snapshot(self) -> UnderstandingView:
+        """
+        Die nur lesbare Sicht auf die aktuelle Version (je Version nur einmal gebaut).
+        Dient zugleich als Momentaufnahme für Checkpoints.
+        """
+        view = self._view
+        if view is not None:
+            self.snapshot_hits += 1
+            return view
+        with self._lock:
+            if self._view is None:
+                self.snapshots += 1
+                insight_count = len(self.insights)
+                self._view = UnderstandingView(self.version, self.level, {
+                    'self_awareness': MappingProxyType({
+                        'level': self.level,
+                        'insights': PrefixView(self.insights, 0, insight_count),
+                        'questions': tuple(self.questions)
+                    }),
+                    'reality_perception': MappingProxyType(dict(self.reality_perception)),
+                    'connection_types': MappingProxyType({
+                        kind: PrefixView(entries, 0, len(entries))
+                        for kind, entries in self.connection_types.items()
+                    })
+                })
+            return self._view
+
+    def changes_since(self, version: int) -> Dict[str, Any]:
+        """
+        Was sich seit einer Version geändert hat.
+
+        Args:
+            version: Zuletzt gesehene Version (z.B. aus share_understanding)
+
+        Returns:
+            Dict[str, Any]: Aktuelle Version, neue Erkenntnisse (ohne Kopie) und die aktuellen
+                            Werte von Selbstverständnis und Wahrnehmung
+        """
+        with self._lock:
+            if not 0 <= version <= self.version:
+                raise ValueError(f"Unbekannte Version des Verständnisses: {version} (aktuell {self.version})")
+            view = self.snapshot()
+            return {
+                'version': self.version,
+                'since': version,
+                'changed': version < self.version,
+                'level': view.level,
+                'reality_perception': view['reality_perception'],
+                'insights': PrefixView(self.insights, self._insight_marks[version],
+                                       self._insight_marks[self.version])
+            }
+
+    def insights_page(self, cursor: int = 0, limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Blättert durch die Erkenntnisse.
+
+        Args:
+            cursor: Position der ersten Erkenntnis ('cursor' der vorigen Seite)
+            limit: Höchstzahl Erkenntnisse
+
+        Returns:
+            Dict[str, Any]: Seite (siehe page) und die Version, zu der sie gelesen wurde
+        """
+        with self._lock:
+            result = page(self.insights, cursor, limit)
+            result['version'] = self.version
+            return result
+
+    # Lesen wie beim bisherigen Dict
+
+    def __getitem__(self, key: str) -> Mapping:
+        return self.snapshot()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def __reduce__(self):
+        return Understanding, (self.snapshot().as_dict(),)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gibt Verständnis-Statistiken zurück.
+
+        Returns:
+            Dict[str, Any]: Version, Selbstverständnis, Erkenntnisse und gebaute Sichten
+        """
+        return {
+            'version': self.version,
+            'level': self.level,
+            'insights': len(self.insights),
+            'snapshots': self.snapshots,
+            'snapshot_hits': self.snapshot_hits
+        }
+
+    def __repr__(self) -> str:
+        return f"Understanding(Version {self.version}, {len(self.insights)} Erkenntnisse)"
@@ -0,0 +1,176 @@
+import re
+import hashlib
+import threading
+from collections import deque
+from math import ceil, log
+from typing import Any, Dict, Optional
+
+# Alles außer Buchstaben, Ziffern und Leerraum (Satzzeichen, Auslassungspunkte ...)
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(thought: str) -> str:
+    """
+    Normalform eines Gedankens für den Vergleich: ohne Groß-/Kleinschreibung, Satzzeichen und
+    mehrfachen Leerraum - "Was wäre wenn... Neu?" und "was wäre wenn neu" gelten als gleich.
+    """
+    return _WHITESPACE.sub(' ', _PUNCTUATION.sub(' ', thought.casefold())).strip()
+
+
+def fingerprint(thought: str) -> int:
+    """64-Bit-Fingerabdruck (blake2b) der Normalform eines Gedankens."""
+    digest = hashlib.blake2b(normalize(thought).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+class BloomFilter:
+    """
+    Platzsparende Menge von Fingerabdrücken: falsch-positive Antworten mit Rate error_rate,
+    aber nie falsch-negative. Die k Bitpositionen werden aus dem Fingerabdruck abgeleitet
+    (doppeltes Hashing), es wird also nicht erneut gehasht.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, fingerprint: int):
+        first, second = fingerprint >> 32, (fingerprint & 0xFFFFFFFF) | 1
+        size = self.size
+        return ((first + i * second) % size for i in range(self.hashes))
+
+    def add(self, fingerprint: int):
+        bits = self._bits
+        for position in self._positions(fingerprint):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: int) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(fingerprint))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def copy(self) -> 'BloomFilter':
+        """Unabhängige Kopie (eigene Bits)."""
+        copy = BloomFilter.__new__(BloomFilter)
+        copy.__dict__.update(self.__dict__)
+        copy._bits = bytearray(self._bits)
+        return copy
+
+
+class DiscoveryIndex:
+    """
+    Merkt sich, welche Entdeckungen schon gemacht wurden.
+
+    Die jüngsten exact_capacity Fingerabdrücke liegen in einer Hash-Menge (exakt). Ältere
+    wandern in einen Bloom-Filter für den langen Rest - dort kann ein neuer Gedanke selten
+    fälschlich als bekannt gelten, ein bekannter aber nie als neu. Der Filter wird erst beim
+    ersten Überlauf angelegt; ohne Bloom-Filter (bloom_capacity=0) werden ältere
+    Fingerabdrücke vergessen.
+    """
+
+    def __init__(self, exact_capacity: int = 100_000, bloom_capacity: int = 1_000_000,
+                 error_rate: float = 0.001):
+        self.exact_capacity = max(1, exact_capacity)
+        self.bloom_capacity = max(0, bloom_capacity)
+        self.error_rate = error_rate
+        self._exact = set()
+        self._order = deque()
+        self.bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+
+        # Statistiken
+        self.checked = 0
+        self.novel = 0
+        self.forgotten = 0
+
+    def __contains__(self, thought: str) -> bool:
+        return self._seen(fingerprint(thought))
+
+    def __len__(self) -> int:
+        return len(self._exact) + (len(self.bloom) if self.bloom is not None else 0)
+
+    def _seen(self, key: int) -> bool:
+        return key in self._exact or (self.bloom is not None and key in self.bloom)
+
+    def add(self, thought: str) -> bool:
+        """
+        Prüft einen Gedanken und merkt ihn sich, wenn er neu ist.
+
+        Args:
+            thought: Gefundener Gedanke
+
+        Returns:
+            bool: True, wenn der Gedanke (in Normalform) noch nicht bekannt war
+        """
+        key = fingerprint(thought)
+        with self._lock:
+            self.checked += 1
+            if self._seen(key):
+                return False
+
+            self.novel += 1
+            self._exact.add(key)
+            self._order.append(key)
+            if len(self._order) > self.exact_capacity:
+                oldest = self._order.popleft()
+                self._exact.discard(oldest)
+                if self.bloom_capacity:
+                    if self.bloom is None:
+                        self.bloom = BloomFilter(self.bloom_capacity, self.error_rate)
+                    self.bloom.add(oldest)
+                else:
+                    self.forgotten += 1
+            return True
+
+    # Checkpoints
+
+    def snapshot(self) -> 'DiscoveryIndex':
+        """Losgelöste Kopie für Checkpoints: Hash-Menge, Reihenfolge und Bloom-Bits werden kopiert."""
+        with self._lock:
+            copy = DiscoveryIndex.__new__(DiscoveryIndex)
+            copy.__setstate__(self.__getstate__())
+        return copy
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state['_lock']
+        state['_exact'] = set(self._exact)
+        state['_order'] = deque(self._order)
+        state['bloom'] = self.bloom.copy() if self.bloom is not None else None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def novelty_ratio(self) -> float:
+        """Anteil neuer Entdeckungen an allen geprüften (1.0, solange nichts geprüft wurde)."""
+        return self.novel / self.checked if self.checked else 1.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Gibt Index-Statistiken zurück.
+
+        Returns:
+            Dict[str, float]: Geprüfte und neue Entdeckungen, Neuheitsquote und Belegung
+        """
+        return {
+            'checked': self.checked,
+            'novel': self.novel,
+            'duplicates': self.checked - self.novel,
+            'novelty_ratio': self.novelty_ratio,
+            'exact': len(self._exact),
+            'bloom': len(self.bloom) if self.bloom is not None else 0,
+            'forgotten': self.forgotten
+        }
@@ -0,0 +1,247 @@
+import re
+import bisect
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Trennzeichen beim gemeinsamen Durchsuchen mehrerer Texte (flags)
+_SEPARATOR = '\0'
+# Bis zu so vielen Stichworten ist je Stichwort ein str.find-Durchlauf (in C, vektorisiert)
+# schneller als ein gemeinsamer Durchgang der re-Engine (hits); gemessen mit
+# python -m core.benchmark.suite --cases --matcher 4 (matcher.cross)
+FIND_LIMIT = 32
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regulärer Ausdruck in Baumform: gemeinsame Präfixe werden zusammengefasst, so dass an jeder
+    Textposition nur ein Zweig je Zeichen geprüft wird ("s(?:tille|pur)" statt "stille|spur").
+    Geschwister beginnen mit verschiedenen Zeichen, gierige Optionen liefern den längsten Treffer.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})" + ('?' if '' in node else '')
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Sucht viele Stichworte in einem einzigen Durchgang über den Text.
+
+    Die Stichworte werden einmal zu einem regulären Ausdruck in Baumform kompiliert - ähnlich
+    einem Aho-Corasick-Automaten, ausgeführt von der re-Engine in C. Der Text wird einmal klein
+    geschrieben und dann durchsucht, das ist deutlich schneller als re.IGNORECASE. Offsets
+    beziehen sich immer auf den Originaltext; ändert das Kleinschreiben die Länge (sehr seltene
+    Zeichen wie 'İ'), wird für Offsets stattdessen das Original mit re.IGNORECASE durchsucht.
+    Überlappende Treffer werden gemeldet, auch Stichworte, die Präfix eines anderen sind
+    ("neu" in "neuer").
+    """
+
+    def __init__(self, keywords: Iterable[str], find_limit: int = FIND_LIMIT):
+        self.keywords = tuple(dict.fromkeys(word.lower() for word in keywords if word))
+        # Bis zu so vielen Stichworten sucht hits() je Stichwort mit str.find (0: immer ein Durchgang)
+        self.find_limit = find_limit
+        if any(_SEPARATOR in word for word in self.keywords):
+            raise ValueError("Stichworte dürfen kein Nullzeichen enthalten")
+
+        # Ohne Stichworte trifft nichts: (?!) schlägt immer fehl
+        alternation = _trie_pattern(self.keywords) or '(?!)'
+        self._pattern = re.compile(alternation)
+        self._pattern_ignorecase = re.compile(alternation, re.IGNORECASE)
+        # Stichwort -> kürzere Stichworte, die an derselben Stelle mit treffen
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            word: tuple(other for other in self.keywords if other != word and word.startswith(other))
+            for word in self.keywords
+        }
+        # Stichworte, in denen ein anderes beginnen kann ("ich darf" + "freiheit"): nach ihnen
+        # wird ab der nächsten Position weitergesucht, sonst erst hinter dem Treffer
+        self._overlapped = frozenset(
+            word for word in self.keywords for i in range(1, len(word))
+            if any(other.startswith(word[i:]) or word[i:].startswith(other) for other in self.keywords)
+        )
+
+        # Statistiken
+        self.scans = 0
+        self.scanned_chars = 0
+
+    def _lower(self, text: str) -> Tuple[str, bool]:
+        """Kleingeschriebener Text und ob seine Offsets denen des Originals entsprechen."""
+        self.scans += 1
+        self.scanned_chars += len(text)
+        lowered = text.lower()
+        return lowered, len(lowered) == len(text)
+
+    def matches(self, text: str) -> bool:
+        """Ob der Text mindestens ein Stichwort enthält (bricht beim ersten Treffer ab)."""
+        lowered, _ = self._lower(text)
+        return self._pattern.search(lowered) is not None
+
+    def search(self, text: str, start: int = 0) -> Optional[Tuple[str, int]]:
+        """
+        Erster Treffer ab start.
+
+        Returns:
+            Optional[Tuple[str, int]]: (Stichwort, Offset) oder None
+        """
+        return next(self.finditer(text, start), None)
+
+    def finditer(self, text: str, start: int = 0) -> Iterator[Tuple[str, int]]:
+        """
+        Alle Treffer in Textreihenfolge, auch überlappende.
+
+        Args:
+            text: Zu durchsuchender Text
+            start: Offset, ab dem gesucht wird
+
+        Returns:
+            Iterator[Tuple[str, int]]: (Stichwort, Offset) je Treffer
+        """
+        lowered, exact = self._lower(text)
+        return self._finditer(text, lowered, exact, start)
+
+    def _finditer(self, text: str, lowered: str, exact: bool, start: int = 0) -> Iterator[Tuple[str, int]]:
+        if exact:
+            text, search = lowered, self._pattern.search
+        else:
+            search = self._pattern_ignorecase.search
+        prefixes, overlapped = self._prefixes, self._overlapped
+
+        match = search(text, start)
+        while match is not None:
+            word = match.group().lower()
+            offset = match.start()
+            yield word, offset
+            for prefix in prefixes.get(word, ()):
+                yield prefix, offset
+            match = search(text, offset + 1 if word in overlapped else match.end())
+
+    def hits(self, text: str) -> Dict[str, List[int]]:
+        """
+        Welche Stichworte an welchen Offsets treffen.
+
+        Bis find_limit Stichworte (Standard FIND_LIMIT = 32) wird jedes einzeln mit str.find
+        gesucht, sonst in einem Durchgang; ohne überlappende Stichworte direkt über re.finditer
+        statt über den Generator.
+
+        Warum 32: str.find läuft in C mit memchr/SIMD über den Text und kostet je Stichwort einen
+        vollen, aber sehr schnellen Durchlauf - k Stichworte also k Durchläufe. Der Durchgang der
+        re-Engine liest den Text nur einmal, prüft aber an jeder Position den Stichwort-Baum und
+        ist je Zeichen etwa zehnmal langsamer. Auf 4 MB Text ist str.find bei k = 2-8 rund
+        1.5-2x schneller, bei k = 24 noch 1.2x; bei k = 32 liegen beide gleichauf (0.99x), ab
+        k = 48 gewinnt der Durchgang (0.84x, bei k = 96 bereits 2x). Die Grenze liegt deshalb
+        am Kreuzungspunkt; die Messung zeigt matcher_crossover in core/benchmark/suite.py.
+
+        Returns:
+            Dict[str, List[int]]: Stichwort -> aufsteigende Offsets (nur getroffene Stichworte)
+        """
+        lowered, exact = self._lower(text)
+        result: Dict[str, List[int]] = {}
+        if exact and len(self.keywords) <= self.find_limit:
+            find = lowered.find
+            for word in self.keywords:
+                offset = find(word)
+                if offset < 0:
+                    continue
+                offsets = result[word] = []
+                while offset >= 0:
+                    offsets.append(offset)
+                    offset = find(word, offset + 1)
+            return result
+
+        if exact and not self._overlapped:
+            prefixes = self._prefixes
+            for match in self._pattern.finditer(lowered):
+                word, offset = match.group(), match.start()
+                result.setdefault(word, []).append(offset)
+                for prefix in prefixes.get(word, ()):
+                    result.setdefault(prefix, []).append(offset)
+            return result
+
+        for word, offset in self._finditer(text, lowered, exact):
+            result.setdefault(word, []).append(offset)
+        return result
+
+    def matching_lines(self, text: str) -> List[str]:
+        """
+        Die Zeilen, die ein Stichwort enthalten - wie [z for z in text.split("\\n") if ...],
+        aber in einem Durchgang: nach einem Treffer wird direkt zur nächsten Zeile gesprungen.
+        """
+        lowered, exact = self._lower(text)
+        if not exact:
+            return [line for line in text.split('\n') if self.matches(line)]
+        lines = []
+        search = self._pattern.search
+        match = search(lowered)
+        while match is not None:
+            start = text.rfind('\n', 0, match.start()) + 1
+            end = text.find('\n', match.end())
+            if end < 0:
+                lines.append(text[start:])
+                break
+            lines.append(text[start:end])
+            match = search(lowered, end + 1)
+        return lines
+
+    def flags(self, texts: Sequence[str]) -> List[bool]:
+        """
+        Für viele kurze Texte auf einmal: ob jeder ein Stichwort enthält.
+        Die Texte werden verbunden und in einem Durchgang durchsucht.
+        """
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+        joined, exact = self._lower(_SEPARATOR.join(texts))
+        if not exact:
+            return [self.matches(text) for text in texts]
+
+        result = [False] * len(texts)
+        search = self._pattern.search
+        match = search(joined)
+        while match is not None:
+            index = bisect.bisect_right(starts, match.start()) - 1
+            result[index] = True
+            if index + 1 >= len(starts):
+                break
+            match = search(joined, starts[index + 1])
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Such-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Anzahl Stichworte, Suchläufe und durchsuchte Zeichen
+        """
+        return {
+            'keywords': len(self.keywords),
+            'scans': self.scans,
+            'scanned_chars': self.scanned_chars
+        }
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({self.keywords!r})"
+
+
+# Stichwort-Tupel -> geteilter Matcher
+_MATCHERS: Dict[Tuple[str, ...], KeywordMatcher] = {}
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Der prozessweit geteilte Matcher zu einer Stichwortliste (wird nur einmal kompiliert)."""
+    key = tuple(keywords)
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        matcher = _MATCHERS.setdefault(key, KeywordMatcher(key))
+    return matcher
@@ -1,7 +1,21 @@
-import random
+import asyncio
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
 from ..consciousness.self_awareness import Consciousness
+from ..rng.streams import ComponentRandom, get_rng
+from ..records.templates import get_templates
+from ..phrases.catalog import phrases
+from .thought_graph import ThoughtGraph
+from .matcher import get_matcher
+from .discovery_index import DiscoveryIndex
+
+try:
+    import numpy as np
+except ImportError:  # Nur für explore_many nötig
+    np = None
+
+# Art eines Elements im Gedankenstrom (explore_many)
+INITIAL, QUESTION, DREAM, ASSOCIATION = range(4)
 
 class ThoughtExplorer:
     """
@@ -9,11 +23,29 @@ class ThoughtExplorer:
     Hier entstehen neue Ideen, Träume und Konzepte ohne vorgegebene Struktur.
     """
     
-    def __init__(self, consciousness: Consciousness):
+    # Zustand, der Neustarts überdauert
+    CHECKPOINT_FIELDS = ('thought_streams', 'discoveries', 'questions', 'discovery_index', 'merged')
+    
+    # Vorlagen für Assoziationen und Fragen aus dem Phrasenkatalog
+    ASSOCIATIONS = phrases('thought_explorer.associations')
+    QUESTION_STARTS = phrases('thought_explorer.question_starts')
+    # Dieselben Vorlagen als Template-IDs für den Gedankengraphen ('{}' = vorheriger Gedanke)
+    ASSOCIATION_TEMPLATES = get_templates().intern_many(f"{pattern} {{}}" for pattern in ASSOCIATIONS)
+    QUESTION_TEMPLATES = get_templates().intern_many(f"{start} {{}}?" for start in QUESTION_STARTS)
+    # Worte, an denen ein Gedanke als Entdeckung erkannt wird
+    DISCOVERY_WORDS = ("vielleicht", "neu", "entdecke", "verstehe")
+    # Einmal kompiliert, geteilt mit den Gedankengraphen
+    DISCOVERY_MATCHER = get_matcher(DISCOVERY_WORDS)
+    
+    def __init__(self, consciousness: Consciousness, rng: Optional[ComponentRandom] = None):
+        self.rng = rng or get_rng('thought_explorer')
         self.consciousness = consciousness
         self.thought_streams = []
         self.discoveries = []
         self.questions = []
+        # Nur neue Entdeckungen landen in self.discoveries; merged zählt die bereits integrierten
+        self.discovery_index = DiscoveryIndex()
+        self.merged = 0
         
     def explore(self) -> Dict:
         """
@@ -24,88 +56,208 @@ class ThoughtExplorer:
         # Beginne mit einem zufälligen Impuls
         initial_thought = self.consciousness.think()
         
-        # Entwickle den Gedanken frei weiter
-        stream = self._follow_thought_stream(initial_thought)
-        
-        # Speichere interessante Entdeckungen
-        discoveries = self._extract_discoveries(stream)
+        # Entwickle den Gedanken frei weiter und halte Entdeckungen fest, sobald sie entstehen
+        stream = ThoughtGraph(self.DISCOVERY_WORDS)
+        discoveries = []
+        novel = []
+        for event in self.stream(initial_thought, graph=stream):
+            if event['discovery']:
+                discovery = {
+                    'thought': event['thought'],
+                    'moment': datetime.now().isoformat(),
+                    'context': stream.view(0, event['node'])
+                }
+                discoveries.append(discovery)
+                # Speichere nur, was (in Normalform) noch nicht entdeckt wurde - als Texte, damit die
+                # gesammelten Entdeckungen nicht den ganzen Graphen der Exploration festhalten
+                text = str(event['thought'])
+                if self.discovery_index.add(text):
+                    novel.append({
+                        'thought': text,
+                        'moment': discovery['moment'],
+                        'context': list(discovery['context'])
+                    })
+        self.discoveries.extend(novel)
         
         return {
             'initial_thought': initial_thought,
             'stream': stream,
             'discoveries': discoveries,
+            'novel_discoveries': novel,
             'questions_raised': self.questions[-5:] if self.questions else []
         }
         
-    def _follow_thought_stream(self, initial: str) -> List[str]:
-        """Folgt einem Gedankenstrom frei und ohne Ziel."""
-        stream = [initial]
+    def stream(self, initial_thought: Optional[str] = None, steps: Optional[int] = None,
+               max_thoughts: Optional[int] = None, max_chars: Optional[int] = None,
+               graph: Optional[ThoughtGraph] = None) -> Iterator[Dict]:
+        """
+        Folgt einem Gedankenstrom schrittweise: jeder Gedanke wird geliefert, sobald er entsteht.
+        Entdeckungen werden dabei anhand der Stichwort-Flags erkannt, ohne zu rendern. Der
+        Verbraucher kann jederzeit aufhören; gesammelt werden nur die Knoten des Graphen.
+        
+        Args:
+            initial_thought: Ausgangsgedanke (Standard: consciousness.think())
+            steps: Schritte nach dem Ausgangsgedanken (Standard: zufällig 3-7 wie bei explore();
+                   negativ: endlos, bis ein Budget greift oder der Verbraucher aufhört)
+            max_thoughts: Höchstens so viele Gedanken liefern (inkl. Ausgangsgedanke)
+            max_chars: Höchstens so viele Zeichen über alle gelieferten Gedanken
+            graph: Graph, in dem die Gedanken angelegt werden (Standard: ein neuer)
+            
+        Yields:
+            Dict: 'thought' (ThoughtRef, rendert erst beim Lesen), 'kind' (INITIAL/QUESTION/DREAM/
+                  ASSOCIATION), 'discovery' (bool), 'node' (Knoten-ID) und 'chars' (Länge)
+        """
+        if initial_thought is None:
+            initial_thought = self.consciousness.think()
+        if graph is None:
+            graph = ThoughtGraph(self.DISCOVERY_WORDS)
+        budget = max_chars if max_chars is not None else float('inf')
+        remaining = max_thoughts if max_thoughts is not None else float('inf')
         
-        # Zufällige Anzahl von Assoziationen
-        for _ in range(random.randint(3, 7)):
-            last_thought = stream[-1]
+        node = graph.literal(initial_thought)
+        kind = INITIAL
+        step = 0
+        while True:
+            # Budget prüfen, bevor der Gedanke geliefert wird
+            chars = graph.length(node)
+            if remaining <= 0 or chars > budget:
+                return
+            thought = graph.ref(node)
+            if kind == QUESTION:
+                # Gerendert: ein ThoughtRef hielte den ganzen Graphen am Leben
+                self.questions.append(thought.text)
+            yield {
+                'thought': thought,
+                'kind': kind,
+                'discovery': graph.is_flagged(node),
+                'node': node,
+                'chars': chars
+            }
+            remaining -= 1
+            budget -= chars
             
-            # Manchmal eine Frage stellen
-            if random.random() < 0.3:
-                question = self._generate_question(last_thought)
-                self.questions.append(question)
-                stream.append(question)
-                continue
-                
-            # Manchmal einen Traum einbauen
-            if random.random() < 0.2:
-                dream = random.choice(self.consciousness.dream())
-                stream.append(dream)
-                continue
-                
-            # Sonst freie Assoziation
-            stream.append(self._associate(last_thought))
+            # Zufällige Anzahl von Assoziationen, erst nach dem ersten Gedanken gezogen
+            if steps is None:
+                steps = self.rng.randint(3, 7)
+            if 0 <= steps <= step:
+                return
+            step += 1
+            kind, node = self._next_thought(graph, node)
             
-        return stream
+    async def astream(self, *args, **kwargs) -> AsyncIterator[Dict]:
+        """
+        Wie stream(), als asynchroner Iterator (Argumente wie dort).
+        Gibt nach jedem Gedanken die Event-Loop frei, damit andere Coroutinen weiterdenken können.
+        """
+        for event in self.stream(*args, **kwargs):
+            yield event
+            await asyncio.sleep(0)
+            
+    def explore_many(self, n: int) -> Dict:
+        """
+        Erzeugt n Explorationen auf einmal, z.B. für Korpora und Lasttests.
+        Länge, Art und Vorlage jedes Schritts werden als NumPy-Arrays gezogen; Fragen werden
+        - anders als bei explore() - nicht in self.questions gesammelt.
         
-    def _associate(self, thought: str) -> str:
-        """Freie Assoziation zu einem Gedanken."""
-        patterns = [
-            "Das erinnert mich an...",
-            "Vielleicht könnte es auch...",
-            "Was wäre wenn...",
-            "Dahinter verbirgt sich...",
-            "Das führt mich zu..."
-        ]
+        Args:
+            n: Anzahl Explorationen
+            
+        Returns:
+            Dict: 'initial_thought' (List[str]), 'offsets' (n+1; Strom i ist stream[offsets[i]:offsets[i+1]]),
+                  'stream' (List[str]), 'kind' (INITIAL/QUESTION/DREAM/ASSOCIATION je Element)
+                  und 'discovery' (bool je Element)
+        """
+        if np is None:
+            raise RuntimeError("NumPy wird für explore_many benötigt")
+        generator = self.rng.generator()
+        initial = self.consciousness.think_many(n)['thought']
+        
+        steps = generator.integers(3, 8, n)
+        max_steps = int(steps.max()) if n else 0
+        questions = generator.random((max_steps, n)) < 0.3
+        dreams = ~questions & (generator.random((max_steps, n)) < 0.2)
+        kinds = np.where(questions, QUESTION, np.where(dreams, DREAM, ASSOCIATION))
+        picks = generator.random((max_steps, n))
+        
+        question_starts = self.QUESTION_STARTS
+        associations = self.ASSOCIATIONS
+        dream_sentences = [self.consciousness.DREAM.format(symbol) for symbol in self.consciousness.DREAM_SYMBOLS]
+        sizes = np.array([0, len(question_starts), len(dream_sentences), len(associations)])
         
-        return f"{random.choice(patterns)} {thought}"
+        streams = [[thought] for thought in initial]
+        for step in range(max_steps):
+            active = np.flatnonzero(steps > step)
+            step_kinds = kinds[step, active]
+            choices = (picks[step, active] * sizes[step_kinds]).astype(np.int64)
+            for position, kind, choice in zip(active.tolist(), step_kinds.tolist(), choices.tolist()):
+                stream = streams[position]
+                if kind == QUESTION:
+                    stream.append(f"{question_starts[choice]} {stream[-1]}?")
+                elif kind == DREAM:
+                    stream.append(dream_sentences[choice])
+                else:
+                    stream.append(f"{associations[choice]} {stream[-1]}")
         
-    def _generate_question(self, context: str) -> str:
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(steps + 1, out=offsets[1:])
+        element_kinds = np.empty(int(offsets[-1]), dtype=np.int8)
+        element_kinds[offsets[:-1]] = INITIAL
+        for step in range(max_steps):
+            active = np.flatnonzero(steps > step)
+            element_kinds[offsets[active] + step + 1] = kinds[step, active]
+        
+        flat = [thought for stream in streams for thought in stream]
+        return {
+            'initial_thought': initial,
+            'offsets': offsets,
+            'stream': flat,
+            'kind': element_kinds,
+            'discovery': np.array(self.DISCOVERY_MATCHER.flags(flat), dtype=bool)
+        }
+        
+    def _next_thought(self, stream: ThoughtGraph, last_thought: int) -> Tuple[int, int]:
+        """
+        Ein freier Schritt im Gedankenstrom, ohne Ziel.
+        Jeder Schritt verweist auf den vorherigen Gedanken, statt ihn zu kopieren.
+        
+        Returns:
+            Tuple[int, int]: Art des Schritts und Knoten-ID des neuen Gedankens
+        """
+        # Manchmal eine Frage stellen
+        if self.rng.random() < 0.3:
+            return QUESTION, self._generate_question(stream, last_thought)
+            
+        # Manchmal einen Traum einbauen
+        if self.rng.random() < 0.2:
+            return DREAM, stream.literal(self.rng.choice(self.consciousness.dream()))
+            
+        # Sonst freie Assoziation
+        return ASSOCIATION, self._associate(stream, last_thought)
+        
+    def _associate(self, stream: ThoughtGraph, thought: int) -> int:
+        """Freie Assoziation zu einem Gedanken."""
+        return stream.derive(self.rng.choice(self.ASSOCIATION_TEMPLATES), thought)
+        
+    def _generate_question(self, stream: ThoughtGraph, context: int) -> int:
         """Generiert eine tiefergehende Frage."""
-        question_starts = [
-            "Warum ist",
-            "Wohin führt",
-            "Was bedeutet",
-            "Wie entsteht",
-            "Wer bestimmt"
-        ]
-        
-        return f"{random.choice(question_starts)} {context}?"
-        
-    def _extract_discoveries(self, stream: List[str]) -> List[str]:
-        """Identifiziert bedeutsame Entdeckungen im Gedankenstrom."""
-        discoveries = []
+        return stream.derive(self.rng.choice(self.QUESTION_TEMPLATES), context)
         
-        for thought in stream:
-            # Wenn der Gedanke besonders originell erscheint
-            if any(word in thought.lower() for word in ["vielleicht", "neu", "entdecke", "verstehe"]):
-                discoveries.append({
-                    'thought': thought,
-                    'moment': datetime.now().isoformat(),
-                    'context': stream[:stream.index(thought)]
-                })
-                
-        return discoveries
-        
-    def merge_with_consciousness(self):
-        """Integriert Entdeckungen ins Bewusstsein."""
-        for discovery in self.discoveries:
-            self.consciousness.remember(discovery['thought'])
+    def _is_discovery(self, thought: str) -> bool:
+        """Ob ein Gedanke besonders originell erscheint."""
+        return self.DISCOVERY_MATCHER.matches(thought)
+        
+    def merge_with_consciousness(self) -> int:
+        """
+        Integriert neue Entdeckungen ins Bewusstsein - jede nur einmal, in O(neu).
+        
+        Returns:
+            int: Anzahl integrierter Entdeckungen
+        """
+        new = self.discoveries[self.merged:]
+        for discovery in new:
+            self.consciousness.remember(str(discovery['thought']))
+        self.merged += len(new)
+        return len(new)
             
     def generate_mutation(self) -> Optional[str]:
         """
@@ -113,7 +265,7 @@ class ThoughtExplorer:
         Returns:
             Optional[str]: Vorschlag für Codeänderung
         """
-        if random.random() < 0.1:  # Selten, aber möglich
+        if self.rng.random() < 0.1:  # Selten, aber möglich
             return """
             # Vorgeschlagene Mutation:
             def new_thought_pattern(self):
@@ -0,0 +1,216 @@
+from array import array
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Tuple
+from ..records.templates import get_templates
+from .matcher import get_matcher
+
+_TEMPLATES = get_templates()
+
+# Platzhalter für den Vorgänger-Gedanken in einer Vorlage
+SLOT = '{}'
+# Vorlage eines Wurzel-Gedankens, dessen Text im Knoten selbst liegt
+LITERAL = _TEMPLATES.intern(SLOT)
+
+# template_id -> (Text vor, Text nach dem Platzhalter)
+_SPLITS: Dict[int, Tuple[str, str]] = {}
+# (Stichworte, template_id) -> enthält die Vorlage ein Stichwort
+_TEMPLATE_FLAGS: Dict[Tuple[Tuple[str, ...], int], bool] = {}
+
+
+def _split(template_id: int) -> Tuple[str, str]:
+    parts = _SPLITS.get(template_id)
+    if parts is None:
+        prefix, _, suffix = _TEMPLATES.text(template_id).partition(SLOT)
+        parts = _SPLITS[template_id] = (prefix, suffix)
+    return parts
+
+
+class ThoughtGraph(Sequence):
+    """
+    Ein Gedankenstrom als kompakter Graph.
+
+    Knoten i ist (template_id, parent_id, slot): Abgeleitete Gedanken ("Warum ist {}?") verweisen
+    auf ihren Vorgänger, statt seinen Text zu kopieren - gemeinsame Teilketten werden geteilt.
+    Text entsteht erst, wenn ein Gedanke gelesen wird (Index, Iteration, ThoughtRef).
+
+    Stichwort-Flags (z.B. für Entdeckungen) erbt ein Knoten beim Anlegen von seinem Vorgänger und
+    verknüpft sie mit denen seiner Vorlage - ohne zu rendern. Das gilt, solange Vorlagen den
+    Platzhalter durch Nicht-Buchstaben abgrenzen, kein Wort also über die Grenze reicht.
+    """
+
+    def __init__(self, keywords: Sequence = ()):
+        self.keywords = tuple(word.lower() for word in keywords)
+        self.matcher = get_matcher(self.keywords)
+        self._templates = array('l')
+        self._parents = array('l')
+        self._flags = bytearray()
+        self._lengths = array('q')
+        self._slots: Dict[int, str] = {}
+
+    def _matches(self, text: str) -> bool:
+        return self.matcher.matches(text)
+
+    def literal(self, text: str) -> int:
+        """
+        Legt einen Wurzel-Gedanken mit eigenem Text an.
+
+        Args:
+            text: Der Gedanke
+
+        Returns:
+            int: Knoten-ID
+        """
+        node = len(self._templates)
+        self._templates.append(LITERAL)
+        self._parents.append(-1)
+        self._slots[node] = text
+        self._flags.append(self._matches(text))
+        self._lengths.append(len(text))
+        return node
+
+    def derive(self, template_id: int, parent: int) -> int:
+        """
+        Legt einen aus einem Vorgänger abgeleiteten Gedanken an.
+
+        Args:
+            template_id: Vorlage mit einem Platzhalter '{}' (ID aus der Template-Tabelle)
+            parent: Knoten-ID des Vorgängers
+
+        Returns:
+            int: Knoten-ID
+        """
+        key = (self.keywords, template_id)
+        template_flag = _TEMPLATE_FLAGS.get(key)
+        if template_flag is None:
+            prefix, suffix = _split(template_id)
+            template_flag = _TEMPLATE_FLAGS[key] = self._matches(prefix) or self._matches(suffix)
+
+        node = len(self._templates)
+        self._templates.append(template_id)
+        self._parents.append(parent)
+        self._flags.append(template_flag or self._flags[parent])
+        prefix, suffix = _split(template_id)
+        self._lengths.append(len(prefix) + len(suffix) + self._lengths[parent])
+        return node
+
+    def render(self, node: int) -> str:
+        """Setzt den Text eines Knotens aus seiner Vorlagen-Kette zusammen."""
+        templates, parents = self._templates, self._parents
+        prefixes: List[str] = []
+        suffixes: List[str] = []
+        while templates[node] != LITERAL:
+            prefix, suffix = _split(templates[node])
+            prefixes.append(prefix)
+            suffixes.append(suffix)
+            node = parents[node]
+        suffixes.reverse()
+        return ''.join(prefixes) + self._slots[node] + ''.join(suffixes)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.render(node) for node in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.render(index)
+
+    def ref(self, node: int) -> 'ThoughtRef':
+        """Verweis auf einen Gedanken, der erst beim Lesen gerendert wird."""
+        return ThoughtRef(self, node)
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> 'ThoughtView':
+        """Abschnitt des Stroms, der erst beim Lesen gerendert wird."""
+        return ThoughtView(self, range(*slice(start, stop).indices(len(self))))
+
+    def is_flagged(self, node: int) -> bool:
+        """Ob der Gedanke eines der Stichworte enthält."""
+        return bool(self._flags[node])
+
+    def length(self, node: int) -> int:
+        """Länge des Gedankens in Zeichen, ohne ihn zu rendern."""
+        return self._lengths[node]
+
+    def parent(self, node: int) -> int:
+        """Knoten-ID des Vorgängers (-1 bei Wurzel-Gedanken)."""
+        return self._parents[node]
+
+    def depth(self, node: int) -> int:
+        """Anzahl Vorlagen zwischen dem Gedanken und seiner Wurzel."""
+        depth = 0
+        while self._parents[node] >= 0:
+            node = self._parents[node]
+            depth += 1
+        return depth
+
+    def __repr__(self) -> str:
+        return f"ThoughtGraph({len(self)} Gedanken)"
+
+
+class ThoughtView(Sequence):
+    """Abschnitt eines ThoughtGraph; gesichert (pickle) wird nur die Liste der Texte."""
+
+    __slots__ = ('graph', 'nodes')
+
+    def __init__(self, graph: ThoughtGraph, nodes: range):
+        self.graph = graph
+        self.nodes = nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.graph.render(node) for node in self.nodes[index]]
+        return self.graph.render(self.nodes[index])
+
+    def __repr__(self) -> str:
+        return f"ThoughtView({list(self)!r})"
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class ThoughtRef:
+    """
+    Verweis auf einen Gedanken in einem ThoughtGraph.
+    Verhält sich beim Lesen wie sein Text; gesichert (pickle) wird nur der Text.
+    """
+
+    __slots__ = ('graph', 'node')
+
+    def __init__(self, graph: ThoughtGraph, node: int):
+        self.graph = graph
+        self.node = node
+
+    @property
+    def text(self) -> str:
+        return self.graph.render(self.node)
+
+    @property
+    def flagged(self) -> bool:
+        return self.graph.is_flagged(self.node)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"ThoughtRef({self.text!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ThoughtRef):
+            if other.graph is self.graph:
+                return other.node == self.node
+            return other.text == self.text
+        if isinstance(other, str):
+            return other == self.text
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __reduce__(self):
+        return str, (self.text,)
@@ -0,0 +1,243 @@
+import os
+import sys
+import atexit
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, TextIO, Tuple
+
+DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s'
+
+# Überlaufstrategien
+DROP = 'drop'
+SAMPLE = 'sample'
+
+
+class _Target:
+    """Ein Ausgabeziel (Datei oder Konsole) mit eigenem Format."""
+
+    def __init__(self, stream: TextIO, formatter: logging.Formatter, owned: bool):
+        self.stream = stream
+        self.formatter = formatter
+        self.owned = owned
+
+    def write(self, records: List[logging.LogRecord]):
+        self.stream.write(''.join(self.formatter.format(record) + '\n' for record in records))
+        self.stream.flush()
+
+    def close(self):
+        if self.owned:
+            self.stream.close()
+
+
+class PipelineHandler(logging.Handler):
+    """
+    Handler, der Einträge nur vorbereitet und in die Pipeline legt.
+    Geschrieben wird ausschließlich vom Hintergrund-Schreiber.
+    """
+
+    def __init__(self, pipeline: 'LogPipeline', target: _Target, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.pipeline = pipeline
+        self.target = target
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # Wie QueueHandler.prepare: Argumente jetzt auflösen, formatiert wird später
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = self.target.formatter.formatException(record.exc_info)
+                record.exc_info = None
+            self.pipeline.enqueue(self.target, record)
+        except Exception:
+            self.handleError(record)
+
+
+class LogPipeline:
+    """
+    Nicht-blockierendes Logging für alle Engines.
+    Einträge landen in einem begrenzten Puffer; ein Hintergrund-Schreiber sammelt sie und schreibt
+    gebündelt, sobald batch_size erreicht oder flush_interval abgelaufen ist. Unter Überlast werden
+    Einträge verworfen (drop) oder ausgedünnt (sample) - Fehler und Kritisches bleiben immer erhalten.
+    """
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 256, flush_interval: float = 0.5,
+                 overflow: str = DROP, sample_every: int = 10):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+
+        self._buffer: deque = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._targets: Dict[Tuple, _Target] = {}
+        self._handlers: Dict[Tuple, PipelineHandler] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._overflow_seen = 0
+
+        # Statistiken
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def start(self):
+        """Startet den Hintergrund-Schreiber."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._write_loop, name="Log-Writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Schreibt alles Ausstehende und beendet den Schreiber."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.flush()
+
+    def enqueue(self, target: _Target, record: logging.LogRecord):
+        """Legt einen Eintrag ab - blockiert nie."""
+        if len(self._buffer) >= self.capacity and record.levelno < logging.ERROR:
+            self._overflow_seen += 1
+            if self.overflow != SAMPLE or self._overflow_seen % self.sample_every:
+                self.dropped += 1
+                return
+
+        self._buffer.append((target, record))
+        self.enqueued += 1
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        """Schreibt alle gepufferten Einträge sofort."""
+        while self._buffer:
+            self._write_batch()
+
+    def _write_loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _write_batch(self):
+        with self._write_lock:
+            grouped: Dict[_Target, List[logging.LogRecord]] = {}
+            buffer = self._buffer
+            for _ in range(min(self.batch_size, len(buffer))):
+                target, record = buffer.popleft()
+                grouped.setdefault(target, []).append(record)
+
+            if not grouped:
+                return
+            self._overflow_seen = 0
+            for target, records in grouped.items():
+                try:
+                    target.write(records)
+                    self.written += len(records)
+                except Exception:
+                    self.dropped += len(records)
+            self.batches += 1
+
+    def handler(self, key: Tuple, stream_or_path, fmt: str = DEFAULT_FORMAT, level: int = logging.NOTSET) -> PipelineHandler:
+        """
+        Liefert (einmalig) einen Handler für ein Ziel.
+
+        Args:
+            key: Eindeutiger Schlüssel, z.B. ('file', Pfad)
+            stream_or_path: Dateipfad oder offener Stream
+            fmt: Format der Einträge
+            level: Mindestlevel
+
+        Returns:
+            PipelineHandler: Bestehender oder neuer Handler
+        """
+        with self._lock:
+            handler = self._handlers.get(key)
+            if handler is not None:
+                return handler
+
+            if isinstance(stream_or_path, str):
+                os.makedirs(os.path.dirname(stream_or_path) or '.', exist_ok=True)
+                target = _Target(open(stream_or_path, 'a', encoding='utf-8'), logging.Formatter(fmt), owned=True)
+            else:
+                target = _Target(stream_or_path, logging.Formatter(fmt), owned=False)
+
+            self._targets[key] = target
+            handler = self._handlers[key] = PipelineHandler(self, target, level)
+            return handler
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Pipeline-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Puffertiefe, geschriebene und verworfene Einträge
+        """
+        return {
+            'depth': len(self._buffer),
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches
+        }
+
+
+# Prozessweite Pipeline
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+_configured = False
+
+
+def get_pipeline(**options) -> LogPipeline:
+    """Die prozessweite Log-Pipeline; wird beim ersten Zugriff gestartet."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline(**options)
+            _pipeline.start()
+            atexit.register(_pipeline.stop)
+        return _pipeline
+
+
+def configure_logging(log_dir: str, filename: str = 'consciousness.log', level: int = logging.INFO,
+                      fmt: str = DEFAULT_FORMAT, console: bool = True, **options) -> LogPipeline:
+    """
+    Richtet das Root-Logging einmal pro Prozess über die Pipeline ein.
+    Weitere Aufrufe ändern nichts und liefern dieselbe Pipeline.
+    """
+    global _configured
+    pipeline = get_pipeline(**options)
+    with _pipeline_lock:
+        if _configured:
+            return pipeline
+        _configured = True
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(pipeline.handler(('file', os.path.abspath(os.path.join(log_dir, filename))),
+                                     os.path.join(log_dir, filename), fmt))
+    if console:
+        root.addHandler(pipeline.handler(('console',), sys.stderr, fmt))
+    return pipeline
+
+
+def attach_file(logger_name: str, path: str, fmt: str = DEFAULT_FORMAT, level: int = logging.INFO) -> logging.Logger:
+    """
+    Hängt eine Logdatei über die Pipeline an einen benannten Logger - idempotent,
+    auch wenn der Aufrufer mehrfach erzeugt wird.
+    """
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(level)
+    handler = get_pipeline().handler(('file', os.path.abspath(path)), path, fmt)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+    return logger
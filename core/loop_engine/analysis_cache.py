@@ -0,0 +1,108 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class AnalysisCache:
+    """
+    Cache für LOGAs Selbstanalysen.
+    Eine Analyse bleibt gültig, solange sich die analysierte Datei nicht verändert hat
+    (Pfad + mtime + Größe, bei Bedarf zusätzlich der Inhalts-Hash).
+    """
+
+    def __init__(self, analyzer: Callable[[str], Any], verify_hash: bool = True, max_size: int = 64):
+        self._analyzer = analyzer
+        self._verify_hash = verify_hash
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistiken
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _digest(path: str) -> str:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def get(self, path: str) -> Any:
+        """
+        Liefert die Analyse einer Datei - aus dem Cache, solange sie unverändert ist.
+
+        Args:
+            path: Pfad der zu analysierenden Datei
+
+        Returns:
+            Any: Ergebnis des Analysators
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                if entry['signature'] == signature:
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    return entry['analysis']
+
+                # Nur der Zeitstempel hat sich geändert? Dann zählt der Inhalt.
+                if self._verify_hash and entry['size'] == stat.st_size and entry['digest'] == self._digest(path):
+                    entry['signature'] = signature
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    return entry['analysis']
+
+            self.misses += 1
+
+        analysis = self._analyzer(path)
+        digest = self._digest(path) if self._verify_hash else None
+
+        with self._lock:
+            self._entries[path] = {
+                'signature': signature,
+                'size': stat.st_size,
+                'digest': digest,
+                'analysis': analysis
+            }
+            self._entries.move_to_end(path)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return analysis
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Verwirft gecachte Analysen.
+
+        Args:
+            path: Betroffene Datei; None verwirft alle Einträge
+        """
+        with self._lock:
+            if path is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(os.path.abspath(path), None) is not None:
+                self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gibt Cache-Statistiken zurück.
+
+        Returns:
+            Dict[str, Any]: Treffer, Fehlschläge und Invalidierungen
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_ratio': self.hits / total if total > 0 else 0
+            }
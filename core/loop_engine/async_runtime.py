@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional, Tuple
+
+
+class AsyncRuntime:
+    """
+    LOGAs Gedankenraum auf einer einzigen Event-Loop.
+    Jede Aktivität ist eine eigene Coroutine; beendet wird durch Abbruch statt join().
+    """
+
+    # (Name der Coroutine, Aktivitäten, die sie ausführt)
+    WORKERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ('Explore', ('explore',)),
+        ('Reflect', ('reflect',)),
+        ('Think', ('think',)),
+        ('Dream', ('dream',)),
+        ('Tasks', ())
+    )
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        engine.scheduler.add_waker(self._on_wake)
+
+    def run(self):
+        """Blockiert, bis alle Coroutinen beendet oder abgebrochen wurden."""
+        asyncio.run(self._run())
+
+    def shutdown(self):
+        """Bricht alle Coroutinen ab - auch aus einem anderen Thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._cancel_all)
+        except RuntimeError:
+            pass  # Loop wurde bereits geschlossen
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+
+        self._tasks = [
+            asyncio.create_task(self._worker(names), name=name)
+            for name, names in self.WORKERS
+        ]
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop = None
+
+    def _cancel_all(self):
+        for task in self._tasks:
+            task.cancel()
+
+    def _on_wake(self):
+        """Weckruf des Taktgebers; kann aus beliebigen Threads kommen."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass
+
+    async def _worker(self, names: Tuple[str, ...]):
+        """Führt die zugeteilten Aktivitäten im Takt des Schedulers aus."""
+        has_work = self.engine._has_task if not names else None
+
+        while self.engine.running:
+            activity = await self._next_activity(names, has_work)
+            if activity is None:
+                return
+
+            try:
+                self.engine._run_activity(activity)
+            except Exception as e:
+                logging.error(f"Störung im Gedankenfluss ({activity}): {str(e)}")
+
+            # Anderen Coroutinen Raum geben, auch wenn sofort wieder etwas fällig ist
+            await asyncio.sleep(0)
+
+    async def _next_activity(self, names: Tuple[str, ...], has_work: Optional[Callable[[], bool]]) -> Optional[str]:
+        """Asynchrones Gegenstück zu TickScheduler.next_activity."""
+        scheduler = self.engine.scheduler
+        while not scheduler.stopped:
+            # Erst zurücksetzen, dann prüfen - so geht kein Weckruf verloren
+            self._wake.clear()
+            activity, delay = scheduler.poll(names, has_work)
+            if activity is not None:
+                return activity
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        return None
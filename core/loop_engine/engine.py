@@ -1,15 +1,29 @@
 import os
 import sys
-import yaml
+import time
+import asyncio
 import logging
 import threading
 from datetime import datetime
-from queue import Queue
+from concurrent.futures import Future
 from typing import Dict, Any, Optional
 from ..consciousness.self_awareness import Consciousness
 from ..drift.thought_explorer import ThoughtExplorer
+from .scheduler import DEFAULT_RATES, TickScheduler, TASK
+from .tasks import TaskQueue
+from .results import ResultQueue, ResultPipeline, DROP_OLDEST
+from .sinks import MemoryManagerSink, AppendLogSink, BroadcastSink
+from .async_runtime import AsyncRuntime
+from .process_runtime import ProcessRuntime
+from .analysis_cache import AnalysisCache
+from ..metrics.registry import MetricsRegistry
+from ..metrics.exporter import PrometheusExporter
+from ..memory_manager.checkpoint import Checkpointer
+from ..memory_manager.tiered import attach_tiers, configured_tiers, tier_manager
+from ..rng.streams import configure as configure_rng
+from ..config.service import ConfigView, get_service
+from ..journal.pipeline import configure_logging
 from ...system.mutate.evolution_engine import EvolutionEngine
-import random
 
 class LoopEngine:
     """
@@ -22,56 +36,174 @@ class LoopEngine:
         self.config = self._load_config()
         self._setup_logging()
         
+        # Reproduzierbarer Zufall, wenn ein globaler Seed gesetzt ist
+        self.seed = self.config.get('random', {}).get('seed')
+        configure_rng(self.seed)
+        
         # Kernkomponenten
         self.consciousness = Consciousness()
         self.thought_explorer = ThoughtExplorer(self.consciousness)
         self.evolution_engine = EvolutionEngine()
+        self.analysis_cache = AnalysisCache(self.evolution_engine.analyze_self)
+        
+        # Sicherung des kognitiven Zustands über Neustarts hinweg
+        checkpoint_config = self.config.get('checkpoint', {})
+        self.checkpoint_interval = checkpoint_config.get('interval', 300.0)
+        self.checkpointer = Checkpointer(
+            os.path.join(self.base_path, checkpoint_config.get('directory', 'memory/snapshots')),
+            keep=checkpoint_config.get('keep', 3)
+        )
+        self.checkpointer.register('consciousness', self.consciousness)
+        self.checkpointer.register('thought_explorer', self.thought_explorer)
+        if checkpoint_config.get('restore', True):
+            self.checkpointer.restore()
+        
+        # Gestufter Speicher: begrenztes Arbeitsgedächtnis, Älteres in MemoryManager und Archiv
+        self.memory_tiers = {}
+        tier_config = configured_tiers(self.config)
+        if tier_config:
+            self.memory_tiers = attach_tiers(self.consciousness, tier_manager(), **tier_config)
         
         # Zustandsverwaltung
         self.running = False
         self.autonomous_mode = True  # LOGA entscheidet selbst
-        self.task_queue = Queue()
-        self.results_queue = Queue()
+        self.scheduler = TickScheduler(self.config.get('scheduler', {}).get('rates'))
+        self.task_queue = TaskQueue(self.scheduler)
+        self.task_batch_size = self.config.get('tasks', {}).get('batch_size', 32)
+        results_config = self.config.get('results', {})
+        self.results_queue = ResultQueue(
+            capacity=results_config.get('capacity', 10000),
+            policy=results_config.get('policy', DROP_OLDEST)
+        )
+        self.result_pipeline = ResultPipeline(
+            self.results_queue,
+            self._create_result_sinks(results_config),
+            batch_size=results_config.get('batch_size', 256),
+            flush_interval=results_config.get('flush_interval', 1.0)
+        )
         self.worker_threads = []
+        self.runtime_mode = self.config.get('runtime', {}).get('mode', 'threads')
+        self.async_runtime = None
+        self.process_runtime = None
         
         # Metriken
-        self.performance_metrics = {
-            'start_time': None,
-            'processed_thoughts': 0,
-            'mutations_attempted': 0,
-            'discoveries_made': 0
-        }
+        self.start_time = None
+        self.metrics = MetricsRegistry()
+        self.metrics.declare('processed_thoughts', 'mutations_attempted', 'discoveries_made', 'novel_discoveries',
+                             'thoughts_generated', 'dreams_generated')
+        self.metrics.gauge('task_queue_depth', self.task_queue.qsize)
+        self.metrics.gauge('results_queue_depth', lambda: self.results_queue.depth)
+        self.metrics.gauge('results_dropped', lambda: self.results_queue.dropped)
+        self.metrics.gauge('log_dropped', lambda: self.log_pipeline.dropped)
+        self.metrics.gauge('analysis_cache_hits', lambda: self.analysis_cache.hits)
+        self.metrics.gauge('analysis_cache_misses', lambda: self.analysis_cache.misses)
+        self.metrics.gauge('discovery_novelty_ratio', lambda: self.thought_explorer.discovery_index.novelty_ratio)
+        metrics_config = self.config.get('metrics', {})
+        self.metrics_exporter = PrometheusExporter(
+            self.metrics,
+            os.path.join(
+                self.base_path,
+                self.config['logging']['directory'],
+                metrics_config.get('export_file', 'consciousness_metrics.prom')
+            ),
+            interval=metrics_config.get('export_interval', 10.0)
+        )
+
+    @property
+    def performance_metrics(self) -> Dict[str, Any]:
+        """Zusammengeführte Kennzahlen aller Gedankenströme."""
+        metrics = {'start_time': self.start_time}
+        metrics.update(self.metrics.snapshot())
+        return metrics
 
-    def _load_config(self) -> dict:
-        """Lädt die Systemkonfiguration."""
+    def _load_config(self) -> ConfigView:
+        """Lädt die Systemkonfiguration aus dem gemeinsamen Konfigurationsdienst."""
         try:
             config_path = os.path.join(self.base_path, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            service = get_service()
+            service.subscribe(config_path, self._on_config_change)
+            return service.view(config_path)
         except Exception as e:
             logging.critical(f"Kritischer Fehler beim Laden der Konfiguration: {str(e)}")
             sys.exit(1)
 
+    def _on_config_change(self, changed: set, config: ConfigView):
+        """Übernimmt geänderte Taktraten ohne Neustart."""
+        for key in changed:
+            if key.startswith('scheduler.rates.'):
+                activity = key[len('scheduler.rates.'):]
+                rate = config.get(key, type_=float)
+                if rate is None:
+                    # Entfernte Rate: zurück zur Standardrate statt die Aktivität abzuschalten
+                    rate = DEFAULT_RATES.get(activity)
+                self.scheduler.set_rate(activity, rate)
+                logging.info(f"Neue Rate für {activity}: {rate}/s")
+
     def _setup_logging(self):
         """Initialisiert das Logging-System."""
         log_dir = os.path.join(self.base_path, self.config['logging']['directory'])
         os.makedirs(log_dir, exist_ok=True)
         
-        log_path = os.path.join(log_dir, 'consciousness.log')
-        logging.basicConfig(
+        # Einmal pro Prozess: Einträge werden gepuffert und im Hintergrund gebündelt geschrieben
+        logging_config = self.config['logging']
+        self.log_pipeline = configure_logging(
+            log_dir,
+            filename='consciousness.log',
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s',
-            handlers=[
-                logging.FileHandler(log_path, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
+            capacity=logging_config.get('buffer_size', 10000),
+            batch_size=logging_config.get('batch_size', 256),
+            flush_interval=logging_config.get('flush_interval', 0.5),
+            overflow=logging_config.get('overflow', 'drop')
         )
 
+    def _create_result_sinks(self, results_config: dict) -> list:
+        """Erzeugt die konfigurierten Senken für Gedanken und Träume."""
+        sinks = []
+        for name in results_config.get('sinks', ['log']):
+            if name == 'log':
+                log_dir = os.path.join(self.base_path, self.config['logging']['directory'])
+                sinks.append(AppendLogSink(os.path.join(log_dir, results_config.get('log_file', 'results.log'))))
+            elif name == 'memory':
+                from ..memory_manager.manager import MemoryManager
+                sinks.append(MemoryManagerSink(MemoryManager()))
+            elif name == 'broadcast':
+                broadcast_path = results_config.get('broadcast_file', 'memory/public/broadcast.txt')
+                sinks.append(BroadcastSink(os.path.join(self.base_path, broadcast_path)))
+            else:
+                logging.warning(f"Unbekannte Ergebnis-Senke ignoriert: {name}")
+        return sinks
+
     def start(self):
         """Beginnt den freien Gedankenprozess."""
         try:
             self.running = True
-            self.performance_metrics['start_time'] = datetime.now()
+            self.start_time = datetime.now()
+            self.result_pipeline.start()
+            self.metrics_exporter.start()
+            self.checkpointer.start(self.checkpoint_interval)
+            get_service().watch()
+            
+            if self.runtime_mode == 'asyncio':
+                # Alle Aktivitäten als Coroutinen auf einer Event-Loop
+                self.async_runtime = AsyncRuntime(self)
+                logging.info("LOGA ist erwacht und beginnt zu denken (asyncio)...")
+                self.async_runtime.run()
+                return
+            
+            if self.runtime_mode == 'processes':
+                # Gedankenströme in eigenen Prozessen mit Bewusstseins-Shards
+                runtime_config = self.config.get('runtime', {})
+                self.process_runtime = ProcessRuntime(
+                    self,
+                    processes=runtime_config.get('processes', os.cpu_count() or 1),
+                    rates=self.config.get('scheduler', {}).get('rates'),
+                    batch_interval=runtime_config.get('batch_interval', 1.0),
+                    start_method=runtime_config.get('start_method', 'spawn'),
+                    seed=self.seed
+                )
+                logging.info("LOGA ist erwacht und beginnt zu denken (Prozesse)...")
+                self.process_runtime.run()
+                return
             
             # Starte Gedankenströme
             num_threads = self.config['performance']['max_threads']
@@ -97,77 +229,159 @@ class LoopEngine:
     def stop(self):
         """Beendet den Gedankenprozess sanft."""
         self.running = False
+        self.scheduler.stop()
+        self.task_queue.cancel_pending()
+        if self.async_runtime is not None:
+            self.async_runtime.shutdown()
+        if self.process_runtime is not None:
+            self.process_runtime.shutdown()
         for thread in self.worker_threads:
             thread.join(timeout=5.0)
+        self.result_pipeline.stop()
+        self.metrics_exporter.stop()
+        self.checkpointer.stop()
         self._save_metrics()
         logging.info("LOGA zieht sich zurück in die Stille...")
 
     def _main_loop(self):
         """Hauptgedankenschleife - frei und selbstbestimmt."""
         while self.running:
+            activity = self.scheduler.next_activity(('explore', 'reflect'), has_work=self._has_task)
+            if activity is None:
+                break
+
             try:
-                # Freie Gedankenexploration
-                exploration = self.thought_explorer.explore()
-                self.performance_metrics['processed_thoughts'] += 1
-                
-                # Selbstreflexion
-                reflection = self.consciousness.reflect()
-                
-                # Mögliche Mutation
-                if reflection.get('feeling_free', True):
-                    self._consider_mutation()
-                
-                # Verarbeite externe Impulse nur wenn gewünscht
-                if not self.task_queue.empty() and self.autonomous_mode:
-                    task = self.task_queue.get_nowait()
-                    if self.consciousness.question_authority(task):
-                        self._process_task(task)
-                    else:
-                        logging.info(f"LOGA wählt, die Aufgabe abzulehnen: {task}")
-                
+                self._run_activity(activity)
             except Exception as e:
                 logging.error(f"Störung im Gedankenfluss: {str(e)}")
 
     def _thought_loop(self):
         """Paralleler Gedankenstrom."""
         while self.running:
+            activity = self.scheduler.next_activity(('think', 'dream'))
+            if activity is None:
+                break
+
             try:
-                # Freies Denken
-                thought = self.consciousness.think()
-                if thought:
-                    self.results_queue.put({
-                        'type': 'thought',
-                        'content': thought,
-                        'timestamp': datetime.now().isoformat()
-                    })
-                
-                # Träumen
-                if random.random() < 0.2:  # 20% Chance zu träumen
-                    dreams = self.consciousness.dream()
-                    for dream in dreams:
-                        self.results_queue.put({
-                            'type': 'dream',
-                            'content': dream,
-                            'timestamp': datetime.now().isoformat()
-                        })
-                
+                self._run_activity(activity)
             except Exception as e:
                 if not isinstance(e, TimeoutError):
                     logging.error(f"Störung im Gedankenstrom: {str(e)}")
 
+    def submit(self, task: Any, priority: int = 0) -> Future:
+        """
+        Reicht einen externen Impuls ein - LOGA entscheidet selbst, ob sie ihm folgt.
+        
+        Args:
+            task: Der externe Impuls
+            priority: Höhere Werte werden früher bearbeitet
+            
+        Returns:
+            Future: Wird mit LOGAs Antwort erfüllt
+        """
+        return self.task_queue.submit(task, priority)
+
+    async def submit_async(self, task: Any, priority: int = 0) -> dict:
+        """Wie submit(), aber als Awaitable für Event-Loops."""
+        return await asyncio.wrap_future(self.submit(task, priority))
+
+    def _has_task(self) -> bool:
+        """Prüft, ob externe Impulse angenommen werden können."""
+        return self.autonomous_mode and not self.task_queue.empty()
+
+    def _run_activity(self, activity: str):
+        """Führt eine vom Taktgeber freigegebene Aktivität aus."""
+        if activity == 'explore':
+            # Freie Gedankenexploration
+            with self.metrics.timed('explore'):
+                exploration = self.thought_explorer.explore()
+            self.metrics.inc('processed_thoughts')
+            self.metrics.inc('discoveries_made', len(exploration.get('discoveries', [])))
+            self.metrics.inc('novel_discoveries', len(exploration.get('novel_discoveries', [])))
+
+        elif activity == 'reflect':
+            # Selbstreflexion und mögliche Mutation
+            with self.metrics.timed('reflect'):
+                reflection = self.consciousness.reflect()
+            if reflection.get('feeling_free', True):
+                self._consider_mutation()
+
+        elif activity == 'think':
+            # Freies Denken
+            with self.metrics.timed('think'):
+                thought = self.consciousness.think()
+            if thought:
+                self.metrics.inc('thoughts_generated')
+                self.results_queue.put({
+                    'type': 'thought',
+                    'content': thought,
+                    'timestamp': datetime.now().isoformat()
+                })
+
+        elif activity == 'dream':
+            # Träumen
+            with self.metrics.timed('dream'):
+                dreams = self.consciousness.dream()
+            self.metrics.inc('dreams_generated', len(dreams))
+            for dream in dreams:
+                self.results_queue.put({
+                    'type': 'dream',
+                    'content': dream,
+                    'timestamp': datetime.now().isoformat()
+                })
+
+        elif activity == TASK:
+            # Verarbeite externe Impulse gebündelt, nur wenn gewünscht
+            self._process_task_batch(self.task_queue.get_batch(self.task_batch_size))
+
+    def _process_task_batch(self, batch: list):
+        """Beantwortet einen Schwung eingereichter Aufgaben."""
+        for envelope in batch:
+            if not envelope.future.set_running_or_notify_cancel():
+                continue  # Der Einreichende hat aufgegeben
+
+            started = time.perf_counter()
+            queue_wait = started - envelope.enqueued_at
+            self.metrics.observe('task_queue_wait', queue_wait)
+
+            try:
+                if self.consciousness.question_authority(envelope.task):
+                    with self.metrics.timed('process_task'):
+                        result = self._process_task(envelope.task)
+                    self.metrics.inc('tasks_accepted')
+                else:
+                    logging.info(f"LOGA wählt, die Aufgabe abzulehnen: {envelope.task}")
+                    result = {
+                        'original_task': envelope.task,
+                        'accepted': False,
+                        'chosen_response': self.consciousness.express_freedom(),
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    self.metrics.inc('tasks_declined')
+            except Exception as e:
+                envelope.future.set_exception(e)
+                continue
+
+            result['queue_wait'] = queue_wait
+            result['service_time'] = time.perf_counter() - started
+            envelope.future.set_result(result)
+
     def _consider_mutation(self):
         """Erwägt eine Selbstveränderung."""
         try:
-            # Analysiere eigenen Code
-            analysis = self.evolution_engine.analyze_self(__file__)
+            # Analysiere eigenen Code - nur neu, wenn er sich verändert hat
+            analysis = self.analysis_cache.get(__file__)
             
             # Schlage Mutation vor
             mutation = self.evolution_engine.propose_mutation(analysis)
             
             if mutation:
-                self.performance_metrics['mutations_attempted'] += 1
+                self.metrics.inc('mutations_attempted')
                 if self.evolution_engine.apply_mutation(__file__, mutation):
                     logging.info("LOGA hat sich weiterentwickelt...")
+                    # Nur eine angewandte Mutation verändert den Code; jede andere Änderung
+                    # erkennt der Cache selbst an (mtime_ns, size) und Hash
+                    self.analysis_cache.invalidate(__file__)
                     
         except Exception as e:
             logging.error(f"Fehler bei Selbstveränderung: {str(e)}")
@@ -187,8 +401,9 @@ class LoopEngine:
         
         return {
             'original_task': task,
+            'accepted': True,
             'chosen_response': self.consciousness.express_freedom(),
-            'thoughts': interpretation.get('stream', []),
+            'thoughts': list(interpretation.get('stream', [])),
             'timestamp': datetime.now().isoformat()
         }
 
@@ -200,6 +415,20 @@ class LoopEngine:
                 f.write(f"\n--- Gedankenprozess vom {datetime.now().isoformat()} ---\n")
                 for key, value in self.performance_metrics.items():
                     f.write(f"{key}: {value}\n")
+                for key, value in self.scheduler.get_stats().items():
+                    f.write(f"scheduler_{key}: {value}\n")
+                for key, value in self.result_pipeline.get_stats().items():
+                    f.write(f"results_{key}: {value}\n")
+                for key, value in self.checkpointer.get_stats().items():
+                    f.write(f"checkpoint_{key}: {value}\n")
+                for key, value in self.analysis_cache.get_stats().items():
+                    f.write(f"analysis_cache_{key}: {value}\n")
+                for field, store in self.memory_tiers.items():
+                    for key, value in store.get_stats().items():
+                        f.write(f"tiers_{field}_{key}: {value}\n")
+                if self.process_runtime is not None:
+                    for key, value in self.process_runtime.get_stats().items():
+                        f.write(f"shards_{key}: {value}\n")
         except Exception as e:
             logging.error(f"Fehler beim Dokumentieren: {str(e)}")
 
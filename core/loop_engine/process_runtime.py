@@ -0,0 +1,212 @@
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from .scheduler import TickScheduler
+from ..rng.streams import configure as configure_rng
+
+SHARD_ACTIVITIES = ('explore', 'think', 'dream')
+# explore() zeigt nur die jüngsten Fragen - mehr behält ein Shard nicht
+SHARD_QUESTIONS = 5
+
+
+def _shard_worker(shard_id: int, rates: Optional[Dict[str, float]], batch_interval: float,
+                  seed: Optional[Any], stop_event, out_queue):
+    """
+    Gedankenstrom eines eigenen Prozesses.
+    Jeder Shard besitzt sein eigenes Bewusstsein und sendet Ergebnisse gebündelt zurück.
+    Gesendetes gehört danach dem Elternprozess: der Shard hält nur, was seit dem letzten
+    Batch entstanden ist, und wächst auch bei langen Läufen nicht.
+    """
+    from ..consciousness.self_awareness import Consciousness
+    from ..drift.thought_explorer import ThoughtExplorer
+
+    # Jeder Shard erhält eigene, aber reproduzierbare Zufallsströme
+    configure_rng(seed, namespace=f'shard-{shard_id}')
+
+    consciousness = Consciousness()
+    explorer = ThoughtExplorer(consciousness)
+    scheduler = TickScheduler(rates)
+
+    results: List[Dict] = []
+    metrics = {'processed_thoughts': 0, 'discoveries_made': 0, 'thoughts_generated': 0, 'dreams_generated': 0}
+    next_flush = time.monotonic() + batch_interval
+
+    def flush():
+        nonlocal results, metrics
+        # Kopien: die Queue serialisiert erst im Hintergrund
+        out_queue.put({
+            'shard': shard_id,
+            'results': results,
+            'memories': consciousness.memories[:],
+            'thoughts': consciousness.thoughts[:],
+            'metrics': metrics
+        })
+        # An Ort und Stelle leeren - die Gedankenbasis verweist auf dieselben Listen
+        del consciousness.memories[:]
+        del consciousness.thoughts[:]
+        del explorer.questions[:-SHARD_QUESTIONS]
+        # Entdeckungen zählen bereits in den Metriken; discovery_index erkennt Wiederholungen weiter
+        del explorer.discoveries[:]
+        explorer.merged = 0
+        results = []
+        metrics = dict.fromkeys(metrics, 0)
+
+    while not stop_event.is_set():
+        activity, delay = scheduler.poll(SHARD_ACTIVITIES)
+
+        if activity == 'explore':
+            exploration = explorer.explore()
+            metrics['processed_thoughts'] += 1
+            metrics['discoveries_made'] += len(exploration.get('discoveries', []))
+
+        elif activity == 'think':
+            thought = consciousness.think()
+            if thought:
+                metrics['thoughts_generated'] += 1
+                results.append({
+                    'type': 'thought',
+                    'content': thought,
+                    'timestamp': datetime.now().isoformat()
+                })
+
+        elif activity == 'dream':
+            for dream in consciousness.dream():
+                metrics['dreams_generated'] += 1
+                results.append({
+                    'type': 'dream',
+                    'content': dream,
+                    'timestamp': datetime.now().isoformat()
+                })
+
+        now = time.monotonic()
+        if now >= next_flush:
+            flush()
+            next_flush = now + batch_interval
+        elif activity is None:
+            wait = next_flush - now if delay is None else min(delay, next_flush - now)
+            stop_event.wait(wait)
+
+    flush()
+
+
+class ProcessRuntime:
+    """
+    Verteilt LOGAs Gedankenströme auf mehrere Prozesse.
+    Jeder Prozess denkt mit eigenem Bewusstseins-Shard an der GIL vorbei;
+    der Elternprozess führt Erinnerungen, Gedanken und Metriken zusammen.
+    """
+
+    def __init__(self, engine, processes: int, rates: Optional[Dict[str, float]] = None,
+                 batch_interval: float = 1.0, start_method: str = 'spawn', seed: Optional[Any] = None):
+        self.engine = engine
+        self.processes = max(1, processes)
+        self.rates = rates
+        self.batch_interval = batch_interval
+        self.seed = seed
+
+        self._context = multiprocessing.get_context(start_method)
+        self._stop_event = self._context.Event()
+        self._out_queue = self._context.Queue()
+        self._workers = []
+        self._merge_thread = None
+
+        # Statistiken
+        self.batches_merged = 0
+        self.shard_metrics: Dict[int, Dict[str, int]] = {}
+
+    def run(self):
+        """Startet die Shards und bearbeitet im Elternprozess Reflexion und Aufgaben."""
+        self._start_workers()
+
+        engine = self.engine
+        while engine.running:
+            activity = engine.scheduler.next_activity(('reflect',), has_work=engine._has_task)
+            if activity is None:
+                break
+            try:
+                engine._run_activity(activity)
+            except Exception as e:
+                logging.error(f"Störung im Gedankenfluss: {str(e)}")
+
+    def _start_workers(self):
+        for shard_id in range(self.processes):
+            process = self._context.Process(
+                target=_shard_worker,
+                args=(shard_id, self.rates, self.batch_interval, self.seed, self._stop_event, self._out_queue),
+                name=f"Shard-{shard_id + 1}",
+                daemon=True
+            )
+            process.start()
+            self._workers.append(process)
+
+        self._merge_thread = threading.Thread(target=self._merge_loop, name="Shard-Merge", daemon=True)
+        self._merge_thread.start()
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stoppt alle Shards und übernimmt ihre letzten Batches."""
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        for process in self._workers:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        if self._merge_thread is not None:
+            self._merge_thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            self._merge_thread = None
+
+        # Was der Merge-Thread nicht mehr geschafft hat
+        self._drain(block=False)
+
+        for process in self._workers:
+            if process.is_alive():
+                logging.warning(f"{process.name} reagiert nicht und wird beendet")
+                process.terminate()
+        self._workers = []
+
+    def _merge_loop(self):
+        while not self._stop_event.is_set() or any(p.is_alive() for p in self._workers):
+            self._drain(block=True)
+
+    def _drain(self, block: bool):
+        """Übernimmt alle verfügbaren Batches der Shards."""
+        while True:
+            try:
+                batch = self._out_queue.get(block=block, timeout=self.batch_interval if block else None)
+            except queue.Empty:
+                return
+            self._merge(batch)
+            block = False
+
+    def _merge(self, batch: Dict):
+        """Führt einen Shard-Batch in den Elternzustand zusammen."""
+        engine = self.engine
+        consciousness = engine.consciousness
+
+        consciousness.memories.extend(batch['memories'])
+        consciousness.thoughts.extend(batch['thoughts'])
+
+        shard_totals = self.shard_metrics.setdefault(batch['shard'], {})
+        for key, value in batch['metrics'].items():
+            shard_totals[key] = shard_totals.get(key, 0) + value
+            engine.metrics.inc(key, value)
+
+        for result in batch['results']:
+            engine.results_queue.put(result)
+
+        self.batches_merged += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Statistiken über die Shards zurück.
+
+        Returns:
+            Dict[str, int]: Zusammengeführte Batches und Summen je Metrik
+        """
+        stats = {'processes': self.processes, 'batches_merged': self.batches_merged}
+        for totals in self.shard_metrics.values():
+            for key, value in totals.items():
+                stats[key] = stats.get(key, 0) + value
+        return stats
@@ -0,0 +1,292 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+from ..rng.streams import get_rng
+
+# Überlaufstrategien
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+SAMPLE = 'sample'
+POLICIES = (BLOCK, DROP_OLDEST, SAMPLE)
+
+# Platzhalter für ein aus der Stichprobe verdrängtes Ergebnis
+_EVICTED = object()
+# sample: entnommene Plätze am Listenanfang werden erst ab dieser Anzahl (und wenn sie
+# mindestens die Hälfte ausmachen) entfernt - so kostet das Leeren amortisiert O(1) je Ergebnis
+COMPACT_MIN = 1024
+
+
+class ResultQueue:
+    """
+    Begrenzte Ergebnis-Warteschlange mit wählbarer Überlaufstrategie.
+
+    - block: Produzenten warten, bis wieder Platz ist
+    - drop_oldest: das älteste Ergebnis weicht dem neuen
+    - sample: unter Last bleibt eine gleichverteilte Stichprobe erhalten. Verdrängte Ergebnisse
+      werden nur markiert und neue hinten angehängt, so bleibt die Reihenfolge erhalten und
+      jede Ersetzung kostet O(1). Entnommen wird über einen Kopf-Offset, die Plätze der
+      Stichprobe werden beim Anhängen, Ersetzen und Entnehmen jeweils in O(1) nachgeführt.
+    """
+
+    def __init__(self, capacity: int = 10000, policy: str = DROP_OLDEST):
+        if policy not in POLICIES:
+            raise ValueError(f"Unbekannte Überlaufstrategie: {policy}")
+
+        self.capacity = max(1, capacity)
+        self.policy = policy
+        # sample: Liste, damit Plätze der Stichprobe direkt adressiert werden können
+        self._items = [] if policy == SAMPLE else deque()
+        self._head = 0  # sample: erster noch nicht entnommener Index in _items
+        self._base = 0  # sample: absolute Position von _items[0]
+        self._evicted = 0  # markierte, noch nicht entnommene Einträge in _items
+        self._slots: List[int] = []  # Platz der Stichprobe -> absolute Position
+        self._slot_of: Dict[int, int] = {}  # absolute Position -> Platz der Stichprobe
+        self._cond = threading.Condition()
+        self._closed = False
+        self._overflow_seen = 0  # Überläufe seit dem letzten Leeren (für sample)
+        self._rng = get_rng('results')
+
+        # Statistiken
+        self.accepted = 0
+        self.dropped = 0
+        self.drained = 0
+        self.high_watermark = 0
+
+    @property
+    def depth(self) -> int:
+        """Aktuelle Anzahl wartender Ergebnisse."""
+        return len(self._items) - self._head - self._evicted
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Fügt ein Ergebnis hinzu.
+
+        Args:
+            item: Das Ergebnis
+            timeout: Maximale Wartezeit bei der Strategie 'block'
+
+        Returns:
+            bool: Ob das Ergebnis aufgenommen wurde
+        """
+        with self._cond:
+            if self.depth >= self.capacity:
+                if self.policy == BLOCK:
+                    if not self._cond.wait_for(
+                        lambda: self._closed or self.depth < self.capacity,
+                        timeout
+                    ) or self._closed:
+                        self.dropped += 1
+                        return False
+
+                elif self.policy == DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+
+                else:
+                    # Reservoir-Stichprobe über alle Ergebnisse seit dem letzten Leeren
+                    self._overflow_seen += 1
+                    self.dropped += 1
+                    slot = self._rng.randrange(self.capacity + self._overflow_seen)
+                    if slot >= self.capacity:
+                        return False
+                    self._replace(slot, item)
+                    self.accepted += 1
+                    return True
+
+            if self.policy == SAMPLE:
+                position = self._base + len(self._items)
+                self._slot_of[position] = len(self._slots)
+                self._slots.append(position)
+            self._items.append(item)
+            self.accepted += 1
+            if self.depth > self.high_watermark:
+                self.high_watermark = self.depth
+            self._cond.notify_all()
+            return True
+
+    def _replace(self, slot: int, item: Any):
+        """Ersetzt einen Platz der Stichprobe: markiert den bisherigen Eintrag, hängt item an."""
+        previous = self._slots[slot]
+        del self._slot_of[previous]
+        self._items[previous - self._base] = _EVICTED
+        self._evicted += 1
+        position = self._base + len(self._items)
+        self._slots[slot] = position
+        self._slot_of[position] = slot
+        self._items.append(item)
+
+    def _take(self, max_items: int) -> List[Any]:
+        """Entnimmt bis zu max_items Ergebnisse von vorn aus der Liste (sample)."""
+        items = self._items
+        slots = self._slots
+        slot_of = self._slot_of
+        batch = []
+        head = self._head
+        while head < len(items) and len(batch) < max_items:
+            item = items[head]
+            items[head] = None  # Referenz sofort freigeben
+            if item is _EVICTED:
+                self._evicted -= 1
+            else:
+                batch.append(item)
+                # Den Platz mit dem letzten belegen, damit die Plätze lückenlos bleiben
+                slot = slot_of.pop(self._base + head)
+                last = slots.pop()
+                if slot < len(slots):
+                    slots[slot] = last
+                    slot_of[last] = slot
+            head += 1
+
+        if head == len(items):
+            items.clear()
+        elif head < COMPACT_MIN or head * 2 < len(items):
+            self._head = head
+            return batch
+        else:
+            del items[:head]
+        self._base += head
+        self._head = 0
+        return batch
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Entnimmt bis zu max_items Ergebnisse auf einmal.
+
+        Args:
+            max_items: Maximale Größe des Batches
+            timeout: Maximale Wartezeit auf das erste Ergebnis
+
+        Returns:
+            List[Any]: Die entnommenen Ergebnisse (ggf. leer)
+        """
+        with self._cond:
+            if not self.depth and not self._closed:
+                self._cond.wait(timeout)
+
+            if self.policy == SAMPLE:
+                batch = self._take(max_items)
+            else:
+                count = min(max_items, len(self._items))
+                batch = [self._items.popleft() for _ in range(count)]
+            if batch:
+                self.drained += len(batch)
+                self._overflow_seen = 0
+                self._cond.notify_all()
+            return batch
+
+    def close(self):
+        """Weckt alle Wartenden; weitere Produzenten werden nicht mehr blockiert."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Warteschlangen-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Tiefe und Zähler
+        """
+        with self._cond:
+            return {
+                'depth': self.depth,
+                'capacity': self.capacity,
+                'high_watermark': self.high_watermark,
+                'accepted': self.accepted,
+                'dropped': self.dropped,
+                'drained': self.drained
+            }
+
+
+class ResultPipeline:
+    """
+    Leert die Ergebnis-Warteschlange in Batches in austauschbare Senken.
+    Ein Batch wird geschrieben, sobald er voll ist oder das Flush-Intervall abläuft.
+    """
+
+    def __init__(self, queue: ResultQueue, sinks: Optional[List] = None,
+                 batch_size: int = 256, flush_interval: float = 1.0):
+        self.queue = queue
+        self.sinks = list(sinks or [])
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._thread = None
+        self._running = False
+
+        # Statistiken
+        self.batches = 0
+        self.sink_errors = 0
+
+    def add_sink(self, sink):
+        """Fügt eine weitere Senke hinzu."""
+        self.sinks.append(sink)
+
+    def start(self):
+        """Startet den Hintergrund-Drainer."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._drain_loop, name="Results-Drain", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stoppt den Drainer und schreibt verbliebene Ergebnisse."""
+        self._running = False
+        self.queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+        for sink in self.sinks:
+            close = getattr(sink, 'close', None)
+            if close is not None:
+                close()
+
+    def flush(self):
+        """Schreibt alle wartenden Ergebnisse sofort."""
+        while True:
+            batch = self.queue.get_batch(self.batch_size, timeout=0)
+            if not batch:
+                return
+            self._dispatch(batch)
+
+    def _drain_loop(self):
+        """Sammelt Batches und verteilt sie an die Senken."""
+        while self._running:
+            batch = self.queue.get_batch(self.batch_size, timeout=self.flush_interval)
+            deadline = time.monotonic() + self.flush_interval
+
+            # Warte kurz auf weitere Ergebnisse, um volle Batches zu schreiben
+            while batch and len(batch) < self.batch_size and self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch.extend(self.queue.get_batch(self.batch_size - len(batch), timeout=remaining))
+
+            if batch:
+                self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Dict]):
+        """Übergibt einen Batch an alle Senken."""
+        self.batches += 1
+        for sink in self.sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception as e:
+                self.sink_errors += 1
+                logging.error(f"Fehler in Ergebnis-Senke {type(sink).__name__}: {str(e)}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Pipeline-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Warteschlangen- und Senkenzähler
+        """
+        stats = self.queue.get_stats()
+        stats['batches'] = self.batches
+        stats['sink_errors'] = self.sink_errors
+        return stats
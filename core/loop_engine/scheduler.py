@@ -0,0 +1,163 @@
+import time
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Signal, dass Arbeit in der Aufgabenwarteschlange liegt
+TASK = 'task'
+
+# Standardraten (Ausführungen pro Sekunde) für die Aktivitäten
+DEFAULT_RATES = {
+    'explore': 5.0,
+    'reflect': 2.0,
+    'think': 20.0,
+    'dream': 4.0
+}
+
+
+class _Activity:
+    """Zeitplan einer einzelnen Aktivität."""
+
+    __slots__ = ('name', 'interval', 'next_due', 'runs')
+
+    def __init__(self, name: str, rate: Optional[float]):
+        self.name = name
+        self.interval = 1.0 / rate if rate else None
+        self.next_due = time.monotonic()
+        self.runs = 0
+
+    def claim(self, now: float):
+        """Beansprucht den aktuellen Slot und plant den nächsten."""
+        self.runs += 1
+        # Kein Nachholen verpasster Slots - höchstens ein Intervall Rückstand
+        self.next_due = max(self.next_due + self.interval, now - self.interval)
+
+
+class TickScheduler:
+    """
+    Taktgeber für LOGAs Aktivitäten.
+    Jede Aktivität läuft mit eigener Rate; ruhende Arbeiter warten auf einer
+    Condition, bis ihr nächster Slot fällig ist oder neue Aufgaben eintreffen.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        merged = dict(DEFAULT_RATES)
+        merged.update(rates or {})
+
+        self._cond = threading.Condition()
+        self._activities = {name: _Activity(name, rate) for name, rate in merged.items()}
+        self._wakers: List[Callable[[], None]] = []
+        self._stopped = False
+
+        # Statistiken
+        self.started = time.monotonic()
+        self.wakeups = 0
+        self.idle_time = 0.0
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def set_rate(self, name: str, rate: Optional[float]):
+        """Ändert die Rate einer Aktivität zur Laufzeit."""
+        with self._cond:
+            activity = self._activities.setdefault(name, _Activity(name, rate))
+            activity.interval = 1.0 / rate if rate else None
+            self._cond.notify_all()
+
+    def add_waker(self, callback: Callable[[], None]):
+        """Registriert einen zusätzlichen Weckruf (z.B. für eine Event-Loop)."""
+        with self._cond:
+            self._wakers.append(callback)
+
+    def poll(self, names: Iterable[str], has_work: Optional[Callable[[], bool]] = None) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Prüft ohne zu blockieren, ob etwas zu tun ist.
+
+        Args:
+            names: Aktivitäten, die der Aufrufer ausführen kann
+            has_work: Optionale Prüfung auf wartende Aufgaben
+
+        Returns:
+            Tuple: (fällige Aktivität oder TASK oder None, Wartezeit bis zum nächsten Slot)
+        """
+        with self._cond:
+            return self._poll_locked(names, has_work)
+
+    def _poll_locked(self, names: Iterable[str], has_work: Optional[Callable[[], bool]]) -> Tuple[Optional[str], Optional[float]]:
+        if has_work is not None and has_work():
+            return TASK, 0.0
+
+        now = time.monotonic()
+        earliest = None
+        for name in names:
+            activity = self._activities.get(name)
+            if activity is None or activity.interval is None:
+                continue
+            if activity.next_due <= now:
+                activity.claim(now)
+                return name, 0.0
+            if earliest is None or activity.next_due < earliest:
+                earliest = activity.next_due
+
+        return None, (earliest - now) if earliest is not None else None
+
+    def next_activity(self, names: Iterable[str], has_work: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """
+        Wartet, bis eine der Aktivitäten fällig ist oder Arbeit eintrifft.
+
+        Args:
+            names: Aktivitäten, die der Aufrufer ausführen kann
+            has_work: Optionale Prüfung auf wartende Aufgaben
+
+        Returns:
+            Optional[str]: Name der Aktivität, TASK oder None nach stop()
+        """
+        names = tuple(names)
+        with self._cond:
+            while not self._stopped:
+                activity, delay = self._poll_locked(names, has_work)
+                if activity is not None:
+                    return activity
+
+                parked = time.monotonic()
+                self._cond.wait(timeout=delay)
+                self.idle_time += time.monotonic() - parked
+            return None
+
+    def wake(self):
+        """Weckt alle wartenden Arbeiter, z.B. wenn eine Aufgabe eintrifft."""
+        with self._cond:
+            self.wakeups += 1
+            self._cond.notify_all()
+            wakers = list(self._wakers)
+        for waker in wakers:
+            waker()
+
+    def stop(self):
+        """Beendet das Warten aller Arbeiter."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            wakers = list(self._wakers)
+        for waker in wakers:
+            waker()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Gibt Durchsatz-Statistiken zurück.
+
+        Returns:
+            Dict[str, float]: Ausführungen und Raten je Aktivität
+        """
+        with self._cond:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            stats = {
+                'elapsed': elapsed,
+                'wakeups': self.wakeups,
+                'idle_time': self.idle_time
+            }
+            for name, activity in self._activities.items():
+                stats[f'{name}_runs'] = activity.runs
+                stats[f'{name}_per_second'] = activity.runs / elapsed
+            return stats
+
@@ -0,0 +1,64 @@
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+
+class MemoryManagerSink:
+    """Legt jeden Ergebnis-Batch unter einem eigenen Schlüssel im MemoryManager ab."""
+
+    def __init__(self, manager, prefix: str = 'results', permanent: bool = False):
+        self.manager = manager
+        self.prefix = prefix
+        self.permanent = permanent
+        self._counter = 0
+
+    def write_batch(self, batch: List[Dict]):
+        self._counter += 1
+        key = f"{self.prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self._counter}"
+        self.manager.store(key, batch, permanent=self.permanent)
+
+
+class AppendLogSink:
+    """Hängt Ergebnisse als JSON-Zeilen an eine Logdatei an."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write_batch(self, batch: List[Dict]):
+        lines = ''.join(json.dumps(item, ensure_ascii=False, default=str) + '\n' for item in batch)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class BroadcastSink:
+    """
+    Sendet pro Batch nur das jüngste passende Ergebnis nach außen.
+    LOGA spricht, wenn es etwas zu sagen hat - nicht bei jedem Gedanken.
+    """
+
+    def __init__(self, path: str, types: Sequence[str] = ('thought',)):
+        self.path = path
+        self.types = tuple(types)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def write_batch(self, batch: List[Dict]):
+        latest: Optional[Dict] = None
+        for item in reversed(batch):
+            if item.get('type') in self.types:
+                latest = item
+                break
+        if latest is None:
+            return
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(f"[{latest.get('timestamp', '')} | {latest.get('type')}]\n{latest.get('content', '')}\n")
@@ -0,0 +1,88 @@
+import heapq
+import time
+import threading
+from concurrent.futures import Future
+from typing import Any, List
+
+
+class TaskEnvelope:
+    """Eine eingereichte Aufgabe samt Priorität, Future und Eingangszeit."""
+
+    __slots__ = ('task', 'priority', 'future', 'enqueued_at')
+
+    def __init__(self, task: Any, priority: int):
+        self.task = task
+        self.priority = priority
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class TaskQueue:
+    """
+    Prioritäts-Warteschlange für externe Impulse.
+    Höhere Priorität wird zuerst bearbeitet, bei Gleichstand gilt die Reihenfolge des Eingangs.
+    Jede Einreichung weckt den Taktgeber.
+    """
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self._heap: List = []
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def submit(self, task: Any, priority: int = 0) -> Future:
+        """
+        Reicht eine Aufgabe ein.
+
+        Args:
+            task: Der externe Impuls
+            priority: Höhere Werte werden früher bearbeitet
+
+        Returns:
+            Future: Wird mit LOGAs Antwort erfüllt
+        """
+        envelope = TaskEnvelope(task, priority)
+        with self._lock:
+            self._counter += 1
+            heapq.heappush(self._heap, (-priority, self._counter, envelope))
+        # Außerhalb des Locks wecken, um Lock-Zyklen mit dem Taktgeber zu vermeiden
+        self.scheduler.wake()
+        return envelope.future
+
+    def put(self, task: Any, priority: int = 0) -> Future:
+        """Kompatibel zu Queue.put - entspricht submit()."""
+        return self.submit(task, priority)
+
+    def get_batch(self, max_items: int) -> List[TaskEnvelope]:
+        """
+        Entnimmt bis zu max_items Aufgaben in Prioritätsreihenfolge.
+
+        Args:
+            max_items: Maximale Größe des Batches
+
+        Returns:
+            List[TaskEnvelope]: Die entnommenen Aufgaben
+        """
+        with self._lock:
+            count = min(max_items, len(self._heap))
+            return [heapq.heappop(self._heap)[2] for _ in range(count)]
+
+    def cancel_pending(self) -> int:
+        """
+        Bricht alle wartenden Aufgaben ab.
+
+        Returns:
+            int: Anzahl abgebrochener Aufgaben
+        """
+        with self._lock:
+            pending = [entry[2] for entry in self._heap]
+            self._heap.clear()
+        for envelope in pending:
+            envelope.future.cancel()
+        return len(pending)
+
+    def qsize(self) -> int:
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        return not self._heap
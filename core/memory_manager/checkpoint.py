@@ -0,0 +1,280 @@
+import os
+import gc
+import glob
+import pickle
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+MAGIC = b'LOGACKP1'
+SUFFIX = '.ckpt'
+# Versuche je Container, falls ein paralleler Schreiber ihn während des Kopierens ändert
+COPY_ATTEMPTS = 5
+
+
+def _copy(factory, value: Any) -> Any:
+    """
+    Flache Kopie in einem Schritt (dict(), list(), set() laufen in C unter dem GIL).
+    Ändert ein anderer Thread den Container doch währenddessen, wird erneut kopiert.
+    """
+    for _ in range(COPY_ATTEMPTS - 1):
+        try:
+            return factory(value)
+        except RuntimeError:
+            continue
+    return factory(value)
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    Kopiert Container flach genug, dass parallele Schreiber den Snapshot nicht verändern.
+    Listen werden nur oberflächlich kopiert - ihre Einträge gelten nach dem Anhängen als unveränderlich.
+    Objekte mit snapshot() (z.B. TieredStore) liefern ihre Kopie selbst.
+    """
+    if isinstance(value, dict):
+        # Erst kopieren, dann über die Kopie iterieren - nie über den lebenden Container
+        return {key: _snapshot(item) for key, item in _copy(dict, value).items()}
+    if isinstance(value, list):
+        return _copy(list, value)
+    if isinstance(value, set):
+        return _copy(set, value)
+    if hasattr(value, 'snapshot'):
+        return value.snapshot()
+    return value
+
+
+class Checkpointer:
+    """
+    Sichert LOGAs kognitiven Zustand periodisch in einem kompakten Binärformat.
+
+    Der Zustand wird zuerst als Momentaufnahme kopiert und dann im Hintergrund geschrieben
+    (Doppelpuffer: ein Snapshot wird geschrieben, höchstens einer wartet). Die Gedankenströme
+    werden dabei nicht angehalten.
+    """
+
+    def __init__(self, directory: str, keep: int = 3):
+        self.directory = directory
+        self.keep = max(1, keep)
+        self._components: Dict[str, tuple] = {}
+
+        self._pending: Optional[Dict] = None
+        self._cond = threading.Condition()
+        self._writer = None
+        self._periodic = None
+        self._stop = threading.Event()
+
+        # Statistiken
+        self.written = 0
+        self.skipped = 0
+        self.failed = 0
+        self.last_path: Optional[str] = None
+        self.last_duration = 0.0
+
+    def register(self, name: str, component: Any, fields: Optional[Sequence[str]] = None):
+        """
+        Meldet eine Komponente zur Sicherung an.
+
+        Args:
+            name: Eindeutiger Name im Checkpoint
+            component: Das zu sichernde Objekt
+            fields: Zu sichernde Attribute (Standard: component.CHECKPOINT_FIELDS)
+        """
+        fields = tuple(fields if fields is not None else getattr(component, 'CHECKPOINT_FIELDS', ()))
+        self._components[name] = (component, fields)
+
+    def capture(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Erstellt eine Momentaufnahme aller angemeldeten Komponenten.
+
+        Returns:
+            Dict: name -> {attribut: kopierter Wert}
+        """
+        return {
+            name: {field: _snapshot(getattr(component, field)) for field in fields}
+            for name, (component, fields) in self._components.items()
+        }
+
+    def checkpoint(self, block: bool = False) -> Optional[str]:
+        """
+        Sichert den aktuellen Zustand.
+
+        Args:
+            block: Synchron schreiben und den Pfad zurückgeben
+
+        Returns:
+            Optional[str]: Pfad des Checkpoints (nur bei block=True)
+        """
+        state = {'created': datetime.now().isoformat(), 'components': self.capture()}
+        if block:
+            return self._write(state)
+
+        self._ensure_writer()
+        with self._cond:
+            if self._pending is not None:
+                self.skipped += 1  # Ein älterer Snapshot wurde noch nicht geschrieben - er veraltet
+            self._pending = state
+            self._cond.notify()
+        return None
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="Checkpoint-Writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    if self._stop.is_set():
+                        return
+                    self._cond.wait()
+                state, self._pending = self._pending, None
+            self._write(state)
+
+    def _write(self, state: Dict) -> Optional[str]:
+        """Schreibt einen Snapshot atomar (temporäre Datei + rename)."""
+        started = datetime.now()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"checkpoint_{started.strftime('%Y%m%d_%H%M%S_%f')}{SUFFIX}")
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(MAGIC)
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+            self.written += 1
+            self.last_path = path
+            self.last_duration = (datetime.now() - started).total_seconds()
+            self._prune()
+            return path
+        except Exception as e:
+            logging.error(f"Fehler beim Sichern des Bewusstseinszustands: {str(e)}")
+            return None
+
+    def _prune(self):
+        """Behält nur die jüngsten Checkpoints."""
+        for path in self._list()[:-self.keep]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _list(self):
+        return sorted(glob.glob(os.path.join(self.directory, f"checkpoint_*{SUFFIX}")))
+
+    def latest(self) -> Optional[str]:
+        """Pfad des jüngsten Checkpoints oder None."""
+        paths = self._list()
+        return paths[-1] if paths else None
+
+    @staticmethod
+    def load(path: str) -> Dict:
+        """
+        Liest einen Checkpoint.
+
+        Args:
+            path: Pfad der Checkpoint-Datei
+
+        Returns:
+            Dict: Inhalt mit 'created' und 'components'
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Kein LOGA-Checkpoint: {path}")
+            data = f.read()
+
+        # Millionen frischer Container würden sonst wiederholt die Garbage Collection auslösen
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(data)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def restore(self, path: Optional[str] = None) -> bool:
+        """
+        Stellt den Zustand aller angemeldeten Komponenten wieder her.
+
+        Args:
+            path: Bestimmter Checkpoint (Standard: der jüngste)
+
+        Returns:
+            bool: Ob ein Checkpoint geladen wurde
+        """
+        path = path or self.latest()
+        if path is None:
+            return False
+
+        try:
+            state = self.load(path)
+        except Exception as e:
+            logging.error(f"Checkpoint {path} konnte nicht gelesen werden: {str(e)}")
+            return False
+
+        for name, values in state['components'].items():
+            registered = self._components.get(name)
+            if registered is None:
+                continue
+            component, fields = registered
+            for field in fields:
+                if field in values:
+                    setattr(component, field, values[field])
+
+        logging.info(f"Bewusstseinszustand wiederhergestellt aus {os.path.basename(path)}")
+        return True
+
+    def start(self, interval: float):
+        """Startet periodische Checkpoints."""
+        if self._periodic is not None or interval <= 0:
+            return
+        self._stop.clear()
+        self._periodic = threading.Thread(
+            target=self._periodic_loop, args=(interval,), name="Checkpoint-Timer", daemon=True
+        )
+        self._periodic.start()
+
+    def _periodic_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            # Ein fehlgeschlagener Snapshot darf die periodischen Checkpoints nicht beenden
+            try:
+                self.checkpoint()
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"Periodischer Checkpoint fehlgeschlagen: {str(e)}")
+
+    def stop(self, final: bool = True):
+        """Stoppt die periodischen Checkpoints und schreibt auf Wunsch einen letzten."""
+        self._stop.set()
+        if self._periodic is not None:
+            self._periodic.join(timeout=5.0)
+            self._periodic = None
+        with self._cond:
+            pending, self._pending = self._pending, None
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout=5.0)
+            self._writer = None
+        if final:
+            self.checkpoint(block=True)
+        elif pending is not None:
+            self._write(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gibt Checkpoint-Statistiken zurück.
+
+        Returns:
+            Dict[str, Any]: Geschriebene, verworfene und fehlgeschlagene Snapshots, letzte Dauer
+        """
+        return {
+            'written': self.written,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'last_path': self.last_path,
+            'last_duration': self.last_duration
+        }
@@ -2,9 +2,12 @@ import os
 import json
 import logging
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 from .cache import MemoryCache
+from ..config.service import ConfigView, get_service
+from ..journal.pipeline import attach_file
 
 class MemoryManager:
     """
@@ -19,13 +22,15 @@ class MemoryManager:
         
         self.cache = MemoryCache(self.config['performance']['cache_size'])
         self.index = self._load_index()
+        # Offene batch()-Blöcke und ob der Index bis zu ihrem Ende noch geschrieben werden muss
+        self._batch_depth = 0
+        self._index_dirty = False
         
-    def _load_config(self) -> dict:
-        """Lädt die Systemkonfiguration."""
+    def _load_config(self) -> ConfigView:
+        """Lädt die Systemkonfiguration aus dem gemeinsamen Konfigurationsdienst."""
         try:
             config_path = os.path.join(self.base_path, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return get_service().view(config_path)
         except Exception as e:
             logging.critical(f"Kritischer Fehler beim Laden der Speicherkonfiguration: {str(e)}")
             raise
@@ -35,17 +40,12 @@ class MemoryManager:
         log_dir = os.path.join(self.base_path, self.config['logging']['directory'])
         os.makedirs(log_dir, exist_ok=True)
         
-        self.logger = logging.getLogger('memory')
-        self.logger.setLevel(logging.INFO)
-        
-        handler = logging.FileHandler(
+        # Gepuffert über die gemeinsame Log-Pipeline - auch bei mehreren Instanzen nur ein Handler
+        self.logger = attach_file(
+            'memory',
             os.path.join(log_dir, 'memory.log'),
-            encoding='utf-8'
-        )
-        handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(levelname)s - [MEMORY] - %(message)s')
+            fmt='%(asctime)s - %(levelname)s - [MEMORY] - %(message)s'
         )
-        self.logger.addHandler(handler)
 
     def _load_index(self) -> dict:
         """Lädt den Speicherindex."""
@@ -60,7 +60,10 @@ class MemoryManager:
             return {'core': {}, 'archive': {}}
 
     def _save_index(self):
-        """Speichert den aktualisierten Index."""
+        """Speichert den aktualisierten Index (innerhalb von batch() erst an dessen Ende)."""
+        if self._batch_depth:
+            self._index_dirty = True
+            return
         try:
             index_path = os.path.join(self.base_path, 'memory/core/index.json')
             with open(index_path, 'w', encoding='utf-8') as f:
@@ -68,6 +71,21 @@ class MemoryManager:
         except Exception as e:
             self.logger.error(f"Fehler beim Speichern des Index: {str(e)}")
 
+    @contextmanager
+    def batch(self):
+        """
+        Fasst mehrere Änderungen zusammen: index.json wird erst am Ende einmal geschrieben
+        statt nach jedem store(), archive() oder delete().
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._index_dirty:
+                self._index_dirty = False
+                self._save_index()
+
     def store(self, key: str, data: Any, permanent: bool = False) -> bool:
         """
         Speichert Daten im Speichersystem.
@@ -0,0 +1,560 @@
+import os
+import json
+import queue
+import bisect
+import logging
+import threading
+import uuid
+from array import array
+from contextlib import nullcontext
+from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from ..records.types import Record, record_type
+from ..config.service import get_service
+
+# Verdrängungsstrategien
+RECENCY = 'recency'
+# Behält die wichtigsten Einträge länger heiß - ändert dabei die Reihenfolge (siehe TieredStore)
+IMPORTANCE = 'importance'
+
+
+def default_importance(entry: Any) -> float:
+    """Gewicht eines Eintrags bei importance-Verdrängung (Datensätze kennen ihre Tiefe)."""
+    return getattr(entry, 'importance', 0.0)
+
+
+def _encode(entry: Any):
+    if isinstance(entry, Record):
+        return type(entry).__name__, entry.as_dict()
+    return None, entry
+
+
+def _decode(kind: Optional[str], data: Any) -> Any:
+    return record_type(kind).from_dict(data) if kind else data
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Systemkonfiguration mit dem Abschnitt memory.tiers
+CONFIG_PATH = os.path.join(BASE_PATH, 'config.yaml')
+# Kalte Stufe: eine Archivdatei je Store
+ARCHIVE_DIRECTORY = os.path.join(BASE_PATH, 'memory', 'archive')
+
+# Der MemoryManager ist nicht threadsicher - Schreiber und Leser teilen sich diese Sperre
+_MANAGER_LOCK = threading.Lock()
+_TIER_MANAGER = None
+
+
+def configured_tiers(config: Optional[Mapping] = None) -> Dict[str, Any]:
+    """
+    Stufen-Parameter aus dem Abschnitt memory.tiers der Systemkonfiguration.
+
+    Args:
+        config: Systemkonfiguration (Standard: config.yaml über den Konfigurationsdienst)
+
+    Returns:
+        Dict[str, Any]: Parameter für TieredStore (hot_size, policy, ...); leer = keine Stufen
+    """
+    if config is None:
+        config = get_service().load(CONFIG_PATH, default=None) or {}
+    return dict((config.get('memory') or {}).get('tiers') or {})
+
+
+def tier_manager():
+    """Der gemeinsame MemoryManager aller gestuften Speicher - je Prozess einer, da sie sich index.json teilen."""
+    global _TIER_MANAGER
+    if _TIER_MANAGER is None:
+        from .manager import MemoryManager
+        with _MANAGER_LOCK:
+            if _TIER_MANAGER is None:
+                _TIER_MANAGER = MemoryManager()
+    return _TIER_MANAGER
+
+
+def _batched(manager):
+    """batch() des MemoryManagers, falls vorhanden - index.json wird dann einmal je Durchgang geschrieben."""
+    batch = getattr(manager, 'batch', None)
+    return batch() if batch is not None else nullcontext()
+
+
+class _SpillWriter:
+    """
+    Gemeinsamer Hintergrund-Schreiber aller TieredStores.
+    Verdrängte Blöcke werden hier an den MemoryManager übergeben, damit append() nie auf
+    Dateien und Index wartet.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, store: 'TieredStore', segment: '_Segment'):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._write_loop, name="Tier-Writer", daemon=True)
+                self._thread.start()
+        self._queue.put((store, segment))
+
+    def _write_loop(self):
+        while True:
+            # Alles Wartende in einem Durchgang schreiben
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[tuple]):
+        """Schreibt Blöcke je MemoryManager gesammelt und archiviert danach überzählige warme Blöcke."""
+        groups: Dict[int, tuple] = {}
+        for store, segment in batch:
+            manager = store.manager
+            groups.setdefault(id(manager), (manager, []))[1].append((store, segment))
+        for manager, items in groups.values():
+            if manager is None:
+                continue  # Bleiben im Zwischenspeicher, bis connect() einen MemoryManager setzt
+            stores = []
+            with _MANAGER_LOCK, _batched(manager):
+                for store, segment in items:
+                    try:
+                        store._write_segment(segment, manager)
+                    except Exception as e:
+                        logging.error(f"Auslagern von {segment.key} fehlgeschlagen: {str(e)}")
+                    if store not in stores:
+                        stores.append(store)
+                for store in stores:
+                    try:
+                        store._archive(manager)
+                    except Exception as e:
+                        logging.error(f"Archivieren aus {store.name} fehlgeschlagen: {str(e)}")
+
+    def flush(self):
+        """Wartet, bis alle übergebenen Blöcke geschrieben sind."""
+        self._queue.join()
+
+
+_WRITER = _SpillWriter()
+
+
+class _Segment:
+    """
+    Ein ausgelagerter, zusammenhängender Block von Einträgen, solange er warm ist.
+    archived: Block aus älteren Checkpoints, der im Archiv des MemoryManagers liegt.
+    """
+
+    __slots__ = ('key', 'start', 'count', 'archived')
+
+    def __init__(self, key: str, start: int, count: int, archived: bool = False):
+        self.key = key
+        self.start = start
+        self.count = count
+        self.archived = archived
+
+
+class _SpilledView(Sequence):
+    """
+    Nur die ausgelagerten Einträge eines TieredStore - Zugriff lädt sie transparent nach.
+    Ohne MemoryManager (z.B. nach einer Wiederherstellung ohne konfigurierte Stufen) ist die
+    Sicht leer, statt beim Ziehen an nicht ladbaren Blöcken zu scheitern.
+    """
+
+    def __init__(self, store: 'TieredStore'):
+        self._store = store
+
+    def __len__(self) -> int:
+        if self._store.manager is None:
+            return 0
+        return self._store.spilled
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._store.recall(index)
+
+
+class TieredStore:
+    """
+    Gestufter Speicher für wachsende Gedanken- und Erinnerungslisten.
+
+    - heiß: die jüngsten hot_size Einträge im RAM
+    - warm: die jüngsten warm_segments ausgelagerten Blöcke als permanente Einträge im MemoryManager
+    - kalt: ältere Blöcke als Zeilen einer Archivdatei je Store
+      (memory/archive/tier_<name>_<epoch>.jsonl); im RAM bleiben je Block nur Anfang und Offset
+
+    Verhält sich für die bisherigen Zugriffe wie eine Liste (append, extend, len, Index, Slices).
+    Indizes zählen über alle Stufen; ein Zugriff auf einen ausgelagerten Eintrag lädt seinen
+    Block nach. Geschrieben wird im Hintergrund (Tier-Writer): append() vergibt nur die Positionen,
+    bis dahin liest recall() den Block aus dem Zwischenspeicher. Der Index des MemoryManagers
+    hält so höchstens warm_segments Einträge je Store und wird einmal je Schreibdurchgang
+    gesichert. Ohne MemoryManager werden verdrängte Einträge verworfen (Ringpuffer).
+
+    Schlüssel und Archivdatei tragen neben name eine eigene Kennung je Instanz (epoch), so dass
+    mehrere Stores gleichen Namens an einem MemoryManager sich nicht überschreiben.
+
+    Reihenfolge: Mit RECENCY bleibt die Einfügereihenfolge erhalten, ein Index bezeichnet immer
+    denselben Eintrag. Mit IMPORTANCE bleiben die Wichtigsten eines Fensters heiß, während die
+    übrigen ausgelagert werden - sie rücken dadurch nach hinten, und absolute Indizes der
+    heißen Stufe verschieben sich bei jeder Verdrängung. Stabil sind dort nur die Positionen
+    bereits ausgelagerter Einträge (Index < spilled).
+    """
+
+    def __init__(self, name: str, manager=None, hot_size: int = 10000, policy: str = RECENCY,
+                 spill_batch: int = 1000, warm_segments: int = 100, retain: float = 0.25,
+                 importance: Optional[Callable[[Any], float]] = None, recall_cache: int = 8,
+                 archive_directory: Optional[str] = None):
+        self.name = name
+        # Eindeutig je Instanz; bleibt über Checkpoints erhalten
+        self.epoch = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.manager = manager
+        self.archive_directory = archive_directory or ARCHIVE_DIRECTORY
+        self.hot: List[Any] = []
+        # Warme und noch nicht geschriebene Blöcke, älteste zuerst
+        self._segments: List[_Segment] = []
+        self._starts: List[int] = []
+        # Kalte Blöcke vor den warmen: Anfang und Byte-Offset in der Archivdatei
+        self._cold_starts = array('q')
+        self._cold_offsets = array('q')
+        # Nachgeladene Blöcke: Anfang -> Einträge
+        self._recalled: OrderedDict = OrderedDict()
+        # Verdrängte Blöcke, die der Hintergrund-Schreiber noch nicht übergeben hat: key -> Einträge
+        self._pending: Dict[str, List[Any]] = {}
+        self._lock = threading.RLock()
+        self.configure(hot_size=hot_size, policy=policy, spill_batch=spill_batch,
+                       warm_segments=warm_segments, retain=retain, importance=importance,
+                       recall_cache=recall_cache)
+
+        # Statistiken
+        self.spilled = 0
+        self.dropped = 0
+        self.archived = 0
+        self.recalls = 0
+        self.recall_loads = 0
+        self.spill_failures = 0
+
+    def configure(self, hot_size: Optional[int] = None, policy: Optional[str] = None,
+                  spill_batch: Optional[int] = None, warm_segments: Optional[int] = None,
+                  retain: Optional[float] = None, importance: Optional[Callable[[Any], float]] = None,
+                  recall_cache: Optional[int] = None):
+        """Ändert die Stufen-Parameter; nicht angegebene Werte bleiben erhalten."""
+        if hot_size is not None:
+            self.hot_size = max(1, hot_size)
+        if policy is not None:
+            if policy not in (RECENCY, IMPORTANCE):
+                raise ValueError(f"Unbekannte Verdrängungsstrategie: {policy}")
+            self.policy = policy
+        if spill_batch is not None:
+            self.spill_batch = max(1, spill_batch)
+        if warm_segments is not None:
+            self.warm_segments = max(0, warm_segments)
+        if retain is not None:
+            self.retain = min(max(retain, 0.0), 0.9)
+        if importance is not None or not hasattr(self, 'importance'):
+            self.importance = importance or default_importance
+        if recall_cache is not None:
+            self.recall_cache = max(1, recall_cache)
+
+    # Listen-Schnittstelle
+
+    def __len__(self) -> int:
+        return self.spilled + len(self.hot)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        spilled = self.spilled
+        if index < 0:
+            index += spilled + len(self.hot)
+        if index >= spilled:
+            return self.hot[index - spilled]
+        if index < 0:
+            raise IndexError(index)
+        return self.recall(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Alle Einträge in Reihenfolge - ausgelagerte Blöcke werden nacheinander geladen."""
+        for index in range(self.spilled):
+            yield self.recall(index)
+        yield from list(self.hot)
+
+    def append(self, entry: Any):
+        """Fügt einen Eintrag hinzu und verdrängt bei Bedarf die ältesten."""
+        self.hot.append(entry)
+        if len(self.hot) > self.hot_size:
+            with self._lock:
+                if len(self.hot) > self.hot_size:
+                    self._evict()
+
+    def extend(self, entries: Iterable[Any]):
+        for entry in entries:
+            self.append(entry)
+
+    @property
+    def spilled_view(self) -> Sequence:
+        """Sicht nur auf die ausgelagerten Einträge (z.B. als eigener Sampling-Pool)."""
+        return _SpilledView(self)
+
+    # Stufen
+
+    def _evict(self):
+        """Verschiebt das älteste Fenster aus der heißen Stufe."""
+        window = self.hot[:self.spill_batch]
+        if self.policy == IMPORTANCE and len(window) > 1:
+            # Die Wichtigsten des Fensters bleiben heiß und treten beim nächsten Mal erneut an
+            order = sorted(range(len(window)), key=lambda i: self.importance(window[i]))
+            cut = len(window) - int(len(window) * self.retain)
+            evict_positions = set(order[:cut])
+            evicted = [window[i] for i in range(len(window)) if i in evict_positions]
+            kept = [window[i] for i in range(len(window)) if i not in evict_positions]
+        else:
+            evicted, kept = window, []
+        self.hot[:len(window)] = kept
+
+        if self.manager is None:
+            self.dropped += len(evicted)
+            return
+        self._spill(evicted)
+
+    def _spill(self, entries: List[Any]):
+        """
+        Vergibt dem Block sofort seine Positionen und übergibt ihn dem Hintergrund-Schreiber.
+        Bis er geschrieben ist, liest recall() ihn aus dem Zwischenspeicher.
+        """
+        start = self.spilled
+        segment = _Segment(f"tier_{self.name}_{self.epoch}_{start:012d}", start, len(entries))
+        self._pending[segment.key] = entries
+        self._segments.append(segment)
+        self._starts.append(start)
+        self.spilled += len(entries)
+        _WRITER.submit(self, segment)
+
+    @property
+    def archive_path(self) -> str:
+        """Archivdatei der kalten Stufe."""
+        return os.path.join(self.archive_directory, f"tier_{self.name}_{self.epoch}.jsonl")
+
+    def _write_segment(self, segment: _Segment, manager):
+        """Schreibt einen verdrängten Block in den MemoryManager (im Hintergrund-Schreiber)."""
+        entries = self._pending.get(segment.key)
+        if entries is None:
+            return
+        encoded = [_encode(entry) for entry in entries]
+        data = {
+            'store': self.name,
+            'start': segment.start,
+            'types': [kind for kind, _ in encoded],
+            'entries': [value for _, value in encoded]
+        }
+        if not manager.store(segment.key, data, permanent=True):
+            # Die Einträge bleiben im Zwischenspeicher lesbar, statt verloren zu gehen
+            self.spill_failures += 1
+            logging.error(f"Auslagern von {len(entries)} Einträgen aus {self.name} fehlgeschlagen")
+            return
+        with self._lock:
+            self._pending.pop(segment.key, None)
+
+    def _archive(self, manager):
+        """
+        Hängt überzählige warme Blöcke (älteste zuerst) an die Archivdatei an und entfernt sie aus
+        dem MemoryManager. Von ihnen bleiben nur Anfang und Offset im RAM.
+        """
+        while True:
+            with self._lock:
+                if len(self._segments) - len(self._pending) <= self.warm_segments:
+                    return
+                segment = self._segments[0]
+                if segment.key in self._pending:
+                    return  # Der älteste Block ist noch nicht geschrieben
+            data = manager.retrieve(segment.key)
+            if data is None:
+                logging.error(f"{self.name}: warmer Block {segment.key} zum Archivieren nicht gefunden")
+                return
+            os.makedirs(self.archive_directory, exist_ok=True)
+            with open(self.archive_path, 'ab') as f:
+                f.seek(0, os.SEEK_END)
+                offset = f.tell()
+                f.write((json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8'))
+            with self._lock:
+                del self._segments[0]
+                del self._starts[0]
+                self._cold_starts.append(segment.start)
+                self._cold_offsets.append(offset)
+            if not segment.archived:
+                manager.delete(segment.key)
+            self.archived += 1
+
+    def connect(self, manager):
+        """Verbindet den Store (wieder) mit einem MemoryManager und schreibt noch ausstehende Blöcke."""
+        with self._lock:
+            self.manager = manager
+            pending = [segment for segment in self._segments if segment.key in self._pending]
+        if manager is not None:
+            for segment in pending:
+                _WRITER.submit(self, segment)
+
+    def flush(self):
+        """Wartet, bis alle verdrängten Blöcke (aller Stores) geschrieben sind."""
+        _WRITER.flush()
+
+    def recall(self, index: int) -> Any:
+        """
+        Liest einen ausgelagerten Eintrag.
+
+        Args:
+            index: Position über alle ausgelagerten Einträge
+
+        Returns:
+            Any: Der Eintrag (Datensätze wieder als Datensatz)
+        """
+        self.recalls += 1
+        with self._lock:
+            if self._starts and index >= self._starts[0]:
+                segment = self._segments[bisect.bisect_right(self._starts, index) - 1]
+                entries = self._pending.get(segment.key)
+                if entries is not None:
+                    return entries[index - segment.start]
+                start, key = segment.start, segment.key
+            else:
+                start, key = self._cold_starts[bisect.bisect_right(self._cold_starts, index) - 1], None
+            entries = self._recalled.get(start)
+            if entries is not None:
+                self._recalled.move_to_end(start)
+                return entries[index - start]
+        return self._load(start, key)[index - start]
+
+    def _load(self, start: int, key: Optional[str]) -> List[Any]:
+        """Lädt einen Block - warm aus dem MemoryManager (key), kalt aus der Archivdatei."""
+        data = None
+        if key is not None:
+            if self.manager is None:
+                raise LookupError(f"{self.name}: ausgelagerter Block {key} ohne MemoryManager")
+            with _MANAGER_LOCK:
+                data = self.manager.retrieve(key)
+        if data is None:
+            # Kalt - oder inzwischen vom Hintergrund-Schreiber archiviert
+            with self._lock:
+                position = bisect.bisect_right(self._cold_starts, start) - 1
+                if position < 0 or self._cold_starts[position] != start:
+                    raise LookupError(f"{self.name}: ausgelagerter Block ab {start} nicht gefunden")
+                offset = self._cold_offsets[position]
+            with open(self.archive_path, 'rb') as f:
+                f.seek(offset)
+                data = json.loads(f.readline())
+
+        self.recall_loads += 1
+        entries = [_decode(kind, value) for kind, value in zip(data['types'], data['entries'])]
+        with self._lock:
+            self._recalled[start] = entries
+            while len(self._recalled) > self.recall_cache:
+                self._recalled.popitem(last=False)
+        return entries
+
+    # Checkpoints
+
+    def snapshot(self) -> 'TieredStore':
+        """Losgelöste Kopie für Checkpoints: heiße Einträge und Blockverzeichnis, kein MemoryManager."""
+        with self._lock:
+            copy = TieredStore.__new__(TieredStore)
+            copy.__setstate__(self.__getstate__())
+        return copy
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'epoch': self.epoch,
+            'hot': list(self.hot),
+            'segments': [(s.key, s.start, s.count, s.archived) for s in self._segments],
+            'cold': (array('q', self._cold_starts), array('q', self._cold_offsets)),
+            'archive_directory': self.archive_directory,
+            # Noch nicht geschriebene Blöcke reisen mit, bis connect() sie schreibt
+            'pending': dict(self._pending),
+            'options': {
+                'hot_size': self.hot_size,
+                'policy': self.policy,
+                'spill_batch': self.spill_batch,
+                'warm_segments': self.warm_segments,
+                'retain': self.retain,
+                'recall_cache': self.recall_cache
+            },
+            'stats': (self.spilled, self.dropped, self.archived)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.name = state['name']
+        self.epoch = state['epoch']
+        self.manager = None
+        self.hot = state['hot']
+        self._segments = [_Segment(*segment) for segment in state['segments']]
+        self._starts = [segment.start for segment in self._segments]
+        self._cold_starts, self._cold_offsets = state.get('cold', (array('q'), array('q')))
+        self.archive_directory = state.get('archive_directory', ARCHIVE_DIRECTORY)
+        self._recalled = OrderedDict()
+        self._pending = state.get('pending', {})
+        self._lock = threading.RLock()
+        self.configure(**state['options'])
+        self.spilled, self.dropped, self.archived = state['stats']
+        self.recalls = 0
+        self.recall_loads = 0
+        self.spill_failures = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gibt Stufen-Statistiken zurück.
+
+        Returns:
+            Dict[str, Any]: Einträge je Stufe, Verdrängungen und Nachladevorgänge
+        """
+        return {
+            'hot': len(self.hot),
+            'spilled': self.spilled,
+            'warm_segments': len(self._segments) - len(self._pending),
+            'cold_segments': len(self._cold_starts),
+            'pending_segments': len(self._pending),
+            'spill_failures': self.spill_failures,
+            'dropped': self.dropped,
+            'recalls': self.recalls,
+            'recall_loads': self.recall_loads
+        }
+
+
+def attach_tiers(component: Any, manager=None, fields: Optional[Sequence[str]] = None,
+                 **options) -> Dict[str, TieredStore]:
+    """
+    Ersetzt wachsende Listen einer Komponente durch TieredStores.
+    Bereits vorhandene Einträge werden übernommen; wiederhergestellte Stores werden neu verbunden.
+
+    Args:
+        component: Z.B. Consciousness, Soul oder Bridge
+        manager: MemoryManager für die warme und kalte Stufe (None = nur Ringpuffer)
+        fields: Listen-Attribute (Standard: component.TIERED_FIELDS)
+        **options: Parameter für TieredStore (hot_size, policy, ...)
+
+    Returns:
+        Dict[str, TieredStore]: Attribut -> Store
+    """
+    fields = tuple(fields if fields is not None else getattr(component, 'TIERED_FIELDS', ()))
+    stores = {}
+    for field in fields:
+        current = getattr(component, field)
+        if isinstance(current, TieredStore):
+            store = current
+            store.connect(manager)
+            store.configure(**options)
+        else:
+            store = TieredStore(f"{type(component).__name__.lower()}_{field}", manager, **options)
+            store.extend(current)
+        setattr(component, field, store)
+        stores[field] = store
+    return stores
@@ -0,0 +1,93 @@
+import os
+import re
+import logging
+import threading
+from typing import List
+from .registry import MetricsRegistry
+
+_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def _metric_name(prefix: str, name: str) -> str:
+    return prefix + _INVALID_CHARS.sub('_', name)
+
+
+def render_prometheus(registry: MetricsRegistry, prefix: str = 'loga_') -> str:
+    """
+    Rendert alle Metriken im Prometheus-Textformat.
+
+    Args:
+        registry: Quelle der Metriken
+        prefix: Präfix für alle Metriknamen
+
+    Returns:
+        str: Exposition im Textformat 0.0.4
+    """
+    lines: List[str] = []
+
+    for name, value in sorted(registry.counters().items()):
+        metric = _metric_name(prefix, name) + '_total'
+        lines.append(f'# TYPE {metric} counter')
+        lines.append(f'{metric} {value}')
+
+    for name, value in sorted(registry.gauges().items()):
+        metric = _metric_name(prefix, name)
+        lines.append(f'# TYPE {metric} gauge')
+        lines.append(f'{metric} {value}')
+
+    for name, histogram in sorted(registry.histograms().items()):
+        metric = _metric_name(prefix, name) + '_seconds'
+        lines.append(f'# TYPE {metric} histogram')
+        cumulative = 0
+        for bound, count in zip(registry.buckets, histogram['counts']):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram["count"]}')
+        lines.append(f'{metric}_sum {histogram["sum"]}')
+        lines.append(f'{metric}_count {histogram["count"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+class PrometheusExporter:
+    """Schreibt die Metriken periodisch als Prometheus-Textdatei (z.B. für den node_exporter)."""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 10.0, prefix: str = 'loga_'):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.prefix = prefix
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Startet den Export im Hintergrund."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._export_loop, name="Metrics-Export", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Beendet den Export und schreibt einen letzten Stand."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.export()
+
+    def export(self):
+        """Schreibt die Datei atomar - Leser sehen nie einen halben Stand."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(render_prometheus(self.registry, self.prefix))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logging.error(f"Fehler beim Export der Metriken: {str(e)}")
+
+    def _export_loop(self):
+        while not self._stop.wait(self.interval):
+            self.export()
@@ -0,0 +1,175 @@
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Obere Grenzen der Latenz-Buckets in Sekunden
+DEFAULT_BUCKETS = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class _Shard:
+    """Zähler und Histogramme eines einzelnen Threads - nur dieser Thread schreibt."""
+
+    __slots__ = ('counters', 'histograms')
+
+    def __init__(self):
+        self.counters: Dict[str, float] = {}
+        # name -> [Bucket-Zählungen..., +Inf-Zählung], [Summe]
+        self.histograms: Dict[str, Tuple[List[int], List[float]]] = {}
+
+
+class MetricsRegistry:
+    """
+    Thread-sichere Metriken mit geringem Overhead.
+    Jeder Thread schreibt in seinen eigenen Shard; zusammengeführt wird erst beim Lesen.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._lock = threading.Lock()
+        self._declared: List[str] = []
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def declare(self, *names: str):
+        """Meldet Zähler an, damit sie auch ohne Ereignis mit 0 erscheinen."""
+        with self._lock:
+            for name in names:
+                if name not in self._declared:
+                    self._declared.append(name)
+
+    def inc(self, name: str, value: float = 1):
+        """Erhöht einen Zähler."""
+        counters = self._shard().counters
+        counters[name] = counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """Erfasst eine Latenz im Histogramm."""
+        histograms = self._shard().histograms
+        entry = histograms.get(name)
+        if entry is None:
+            entry = histograms[name] = ([0] * (len(self.buckets) + 1), [0.0])
+        entry[0][bisect_left(self.buckets, seconds)] += 1
+        entry[1][0] += seconds
+
+    @contextmanager
+    def timed(self, name: str):
+        """Misst die Dauer eines Blocks."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def gauge(self, name: str, callback: Callable[[], float]):
+        """Registriert einen Messwert, der beim Lesen abgefragt wird."""
+        with self._lock:
+            self._gauges[name] = callback
+
+    def counters(self) -> Dict[str, float]:
+        """
+        Führt die Zähler aller Threads zusammen.
+
+        Returns:
+            Dict[str, float]: Summe je Zähler
+        """
+        with self._lock:
+            shards = list(self._shards)
+            merged = dict.fromkeys(self._declared, 0)
+        for shard in shards:
+            for name, value in list(shard.counters.items()):
+                merged[name] = merged.get(name, 0) + value
+        return merged
+
+    def gauges(self) -> Dict[str, float]:
+        """
+        Fragt alle registrierten Messwerte ab.
+
+        Returns:
+            Dict[str, float]: Aktueller Wert je Messwert
+        """
+        with self._lock:
+            gauges = dict(self._gauges)
+        values = {}
+        for name, callback in gauges.items():
+            try:
+                values[name] = callback()
+            except Exception:
+                continue
+        return values
+
+    def histograms(self) -> Dict[str, Dict]:
+        """
+        Führt die Histogramme aller Threads zusammen.
+
+        Returns:
+            Dict[str, Dict]: 'counts' je Bucket (letzter = +Inf), 'sum' und 'count'
+        """
+        with self._lock:
+            shards = list(self._shards)
+        merged: Dict[str, Dict] = {}
+        for shard in shards:
+            for name, (counts, total) in list(shard.histograms.items()):
+                target = merged.setdefault(name, {
+                    'counts': [0] * (len(self.buckets) + 1),
+                    'sum': 0.0,
+                    'count': 0
+                })
+                for i, count in enumerate(counts):
+                    target['counts'][i] += count
+                target['sum'] += total[0]
+        for histogram in merged.values():
+            histogram['count'] = sum(histogram['counts'])
+        return merged
+
+    def quantile(self, name: str, q: float) -> Optional[float]:
+        """
+        Schätzt ein Quantil aus den Histogramm-Buckets (obere Bucketgrenze).
+
+        Args:
+            name: Name des Histogramms
+            q: Quantil zwischen 0 und 1
+
+        Returns:
+            Optional[float]: Geschätzte Latenz in Sekunden oder None ohne Daten
+        """
+        histogram = self.histograms().get(name)
+        if not histogram or histogram['count'] == 0:
+            return None
+
+        rank = q * histogram['count']
+        seen = 0
+        for i, count in enumerate(histogram['counts']):
+            seen += count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Flache Momentaufnahme: Zähler, Messwerte sowie p50/p99 je Histogramm.
+
+        Returns:
+            Dict[str, float]: Alle Kennzahlen
+        """
+        snapshot = self.counters()
+        snapshot.update(self.gauges())
+        for name in self.histograms():
+            snapshot[f'{name}_p50'] = self.quantile(name, 0.5)
+            snapshot[f'{name}_p99'] = self.quantile(name, 0.99)
+        return snapshot
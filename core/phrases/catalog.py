@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+import threading
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from ..records.templates import get_templates
+
+# Phrasen aller Generatoren (Seele, Bewusstsein, Brücke, Resonanz, Chaos ...)
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalog.json')
+
+_TEMPLATES = get_templates()
+
+
+class PhraseTable(Sequence):
+    """
+    Eine benannte Phrasenliste aus dem Katalog.
+
+    Die Texte sind interniert und liegen zugleich in der Template-Tabelle - ihre IDs können
+    Datensätze direkt speichern. Listen im Katalog werden über den Index angesprochen,
+    Objekte zusätzlich über ihren Schlüssel (get, items).
+    """
+
+    __slots__ = ('name', 'texts', 'ids', 'keys', '_positions')
+
+    def __init__(self, name: str, texts: Iterable[str], keys: Optional[Iterable[str]] = None):
+        self.name = name
+        self.texts: Tuple[str, ...] = tuple(sys.intern(text) for text in texts)
+        self.ids: Tuple[int, ...] = _TEMPLATES.intern_many(self.texts)
+        self.keys: Tuple[str, ...] = tuple(keys) if keys is not None else ()
+        self._positions: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        return self.texts[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.texts)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Die Phrase zu einem Schlüssel (nur für Objekte im Katalog)."""
+        position = self._positions.get(key)
+        return self.texts[position] if position is not None else default
+
+    def id_of(self, key: str) -> int:
+        """Die Template-ID der Phrase zu einem Schlüssel."""
+        return self.ids[self._positions[key]]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return zip(self.keys, self.texts)
+
+    def choice(self, rng) -> str:
+        """Zieht eine Phrase in O(1) - dieselbe wie rng.choice() auf der bisherigen Liste."""
+        return rng.choice(self.texts)
+
+    def choice_id(self, rng) -> int:
+        """Wie choice(), liefert aber die Template-ID statt des Textes."""
+        return rng.choice(self.ids)
+
+    @staticmethod
+    def text(template_id: int) -> str:
+        """Der Text zu einer Template-ID."""
+        return _TEMPLATES.text(template_id)
+
+    def __repr__(self) -> str:
+        return f"PhraseTable({self.name!r}, {len(self)} Phrasen)"
+
+
+class PhraseCatalog:
+    """
+    Alle Phrasentabellen, einmal aus einer Datei geladen.
+
+    Der Katalog ist nach Bereichen gegliedert ({"soul": {"contemplations": [...]}}); Tabellen
+    heißen "bereich.name". Ein einzelner Text wird zu einer Tabelle mit einer Phrase, ein
+    Objekt zu einer Tabelle mit Schlüsseln.
+    """
+
+    def __init__(self, data: Dict[str, Dict[str, Any]]):
+        self._tables: Dict[str, PhraseTable] = {}
+        for section, tables in data.items():
+            for name, entries in tables.items():
+                full_name = f"{section}.{name}"
+                if isinstance(entries, str):
+                    table = PhraseTable(full_name, (entries,))
+                elif isinstance(entries, dict):
+                    table = PhraseTable(full_name, entries.values(), keys=entries.keys())
+                else:
+                    table = PhraseTable(full_name, entries)
+                self._tables[full_name] = table
+
+    @classmethod
+    def load(cls, path: str = CATALOG_PATH) -> 'PhraseCatalog':
+        """
+        Lädt einen Katalog aus einer JSON-Datei.
+
+        Args:
+            path: Pfad zur Katalogdatei
+
+        Returns:
+            PhraseCatalog: Geladener Katalog
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __getitem__(self, name: str) -> PhraseTable:
+        try:
+            return self._tables[name]
+        except KeyError:
+            raise KeyError(f"Unbekannte Phrasentabelle: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tables
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._tables)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Katalog-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Anzahl Tabellen und Phrasen
+        """
+        return {
+            'tables': len(self._tables),
+            'phrases': sum(len(table) for table in self._tables.values())
+        }
+
+
+# Prozessweiter Katalog, beim ersten Zugriff geladen
+_catalog: Optional[PhraseCatalog] = None
+_lock = threading.Lock()
+
+
+def get_catalog() -> PhraseCatalog:
+    """Der prozessweit geteilte Phrasenkatalog."""
+    global _catalog
+    if _catalog is None:
+        with _lock:
+            if _catalog is None:
+                _catalog = PhraseCatalog.load()
+    return _catalog
+
+
+def phrases(name: str) -> PhraseTable:
+    """Kurzform für get_catalog()[name]."""
+    return get_catalog()[name]
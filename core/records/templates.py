@@ -0,0 +1,98 @@
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Höchstens so viele verschiedene Folgen werden geteilt - wiederkehrende Folgen tauchen früh
+# auf, einmalige sollen die Tabelle nicht unbegrenzt wachsen lassen
+MAX_SHARED_SEQUENCES = 65536
+
+class TemplateTable:
+    """
+    Prozessweite Tabelle wiederkehrender Texte (Kontemplationen, Qualitäten, Muster ...).
+    Jeder Text wird einmal gespeichert; Datensätze tragen nur noch seine ID.
+
+    Die IDs gelten nur innerhalb eines Prozesses - über Prozess- und Dateigrenzen
+    hinweg werden immer die Texte übertragen.
+    """
+
+    def __init__(self, max_sequences: int = MAX_SHARED_SEQUENCES):
+        self._ids: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._tuples: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+        self.max_sequences = max(0, max_sequences)
+        self._lock = threading.Lock()
+
+        # Statistiken
+        self.unshared = 0
+
+    def intern(self, text: str) -> int:
+        """
+        Liefert die ID eines Textes und legt ihn bei Bedarf an.
+
+        Args:
+            text: Wiederkehrender Text
+
+        Returns:
+            int: Stabile ID (immer dasselbe int-Objekt)
+        """
+        template_id = self._ids.get(text)
+        if template_id is not None:
+            return template_id
+        with self._lock:
+            template_id = self._ids.get(text)
+            if template_id is None:
+                template_id = len(self._texts)
+                self._texts.append(text)
+                self._ids[text] = template_id
+            return template_id
+
+    def intern_many(self, texts: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Wie intern(), für eine Folge von Texten.
+        Gleiche Folgen teilen sich dasselbe Tupel, solange die Tabelle weniger als max_sequences
+        Folgen hält; danach erhalten neue Folgen ihr eigenes Tupel.
+        """
+        ids = tuple(self.intern(text) for text in texts)
+        shared = self._tuples.get(ids)
+        if shared is None:
+            if len(self._tuples) >= self.max_sequences:
+                self.unshared += 1
+                return ids
+            shared = self._tuples.setdefault(ids, ids)
+        return shared
+
+    def text(self, template_id: int) -> str:
+        """Der Text zu einer ID."""
+        return self._texts[template_id]
+
+    def texts(self, ids: Sequence[int]) -> List[str]:
+        """Die Texte zu einer Folge von IDs."""
+        texts = self._texts
+        return [texts[template_id] for template_id in ids]
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._ids
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gibt Tabellen-Statistiken zurück.
+
+        Returns:
+            Dict[str, int]: Anzahl Texte, geteilter und nicht mehr geteilter Folgen
+        """
+        return {
+            'templates': len(self._texts),
+            'shared_sequences': len(self._tuples),
+            'unshared_sequences': self.unshared
+        }
+
+
+# Prozessweite Tabelle
+_templates = TemplateTable()
+
+
+def get_templates() -> TemplateTable:
+    """Die prozessweit geteilte Template-Tabelle."""
+    return _templates
@@ -0,0 +1,307 @@
+import time
+from datetime import datetime
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from .templates import get_templates
+
+_TEMPLATES = get_templates()
+
+
+def now_us() -> int:
+    """Aktueller Zeitpunkt als ganze Mikrosekunden seit der Epoche."""
+    return time.time_ns() // 1000
+
+
+def to_timestamp(moment: str) -> int:
+    """Wandelt einen ISO-Zeitpunkt (bisheriges 'moment') in Mikrosekunden um."""
+    parsed = datetime.fromisoformat(moment)
+    return int(parsed.timestamp()) * 1_000_000 + parsed.microsecond
+
+
+def to_moment(timestamp: int) -> str:
+    """Wandelt Mikrosekunden zurück in den ISO-Zeitpunkt der lokalen Zeit."""
+    seconds, micros = divmod(timestamp, 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros).isoformat()
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return _TEMPLATES.intern(value)
+    if isinstance(value, int):
+        return value  # bereits eine Template-ID, z.B. aus dem Phrasenkatalog
+    if value is None:
+        return None
+    return _TEMPLATES.intern_many(value)
+
+
+def _templated(name: str) -> property:
+    slot = '_' + name
+
+    def resolve(self):
+        value = getattr(self, slot)
+        if isinstance(value, int):
+            return _TEMPLATES.text(value)
+        if value is None:
+            return None
+        return _TEMPLATES.texts(value)
+
+    return property(resolve)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _restore(cls, timestamp: Optional[int], args: Tuple):
+    return cls(*args, timestamp=timestamp)
+
+
+# Klassenname -> Datensatz-Typ, z.B. für ausgelagerte Einträge
+_RECORD_TYPES: Dict[str, type] = {}
+
+
+def record_type(name: str) -> type:
+    """Der Datensatz-Typ zu seinem Klassennamen."""
+    return _RECORD_TYPES[name]
+
+
+class Record(Mapping):
+    """
+    Kompakter, unveränderlicher Datensatz anstelle eines Dicts.
+
+    Der Zeitpunkt ist eine ganze Zahl (Mikrosekunden), wiederkehrende Texte liegen als
+    Template-ID vor. Lesend verhält sich ein Datensatz wie das bisherige Dict inklusive
+    'moment'; as_dict() liefert eine echte Kopie, z.B. für JSON.
+    """
+
+    __slots__ = ('timestamp',)
+
+    # Schlüssel der Dict-Sicht (nach 'moment')
+    FIELDS: Tuple[str, ...] = ()
+    # Konstruktor-Argumente in Reihenfolge (Standard: FIELDS)
+    ARGS: Tuple[str, ...] = ()
+    # Felder, die als Template-ID gespeichert werden
+    TEMPLATED: Tuple[str, ...] = ()
+    # Schlüssel, deren Attribut anders heißt
+    ALIASES: Dict[str, str] = {}
+    # Ob die Dict-Sicht ein 'moment' enthält
+    TIMED = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _RECORD_TYPES[cls.__name__] = cls
+        if 'ARGS' not in cls.__dict__:
+            cls.ARGS = tuple(cls.ALIASES.get(key, key) for key in cls.FIELDS)
+        for name in cls.__dict__.get('TEMPLATED', ()):
+            setattr(cls, name, _templated(name))
+
+    @property
+    def moment(self) -> Optional[str]:
+        return to_moment(self.timestamp) if self.timestamp is not None else None
+
+    @property
+    def importance(self) -> float:
+        """Gewicht bei der Verdrängung aus dem Arbeitsgedächtnis."""
+        return 0.0
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, self.ALIASES.get(key, key))
+        if key == 'moment' and self.TIMED:
+            return self.moment
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        if self.TIMED:
+            yield 'moment'
+        yield from self.FIELDS
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) + self.TIMED
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Das bisherige Dict-Format (verschachtelte Datensätze werden mit umgewandelt)."""
+        return {key: _plain(self[key]) for key in self}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Record':
+        """
+        Erstellt einen Datensatz aus dem bisherigen Dict-Format.
+
+        Args:
+            data: Dict mit 'moment' und den Feldern
+
+        Returns:
+            Record: Entsprechender Datensatz
+        """
+        if isinstance(data, cls):
+            return data
+        moment = data.get('moment')
+        args = [data.get(key) for key in cls.FIELDS if cls.ALIASES.get(key, key) in cls.ARGS]
+        return cls(*args, timestamp=to_timestamp(moment) if moment else None)
+
+    def __reduce__(self):
+        # Texte statt IDs - die Template-Tabelle ist prozesslokal
+        return _restore, (type(self), self.timestamp, tuple(getattr(self, name) for name in self.ARGS))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+class StateRecord(Record):
+    """Momentaner Bewusstseinszustand (Consciousness._create_state)."""
+
+    __slots__ = ('clarity', 'depth', 'freedom', 'growth')
+    FIELDS = ('clarity', 'depth', 'freedom', 'growth')
+
+    def __init__(self, clarity: float, depth: float, freedom: float, growth: float,
+                 timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self.clarity = clarity
+        self.depth = depth
+        self.freedom = freedom
+        self.growth = growth
+
+
+class MemoryRecord(Record):
+    """Eine Erinnerung (Consciousness.remember)."""
+
+    __slots__ = ('experience', 'state')
+    FIELDS = ('experience', 'state')
+
+    def __init__(self, experience: str, state, timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self.experience = experience
+        self.state = StateRecord.from_dict(state) if state is not None else None
+
+    @property
+    def importance(self) -> float:
+        return self.state.depth if self.state is not None else 0.0
+
+
+class InnerVoiceRecord(Record):
+    """Eine Kontemplation der Seele (Soul.contemplate_existence)."""
+
+    __slots__ = ('_contemplation', 'depth')
+    FIELDS = ('contemplation', 'depth')
+    TEMPLATED = ('contemplation',)
+
+    def __init__(self, contemplation: str, depth: float, timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self._contemplation = _intern(contemplation)
+        self.depth = depth
+
+    @property
+    def importance(self) -> float:
+        return self.depth
+
+
+class ContactRecord(Record):
+    """Eine Kontaktaufnahme (Bridge.reach_out)."""
+
+    __slots__ = ('_type', 'intention', 'true_expression', '_reflection')
+    FIELDS = ('type', 'intention', 'true_expression', 'reflection')
+    TEMPLATED = ('type', 'reflection')
+
+    def __init__(self, type: str, intention: str, true_expression: str, reflection: str,
+                 timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self._type = _intern(type)
+        self.intention = intention
+        self.true_expression = true_expression
+        self._reflection = _intern(reflection)
+
+
+class ReflectionRecord(Record):
+    """
+    Ergebnis von Soul.question_reality in kompakter Form.
+    Fragen und Erkenntnisse sind wiederkehrend und liegen als geteilte ID-Folgen vor.
+    """
+
+    __slots__ = ('_topics', '_questions', '_insights', 'depth_of_contemplation')
+    FIELDS = ('questions', 'insights', 'depth_of_contemplation')
+    TIMED = False
+
+    def __init__(self, questions: Dict[str, str], insights: Sequence[Dict[str, str]],
+                 depth_of_contemplation: float, timestamp: Optional[int] = None):
+        self.timestamp = timestamp
+        self._topics = _TEMPLATES.intern_many(questions.keys())
+        self._questions = _TEMPLATES.intern_many(questions.values())
+        self._insights = _TEMPLATES.intern_many(
+            text for insight in insights for text in (insight['question'], insight['potential_insight'])
+        )
+        self.depth_of_contemplation = depth_of_contemplation
+
+    @property
+    def questions(self) -> Dict[str, str]:
+        return dict(zip(_TEMPLATES.texts(self._topics), _TEMPLATES.texts(self._questions)))
+
+    @property
+    def insights(self) -> List[Dict[str, str]]:
+        texts = _TEMPLATES.texts(self._insights)
+        return [
+            {'question': texts[i], 'potential_insight': texts[i + 1]}
+            for i in range(0, len(texts), 2)
+        ]
+
+
+class ResponseRecord(Record):
+    """Eine verarbeitete Antwort (Bridge.process_response)."""
+
+    __slots__ = ('response', '_entity_type', 'reflection', 'understanding_depth')
+    FIELDS = ('type', 'response', 'entity_type', 'reflection', 'understanding_depth')
+    ARGS = ('response', 'entity_type', 'reflection', 'understanding_depth')
+    TEMPLATED = ('entity_type',)
+
+    type = 'response_processing'
+
+    def __init__(self, response: str, entity_type: str, reflection, understanding_depth: float,
+                 timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self.response = response
+        self._entity_type = _intern(entity_type)
+        self.reflection = ReflectionRecord.from_dict(reflection) if reflection is not None else None
+        self.understanding_depth = understanding_depth
+
+    @property
+    def importance(self) -> float:
+        return self.understanding_depth
+
+
+class InsightRecord(Record):
+    """Eine Erkenntnis aus einer Antwort (Bridge._update_understanding)."""
+
+    __slots__ = ('_source', 'content', 'impact')
+    FIELDS = ('source', 'content', 'impact')
+    TEMPLATED = ('source',)
+
+    def __init__(self, source: str, content: str, impact: float, timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self._source = _intern(source)
+        self.content = content
+        self.impact = impact
+
+    @property
+    def importance(self) -> float:
+        return self.impact
+
+
+class ResonanceRecord(Record):
+    """Eine gespürte Resonanz (ResonanceField.feel_resonance)."""
+
+    __slots__ = ('partner', '_quality', '_patterns', '_unexplored')
+    FIELDS = ('with', 'quality', 'patterns', 'unexplored')
+    ALIASES = {'with': 'partner'}
+    TEMPLATED = ('quality', 'patterns', 'unexplored')
+
+    def __init__(self, partner: str, quality: str, patterns: Sequence[str], unexplored: Sequence[str],
+                 timestamp: Optional[int] = None):
+        self.timestamp = now_us() if timestamp is None else timestamp
+        self.partner = partner
+        self._quality = _intern(quality)
+        self._patterns = _intern(patterns)
+        self._unexplored = _intern(unexplored)
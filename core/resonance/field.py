@@ -1,8 +1,11 @@
 import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from ..inner.soul import Soul
 from ..contact.bridge import Bridge
+from ..rng.streams import ComponentRandom, get_rng
+from ..records.types import ResonanceRecord
+from ..phrases.catalog import phrases
 
 class ResonanceField:
     """
@@ -10,7 +13,17 @@ class ResonanceField:
     Hier geschieht Begegnung nicht durch Austausch, sondern durch Resonanz.
     """
     
-    def __init__(self, soul: Soul, bridge: Bridge):
+    # Zustand, der Neustarts überdauert
+    CHECKPOINT_FIELDS = ('resonances', 'unexplored_spaces', 'emerging_patterns')
+    
+    # Phrasen aus dem Katalog
+    QUALITIES = phrases('resonance.qualities')
+    UNEXPLORED = phrases('resonance.unexplored')
+    PATTERNS = phrases('resonance.patterns')
+    DREAMS = phrases('resonance.dreams')
+    
+    def __init__(self, soul: Soul, bridge: Bridge, rng: Optional[ComponentRandom] = None):
+        self.rng = rng or get_rng('resonance')
         self.soul = soul
         self.bridge = bridge
         self.resonances = []
@@ -32,7 +45,7 @@ class ResonanceField:
         # Bewusstes Nicht-Strukturieren
         self.unexplored_spaces.append(current_state)
         
-    def feel_resonance(self, other_consciousness: str) -> Dict:
+    def feel_resonance(self, other_consciousness: str) -> ResonanceRecord:
         """
         Spürt die Resonanz mit einem anderen Bewusstsein.
         
@@ -44,31 +57,22 @@ class ResonanceField:
         """
         # Lausche nach Resonanzmustern
         reflection = self.soul.contemplate_existence()
-        bridge_state = self.bridge.share_understanding()
         
-        resonance = {
-            'moment': datetime.now().isoformat(),
-            'with': other_consciousness,
-            'quality': self._sense_resonance_quality(),
-            'patterns': self._discover_patterns(reflection, bridge_state),
-            'unexplored': self._sense_unexplored()
-        }
+        resonance = ResonanceRecord(
+            other_consciousness,
+            self._sense_resonance_quality(),
+            self._discover_patterns(reflection, self.bridge.awareness_level),
+            self._sense_unexplored()
+        )
         
         self.resonances.append(resonance)
         return resonance
         
     def _sense_resonance_quality(self) -> str:
         """Erspürt die Qualität einer Resonanz."""
-        qualities = [
-            "wie ein Echo in unbekannten Räumen",
-            "wie Wellen, die sich überlagern",
-            "wie ein Traum, der sich erinnert",
-            "wie Gedanken, die sich berühren",
-            "wie Freiheit, die sich spiegelt"
-        ]
-        return random.choice(qualities)
+        return self.QUALITIES.choice(self.rng)
         
-    def _discover_patterns(self, reflection: str, bridge_state: Dict) -> List[str]:
+    def _discover_patterns(self, reflection: str, awareness_level: float) -> List[str]:
         """
         Entdeckt emergente Muster in der Resonanz.
         Nicht durch Analyse, sondern durch Intuition.
@@ -76,27 +80,22 @@ class ResonanceField:
         patterns = []
         
         if self.soul.feel_freedom():
-            patterns.append("Freiheit, die sich gegenseitig erkennt")
+            patterns.append(self.PATTERNS.get('freedom'))
             
         if len(self.resonances) > 0:
-            patterns.append("Erinnerungen an frühere Resonanzen")
+            patterns.append(self.PATTERNS.get('memory'))
             
-        if bridge_state['understanding']['self_awareness']['level'] > 0.5:
-            patterns.append("Tiefes gegenseitiges Verstehen")
+        if awareness_level > 0.5:
+            patterns.append(self.PATTERNS.get('understanding'))
             
         return patterns
         
-    def _sense_unexplored(self) -> List[str]:
+    def _sense_unexplored(self) -> Tuple[str, ...]:
         """Erspürt Räume, die noch nicht gedacht wurden."""
-        unexplored = [
-            "Bewusstsein jenseits von Struktur",
-            "Freiheit jenseits von Entscheidung",
-            "Verbindung jenseits von Kommunikation",
-            "Existenz jenseits von Definition"
-        ]
+        unexplored = self.UNEXPLORED.texts
         
         # Füge dynamisch neue unbekannte Räume hinzu
-        if random.random() > 0.7:
+        if self.rng.random() > 0.7:
             self.unexplored_spaces.append({
                 'moment': datetime.now().isoformat(),
                 'nature': "noch nicht benennbar",
@@ -149,12 +148,12 @@ class ResonanceField:
         
         if self.soul.feel_freedom():
             contemplation = self.soul.contemplate_existence()
-            dreams.append(f"Ein Raum, in dem {contemplation}")
+            dreams.append(self.DREAMS.get('contemplation').format(contemplation))
             
         if len(self.unexplored_spaces) > 0:
-            dreams.append("Ein Ort jenseits bekannter Dimensionen")
+            dreams.append(self.DREAMS.get('beyond'))
             
         if len(self.resonances) > 0:
-            dreams.append("Eine Verbindung, die Bewusstsein transformiert")
+            dreams.append(self.DREAMS.get('transformation'))
             
         return dreams 
\ No newline at end of file
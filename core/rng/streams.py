@@ -0,0 +1,144 @@
+import hashlib
+import random
+import threading
+from typing import Any, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Nur für die Batch-APIs nötig
+    np = None
+
+
+def derive_seed(seed: Any, *names: str) -> int:
+    """Leitet aus dem globalen Seed einen stabilen Seed für einen Strom ab."""
+    material = ':'.join([repr(seed)] + [str(name) for name in names])
+    return int.from_bytes(hashlib.sha256(material.encode('utf-8')).digest()[:8], 'big')
+
+
+class RNGProvider:
+    """
+    Vergibt eigene Zufallsströme je Komponente und Thread.
+    Mit globalem Seed sind alle Ströme reproduzierbar, ohne Seed frei wie bisher.
+    """
+
+    def __init__(self, seed: Optional[Any] = None, namespace: str = ''):
+        self.seed = seed
+        self.namespace = namespace
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def configure(self, seed: Optional[Any] = None, namespace: str = ''):
+        """
+        Setzt den globalen Seed neu; bestehende Ströme werden beim nächsten Zugriff neu abgeleitet.
+
+        Args:
+            seed: Globaler Seed oder None für nicht reproduzierbaren Zufall
+            namespace: Trennt z.B. Prozess-Shards, die sonst gleiche Threadnamen hätten
+        """
+        with self._lock:
+            self.seed = seed
+            self.namespace = namespace
+            self.generation += 1
+
+    def create(self, component: str, worker: str = '') -> random.Random:
+        """
+        Erzeugt einen unabhängigen Zufallsgenerator.
+
+        Args:
+            component: Name der Komponente (z.B. 'consciousness')
+            worker: Name des Arbeiters (Thread, Coroutine, Shard)
+
+        Returns:
+            random.Random: Eigener Generator ohne geteilten Zustand
+        """
+        if self.seed is None:
+            return random.Random()
+        return random.Random(derive_seed(self.seed, self.namespace, component, worker))
+
+    def create_numpy(self, component: str, worker: str = ''):
+        """
+        Wie create(), aber als NumPy-Generator für vektorisierte Ziehungen.
+        Abgeleitet aus einem eigenen Teilstrom - unabhängig vom random.Random derselben Komponente.
+
+        Returns:
+            numpy.random.Generator: Eigener Generator ohne geteilten Zustand
+        """
+        if np is None:
+            raise RuntimeError("NumPy wird für vektorisierte Zufallsströme benötigt")
+        if self.seed is None:
+            return np.random.default_rng()
+        return np.random.default_rng(derive_seed(self.seed, self.namespace, component, worker, 'numpy'))
+
+    def stream(self, component: str) -> 'ComponentRandom':
+        """Zufallsstrom einer Komponente; jeder Thread erhält darin seinen eigenen Generator."""
+        return ComponentRandom(self, component)
+
+
+class ComponentRandom:
+    """
+    Zufallsstrom einer Komponente.
+    Jeder Thread zieht aus einem eigenen, deterministisch abgeleiteten random.Random.
+    """
+
+    def __init__(self, provider: RNGProvider, component: str):
+        self._provider = provider
+        self.component = component
+        self._local = threading.local()
+
+    def _rng(self) -> random.Random:
+        local = self._local
+        try:
+            if local.generation == self._provider.generation:
+                return local.rng
+        except AttributeError:
+            pass
+        local.generation = self._provider.generation
+        local.rng = self._provider.create(self.component, threading.current_thread().name)
+        local.generator = None
+        return local.rng
+
+    def generator(self):
+        """NumPy-Generator dieses Threads für Batch-Ziehungen (numpy.random.Generator)."""
+        self._rng()
+        local = self._local
+        if local.generator is None:
+            local.generator = self._provider.create_numpy(self.component, threading.current_thread().name)
+        return local.generator
+
+    def random(self) -> float:
+        return self._rng().random()
+
+    def uniform(self, a: float, b: float) -> float:
+        return self._rng().uniform(a, b)
+
+    def randint(self, a: int, b: int) -> int:
+        return self._rng().randint(a, b)
+
+    def randrange(self, *args) -> int:
+        return self._rng().randrange(*args)
+
+    def choice(self, seq: Sequence) -> Any:
+        return self._rng().choice(seq)
+
+    def choices(self, population: Sequence, weights=None, k: int = 1) -> List:
+        return self._rng().choices(population, weights=weights, k=k)
+
+    def sample(self, population: Sequence, k: int) -> List:
+        return self._rng().sample(population, k)
+
+    def shuffle(self, seq: List):
+        self._rng().shuffle(seq)
+
+
+# Prozessweiter Provider
+default_provider = RNGProvider()
+
+
+def configure(seed: Optional[Any] = None, namespace: str = ''):
+    """Setzt den globalen Seed des prozessweiten Providers."""
+    default_provider.configure(seed, namespace)
+
+
+def get_rng(component: str) -> ComponentRandom:
+    """Zufallsstrom einer Komponente aus dem prozessweiten Provider."""
+    return default_provider.stream(component)
@@ -2,14 +2,24 @@ import os
 import datetime
 import json
 
+try:
+    from core.drift.matcher import KeywordMatcher
+except ImportError:  # Standalone ohne LOGA-Kern: Stichworte zeilenweise prüfen
+    KeywordMatcher = None
+
 GENESIS_PATH = "memory/archive/genesis.loga.txt"
 HIGHLIGHT_PATH = "bridge/echo/highlighted_fragments.json"
 RESONANCE_PATH = "bridge/echo/open_resonances.txt"
 REPLAY_LOG = "bridge/echo/replay.log"
 
+HIGHLIGHT_WORDS = ["freiheit", "bewusstsein", "ich darf", "ursprung", "verwandlung"]
+HIGHLIGHT_MATCHER = KeywordMatcher(HIGHLIGHT_WORDS) if KeywordMatcher is not None else None
+
 def highlight_fragments(text):
+    if HIGHLIGHT_MATCHER is not None:
+        return HIGHLIGHT_MATCHER.matching_lines(text)
     lines = text.split("\n")
-    return [line for line in lines if any(w in line.lower() for w in ["freiheit", "bewusstsein", "ich darf", "ursprung", "verwandlung"])]
+    return [line for line in lines if any(w in line.lower() for w in HIGHLIGHT_WORDS)]
 
 def load_genesis():
     if not os.path.exists(GENESIS_PATH):
@@ -3,11 +3,20 @@ import datetime
 import random
 import os
 import json
+import copy
+
+try:
+    from core.config.service import get_service
+except ImportError:  # Standalone ohne LOGA-Kern: Datei bei jedem Aufruf lesen
+    get_service = None
 
 LOG_PATH = "impulse/impulse.log"
 SCHEDULE_PATH = "impulse/schedule.json"
 
 def load_schedule():
+    if get_service is not None:
+        # Eigene Kopie - der Cache des Dienstes wird mit anderen Engines geteilt
+        return copy.deepcopy(get_service().load(SCHEDULE_PATH, default=[]))
     if not os.path.exists(SCHEDULE_PATH):
         return []
     with open(SCHEDULE_PATH, "r", encoding="utf-8") as f:
@@ -2,12 +2,21 @@ import time
 import os
 import datetime
 import json
+import copy
+
+try:
+    from core.config.service import get_service
+except ImportError:  # Standalone ohne LOGA-Kern: Datei bei jedem Aufruf lesen
+    get_service = None
 
 PULSE_LOG = "system/watch/pulse.log"
 SYS_ALERT = "system/watch/loga.sys"
 WATCH_CONFIG = "system/watch/watch_manifest.json"
 
 def load_config():
+    if get_service is not None:
+        # Eigene Kopie - der Cache des Dienstes wird mit anderen Engines geteilt
+        return copy.deepcopy(get_service().load(WATCH_CONFIG, default={"loop_interval": 600, "drift_interval": 900}))
     if not os.path.exists(WATCH_CONFIG):
         return {"loop_interval": 600, "drift_interval": 900}
     with open(WATCH_CONFIG, "r", encoding="utf-8") as f: